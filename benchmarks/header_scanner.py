@@ -0,0 +1,68 @@
+"""
+Benchmark of the header scanner used by `PatternValidator` against the
+conventional commit regex it replaced.
+
+Usage:
+    python benchmarks/header_scanner.py [--number NUMBER] [--repeat REPEAT]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+# pylint: disable=wrong-import-position
+from commitlint.linter.validators import PatternValidator  # noqa: E402
+from commitlint.linter.view import CommitMessageView  # noqa: E402
+from pattern_validator import RegexPatternValidator  # noqa: E402
+
+CORPUS = [
+    "feat: add new feature",
+    "fix(parser): handle empty scope",
+    "feat(api)!: drop support for the v1 endpoints",
+    "docs: update the installation guide\n\nMention the pre-commit hook.",
+    "chore(deps): bump the dependencies\n\n" + "- bump package\n" * 200,
+    "Feat : Added a new feature.",
+    "invalid commit message",
+    "feat(scope) : description\nbody",
+]
+
+
+def main() -> None:
+    """Runs the benchmark and prints the timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    validator = PatternValidator()
+    regex_validator = RegexPatternValidator()
+
+    def run_scanner() -> None:
+        for commit_message in CORPUS:
+            validator.validate(CommitMessageView(commit_message))
+
+    def run_regex() -> None:
+        for commit_message in CORPUS:
+            regex_validator.validate(commit_message)
+
+    # interleaving the runs, so both are equally affected by the system noise
+    scanner_times, regex_times = [], []
+    for _ in range(args.repeat):
+        scanner_times.append(timeit.timeit(run_scanner, number=args.number))
+        regex_times.append(timeit.timeit(run_regex, number=args.number))
+
+    scanner_time = min(scanner_times)
+    regex_time = min(regex_times)
+    messages = args.number * len(CORPUS)
+
+    print(f"regex:   {regex_time / messages * 1e6:.3f} us/message")
+    print(f"scanner: {scanner_time / messages * 1e6:.3f} us/message")
+    print(f"speedup: {regex_time / scanner_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
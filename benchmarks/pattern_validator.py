@@ -0,0 +1,132 @@
+# type: ignore
+# pylint: disable=all
+"""
+Reference implementation of the detailed pattern validation, based on the
+conventional commit regex previously used by `PatternValidator`.
+
+Used by the benchmark of the header scanner. The differential tests keep their
+own copy in `tests/test_linter/_regex_reference.py`, so neither depends on the
+layout of the other.
+"""
+
+import re
+
+from commitlint.constants import COMMIT_TYPES
+from commitlint.messages import (
+    COMMIT_TYPE_INVALID_ERROR,
+    COMMIT_TYPE_MISSING_ERROR,
+    DESCRIPTION_FULL_STOP_END_ERROR,
+    DESCRIPTION_LINE_BREAK_ERROR,
+    DESCRIPTION_MISSING_ERROR,
+    DESCRIPTION_MULTIPLE_SPACE_START_ERROR,
+    DESCRIPTION_NO_LEADING_SPACE_ERROR,
+    INCORRECT_FORMAT_ERROR,
+    SCOPE_EMPTY_ERROR,
+    SCOPE_WHITESPACE_ERROR,
+    SPACE_AFTER_COMMIT_TYPE_ERROR,
+    SPACE_AFTER_SCOPE_ERROR,
+)
+
+COMMIT_RE = re.compile(
+    r"(?s)"  # To explicitly make . match new line
+    r"(?P<type>\w+\s*)?"
+    r"(?:\((?P<scope>[^\)]*)\)(?P<space_after_scope>\s*))?"
+    r"!?(?P<colon>:\s?)?"
+    r"(?:(?P<description>[^\n\r]+))?"
+    r"(?P<body_separation>\n?\n?)"
+    r"(((?P<body>.*))|(\s*))?$"
+)
+
+
+class RegexPatternValidator:
+    """The regex based `PatternValidator`, replaced by the header scanner."""
+
+    def validate(self, commit_message):
+        re_match = COMMIT_RE.match(commit_message)
+        if re_match is None or re_match.group("colon") is None:
+            return [INCORRECT_FORMAT_ERROR]
+
+        errors = []
+        for validator in (
+            self.validate_commit_type,
+            self.validate_commit_type_no_space_after,
+            self.validate_scope,
+            self.validate_scope_no_space_after,
+            self.validate_description,
+            self.validate_description_no_multiple_whitespace,
+            self.validate_description_no_line_break,
+            self.validate_description_no_full_stop_at_end,
+        ):
+            error = validator(re_match)
+            if error:
+                errors.append(error)
+
+        return errors
+
+    def validate_commit_type(self, re_match):
+        commit_type = re_match.group("type")
+        if commit_type is None:
+            return COMMIT_TYPE_MISSING_ERROR
+
+        commit_type = commit_type.strip()
+        if commit_type not in COMMIT_TYPES:
+            return COMMIT_TYPE_INVALID_ERROR % commit_type
+
+        return None
+
+    def validate_commit_type_no_space_after(self, re_match):
+        commit_type = re_match.group("type")
+
+        if commit_type and commit_type.endswith(" "):
+            return SPACE_AFTER_COMMIT_TYPE_ERROR
+
+        return None
+
+    def validate_scope(self, re_match):
+        scope = re_match.group("scope")
+        if scope is not None:
+            if scope == "":
+                return SCOPE_EMPTY_ERROR
+
+            if " " in scope:
+                return SCOPE_WHITESPACE_ERROR
+
+        return None
+
+    def validate_scope_no_space_after(self, re_match):
+        space_after_scope = re_match.group("space_after_scope")
+        if space_after_scope and " " in space_after_scope:
+            return SPACE_AFTER_SCOPE_ERROR
+
+        return None
+
+    def validate_description(self, re_match):
+        if not re_match.group("description"):
+            return DESCRIPTION_MISSING_ERROR
+
+        if not re_match.group("colon").endswith(" "):
+            return DESCRIPTION_NO_LEADING_SPACE_ERROR
+
+        return None
+
+    def validate_description_no_multiple_whitespace(self, re_match):
+        if re_match.group("description") and re_match.group("description").startswith(
+            " "
+        ):
+            return DESCRIPTION_MULTIPLE_SPACE_START_ERROR
+
+        return None
+
+    def validate_description_no_line_break(self, re_match):
+        if re_match.group("body_separation") == "\n" and re_match.group("body"):
+            return DESCRIPTION_LINE_BREAK_ERROR
+
+        return None
+
+    def validate_description_no_full_stop_at_end(self, re_match):
+        if re_match.group("description") and re_match.group(
+            "description"
+        ).strip().endswith("."):
+            return DESCRIPTION_FULL_STOP_END_ERROR
+
+        return None
@@ -0,0 +1,182 @@
+"""
+Start-up time budget of the `commitlint` entry point.
+
+Every commit of every developer checkout runs `commitlint --file` from the
+commit-msg hook, so its start-up time is measured on its own: the cumulative
+import time of `commitlint.cli` reported by `python -X importtime`, and the wall
+time of a whole `commitlint --file` run. The check fails if the import time
+exceeds the budget, or if the `--file` mode imports a module it doesn't need.
+
+Usage:
+    python benchmarks/startup.py [--budget-ms BUDGET_MS] [--runs RUNS]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT_DIR, "src")
+
+# budget of the cumulative import time of `commitlint.cli`, in milliseconds
+DEFAULT_BUDGET_MS = 75.0
+DEFAULT_RUNS = 11
+
+# modules only needed by the other modes, e.g. git ranges or the daemon
+FILE_MODE_EXCLUDED_MODULES = (
+    "subprocess",
+    "concurrent.futures",
+    "multiprocessing",
+    "socket",
+    "hashlib",
+    "tempfile",
+    "json",
+)
+
+FILE_MODE_SCRIPT = """
+import sys
+from commitlint.cli import main
+try:
+    main(["--file", sys.argv[1]])
+except SystemExit:
+    pass
+print("loaded:" + ",".join(name for name in sys.argv[2:] if name in sys.modules))
+"""
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (SRC_DIR, env.get("PYTHONPATH")) if path
+    )
+    return env
+
+
+def measure_import_time(module: str = "commitlint.cli") -> Tuple[float, List[str]]:
+    """
+    Measures the cumulative import time of a module with `python -X importtime`.
+
+    Args:
+        module (str, optional): The module to import (default is
+            "commitlint.cli").
+
+    Returns:
+        Tuple[float, List[str]]: The cumulative import time in milliseconds, and
+            the five costliest imports as reported by `-X importtime`.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    cumulative_ms = 0.0
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        try:
+            _, cumulative, name = line[len("import time:") :].split("|")
+            cumulative_us = int(cumulative)
+        except ValueError:
+            # the header line
+            continue
+
+        imports.append((cumulative_us, name.rstrip()))
+        if name.strip() == module:
+            cumulative_ms = cumulative_us / 1e3
+
+    costliest = [
+        f"{cumulative_us / 1e3:8.3f} ms {name}"
+        for cumulative_us, name in sorted(imports, reverse=True)[:5]
+    ]
+    return cumulative_ms, costliest
+
+
+def measure_file_run(commit_file: str) -> Tuple[float, List[str]]:
+    """
+    Measures the wall time of a `commitlint --file` run in a new interpreter.
+
+    Args:
+        commit_file (str): The commit message file to lint.
+
+    Returns:
+        Tuple[float, List[str]]: The wall time in milliseconds, and the loaded
+            modules of `FILE_MODE_EXCLUDED_MODULES`.
+    """
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", FILE_MODE_SCRIPT, commit_file]
+        + list(FILE_MODE_EXCLUDED_MODULES),
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    seconds = time.perf_counter() - start
+
+    loaded = output.rsplit("loaded:", 1)[-1].strip()
+    return seconds * 1e3, [name for name in loaded.split(",") if name]
+
+
+def main() -> None:
+    """Measures the start-up time and checks it against the budget."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="Budget of the import time of commitlint.cli (default: %(default)s).",
+    )
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    import_times = []
+    costliest: List[str] = []
+    for _ in range(args.runs):
+        import_ms, costliest = measure_import_time()
+        import_times.append(import_ms)
+
+    with tempfile.NamedTemporaryFile(
+        "w", suffix="COMMIT_EDITMSG", delete=False, encoding="utf-8"
+    ) as commit_file:
+        commit_file.write("feat: add new feature\n# Please enter the message\n")
+
+    try:
+        run_times = []
+        loaded: List[str] = []
+        for _ in range(args.runs):
+            run_ms, loaded = measure_file_run(commit_file.name)
+            run_times.append(run_ms)
+    finally:
+        os.remove(commit_file.name)
+
+    import_ms = statistics.median(import_times)
+    print(f"import commitlint.cli: {import_ms:.3f} ms (budget {args.budget_ms} ms)")
+    for line in costliest:
+        print(f"  {line}")
+    print(f"commitlint --file: {statistics.median(run_times):.3f} ms wall time")
+
+    failed = False
+    if import_ms > args.budget_ms:
+        print("FAILED: the import time exceeds the budget")
+        failed = True
+
+    if loaded:
+        print(f"FAILED: --file imports {', '.join(loaded)}")
+        failed = True
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,500 @@
+"""
+Benchmark suite for the linting and git hot paths of commitlint.
+
+Every benchmark runs on a fixed synthetic corpus, so the results of two runs on
+the same machine are comparable. The results can be written as JSON and compared
+against a stored baseline, failing if any benchmark is slower than the baseline
+by more than the threshold.
+
+Usage:
+    python benchmarks/suite.py [--output FILE] [--baseline FILE]
+        [--threshold THRESHOLD] [--repeat REPEAT] [--git-sizes SIZES]
+        [--repo-dir DIR] [--filter NAME]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+# pylint: disable=wrong-import-position
+from commitlint.__version__ import __version__  # noqa: E402
+from commitlint.constants import COMMIT_TYPES  # noqa: E402
+from commitlint.cli import _get_commit_message_from_file  # noqa: E402
+from commitlint import git_objects  # noqa: E402
+from commitlint.git_helpers import (  # noqa: E402
+    get_commit_message_of_hash,
+    get_commit_messages_of_hash_range,
+    get_commit_messages_of_hashes,
+)
+from commitlint.linter import (  # noqa: E402
+    lint_commit_message,
+    lint_commit_message_result,
+)
+from commitlint.linter.utils import (  # noqa: E402
+    VERBOSE_COMMIT_SEPARATOR,
+    is_ignored,
+    remove_comments,
+)
+
+SEED = 20240101
+CORPUS_SIZE = 2000
+VERBOSE_DIFF_LINES = (1000, 50000)
+DEFAULT_GIT_SIZES = (1000, 10000, 100000)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.1
+RANGE_BENCHMARK = "get_commit_messages_of_hash_range"
+# the same, reading the `.git` directory in Python instead of running git
+OBJECTS_RANGE_BENCHMARK = f"git_objects.{RANGE_BENCHMARK}"
+# number of commits looked up by hash, one git process each or a single batch
+HASH_LOOKUPS = 100
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "commitlint",
+    "GIT_AUTHOR_EMAIL": "commitlint@example.com",
+    "GIT_COMMITTER_NAME": "commitlint",
+    "GIT_COMMITTER_EMAIL": "commitlint@example.com",
+    "GIT_CONFIG_NOSYSTEM": "1",
+    "GIT_CONFIG_GLOBAL": os.devnull,
+}
+
+WORDS = (
+    "add update remove fix handle support parse validate the a new old empty "
+    "scope header body footer message commit range cache option config docs "
+    "test build release version hook action api endpoint error output input"
+).split()
+
+
+class Benchmark(NamedTuple):
+    """A benchmark function along with the number of items it processes."""
+
+    name: str
+    run: Callable[[], object]
+    items: int
+
+
+def _sentence(rng: random.Random, min_words: int, max_words: int) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randint(min_words, max_words)))
+
+
+def generate_commit_messages(count: int = CORPUS_SIZE, seed: int = SEED) -> List[str]:
+    """
+    Generates a deterministic mix of valid, invalid and ignored commit messages.
+
+    Args:
+        count (int, optional): The number of commit messages (default is
+            CORPUS_SIZE).
+        seed (int, optional): The seed of the generator (default is SEED).
+
+    Returns:
+        List[str]: The generated commit messages.
+    """
+    rng = random.Random(seed)
+    commit_messages = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.05:
+            header = f"Merge branch '{rng.choice(WORDS)}' into main"
+        elif kind < 0.2:
+            # invalid headers: capitalized type, missing colon, full stop, etc.
+            header = rng.choice(
+                (
+                    f"{rng.choice(COMMIT_TYPES).capitalize()}: {_sentence(rng, 2, 6)}",
+                    f"{rng.choice(COMMIT_TYPES)} {_sentence(rng, 2, 6)}",
+                    f"{rng.choice(COMMIT_TYPES)}: {_sentence(rng, 2, 6)}.",
+                    _sentence(rng, 3, 8),
+                )
+            )
+        else:
+            scope = f"({rng.choice(WORDS)})" if rng.random() < 0.5 else ""
+            bang = "!" if rng.random() < 0.05 else ""
+            header = f"{rng.choice(COMMIT_TYPES)}{scope}{bang}: {_sentence(rng, 2, 8)}"
+
+        paragraphs = [header]
+        for _ in range(rng.choice((0, 0, 1, 2, 3))):
+            lines = [_sentence(rng, 5, 12) for _ in range(rng.randint(1, 6))]
+            paragraphs.append("\n".join(lines))
+
+        commit_messages.append("\n\n".join(paragraphs))
+
+    return commit_messages
+
+
+def generate_verbose_commit_file(diff_lines: int, seed: int = SEED) -> str:
+    """
+    Generates the content of a `git commit --verbose` commit message file.
+
+    Args:
+        diff_lines (int): The number of lines of the diff below the scissors line.
+        seed (int, optional): The seed of the generator (default is SEED).
+
+    Returns:
+        str: The content of the commit message file.
+    """
+    rng = random.Random(seed)
+    diff = "\n".join(
+        f"{rng.choice('+- ')}{_sentence(rng, 3, 10)}" for _ in range(diff_lines)
+    )
+    return (
+        "feat(cli): add a new option\n\n"
+        f"{_sentence(rng, 5, 12)}\n\n"
+        "# Please enter the commit message for your changes. Lines starting\n"
+        "# with '#' will be ignored, and an empty message aborts the commit.\n"
+        "#\n"
+        "# On branch main\n"
+        "# Changes to be committed:\n"
+        "#\tmodified:   src/commitlint/cli.py\n"
+        "#\n"
+        f"{VERBOSE_COMMIT_SEPARATOR}\n"
+        "# Do not modify or remove the line above.\n"
+        "# Everything below it will be ignored.\n"
+        "diff --git a/src/commitlint/cli.py b/src/commitlint/cli.py\n"
+        f"{diff}\n"
+    )
+
+
+def create_git_repo(repo_path: str, commit_messages: Iterable[str]) -> None:
+    """
+    Creates a git repository with a linear history of empty commits.
+
+    The commits are written with `git fast-import`, which creates hundreds of
+    thousands of commits in seconds.
+
+    Args:
+        repo_path (str): The path of the repository to create.
+        commit_messages (Iterable[str]): The commit messages, oldest first.
+    """
+    env = {**os.environ, **GIT_ENV}
+    subprocess.run(["git", "init", "--quiet", repo_path], env=env, check=True)
+    subprocess.run(
+        ["git", "symbolic-ref", "HEAD", "refs/heads/main"],
+        cwd=repo_path,
+        env=env,
+        check=True,
+    )
+
+    with subprocess.Popen(
+        ["git", "fast-import", "--quiet"],
+        cwd=repo_path,
+        env=env,
+        stdin=subprocess.PIPE,
+    ) as process:
+        stdin = process.stdin
+        assert stdin is not None
+        timestamp = 1700000000
+        for index, commit_message in enumerate(commit_messages):
+            data = commit_message.encode("utf-8")
+            stdin.write(
+                b"commit refs/heads/main\n"
+                b"committer commitlint <commitlint@example.com> "
+                + f"{timestamp + index} +0000\n".encode()
+                + f"data {len(data)}\n".encode()
+                + data
+                + b"\n"
+            )
+        stdin.close()
+
+    if process.returncode != 0:
+        raise RuntimeError(f"git fast-import failed in {repo_path}")
+
+
+def _get_git_repo(repo_dir: str, size: int) -> str:
+    """Returns the path of a generated repository, creating it if missing."""
+    repo_path = os.path.join(repo_dir, f"commits-{size}")
+    if not os.path.isdir(repo_path):
+        tmp_path = f"{repo_path}.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        corpus = generate_commit_messages()
+        create_git_repo(tmp_path, (corpus[i % len(corpus)] for i in range(size)))
+        os.rename(tmp_path, repo_path)
+
+    return repo_path
+
+
+@contextmanager
+def _chdir(path: str) -> Iterator[None]:
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+
+
+def _consume(iterator: Iterator[object]) -> None:
+    deque(iterator, maxlen=0)
+
+
+def get_benchmarks(git_sizes: Iterable[int], repo_dir: str) -> Iterator[Benchmark]:
+    """
+    Yields the benchmarks of the suite, preparing their corpora lazily.
+
+    Args:
+        git_sizes (Iterable[int]): The numbers of commits of the generated git
+            repositories.
+        repo_dir (str): The directory of the generated git repositories.
+
+    Yields:
+        Benchmark: The benchmarks of the suite.
+    """
+    corpus = generate_commit_messages()
+    items = len(corpus)
+
+    def lint_detailed() -> None:
+        for commit_message in corpus:
+            lint_commit_message(commit_message)
+
+    def lint_skip_detail() -> None:
+        for commit_message in corpus:
+            lint_commit_message(commit_message, skip_detail=True)
+
+    def lint_result_detailed() -> None:
+        for commit_message in corpus:
+            lint_commit_message_result(commit_message)
+
+    def check_ignored() -> None:
+        for commit_message in corpus:
+            is_ignored(commit_message)
+
+    yield Benchmark("lint_commit_message.detailed", lint_detailed, items)
+    yield Benchmark("lint_commit_message.skip_detail", lint_skip_detail, items)
+    yield Benchmark("lint_commit_message_result.detailed", lint_result_detailed, items)
+    yield Benchmark("is_ignored", check_ignored, items)
+
+    for diff_lines in VERBOSE_DIFF_LINES:
+        commit_file = generate_verbose_commit_file(diff_lines)
+        yield Benchmark(
+            f"remove_comments.verbose_{diff_lines}_lines",
+            lambda commit_file=commit_file: remove_comments(commit_file),
+            1,
+        )
+
+        commit_file_path = os.path.join(repo_dir, f"COMMIT_EDITMSG_{diff_lines}")
+        with open(commit_file_path, "w", encoding="utf-8") as commit_message_file:
+            commit_message_file.write(commit_file)
+
+        yield Benchmark(
+            f"read_commit_message_file.verbose_{diff_lines}_lines",
+            lambda path=commit_file_path: _get_commit_message_from_file(path),
+            1,
+        )
+
+    for size in git_sizes:
+        repo_path = _get_git_repo(repo_dir, size)
+        root_commit = _get_root_commit(repo_path)
+
+        def read_range(repo_path: str = repo_path, root_commit: str = root_commit):
+            with _chdir(repo_path):
+                _consume(get_commit_messages_of_hash_range(root_commit, "main"))
+
+        def read_range_objects(
+            repo_path: str = repo_path, root_commit: str = root_commit
+        ) -> None:
+            with _chdir(repo_path):
+                _consume(
+                    git_objects.get_commit_messages_of_hash_range(root_commit, "main")
+                )
+
+        yield Benchmark(f"{RANGE_BENCHMARK}.{size}", read_range, size)
+        yield Benchmark(f"{OBJECTS_RANGE_BENCHMARK}.{size}", read_range_objects, size)
+
+    if git_sizes:
+        repo_path = _get_git_repo(repo_dir, min(git_sizes))
+        commit_hashes = subprocess.check_output(
+            ["git", "rev-list", f"--max-count={HASH_LOOKUPS}", "main"],
+            cwd=repo_path,
+            text=True,
+        ).split()
+
+        def read_hashes_one_by_one() -> None:
+            with _chdir(repo_path):
+                for commit_hash in commit_hashes:
+                    get_commit_message_of_hash(commit_hash)
+
+        def read_hashes_in_batch() -> None:
+            with _chdir(repo_path):
+                _consume(get_commit_messages_of_hashes(commit_hashes))
+
+        def read_hashes_objects() -> None:
+            with _chdir(repo_path):
+                _consume(git_objects.get_commit_messages_of_hashes(commit_hashes))
+
+        yield Benchmark(
+            f"get_commit_message_of_hash.{len(commit_hashes)}",
+            read_hashes_one_by_one,
+            len(commit_hashes),
+        )
+        yield Benchmark(
+            f"get_commit_messages_of_hashes.{len(commit_hashes)}",
+            read_hashes_in_batch,
+            len(commit_hashes),
+        )
+        yield Benchmark(
+            f"git_objects.get_commit_messages_of_hashes.{len(commit_hashes)}",
+            read_hashes_objects,
+            len(commit_hashes),
+        )
+
+
+def _get_root_commit(repo_path: str) -> str:
+    return subprocess.check_output(
+        ["git", "rev-list", "--max-parents=0", "main"], cwd=repo_path, text=True
+    ).strip()
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int) -> Dict[str, float]:
+    """
+    Times a benchmark, keeping the best of the repeated runs.
+
+    Args:
+        benchmark (Benchmark): The benchmark to run.
+        repeat (int): The number of timed runs.
+
+    Returns:
+        Dict[str, float]: The seconds per run, the items per run and the items per
+            second of the best run.
+    """
+    timer = timeit.Timer(benchmark.run)
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+    return {
+        "seconds": seconds,
+        "items": benchmark.items,
+        "items_per_second": benchmark.items / seconds,
+    }
+
+
+def compare_results(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+    """
+    Compares the results against the baseline.
+
+    Args:
+        results (Dict[str, Dict[str, float]]): The results of the benchmarks.
+        baseline (Dict[str, Dict[str, float]]): The baseline results.
+        threshold (float): The allowed relative slowdown, e.g. 0.1 for 10%.
+
+    Returns:
+        List[str]: The names of the benchmarks slower than the baseline by more
+            than the threshold.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name}: no baseline")
+            continue
+
+        ratio = result["seconds"] / baseline[name]["seconds"]
+        status = "ok"
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+
+        print(f"{name}: {ratio:.2f}x of baseline, {status}")
+
+    return regressions
+
+
+def main() -> None:
+    """Runs the benchmark suite."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark suite for the linting and git hot paths."
+    )
+    parser.add_argument("--output", help="File to write the JSON results to.")
+    parser.add_argument("--baseline", help="JSON results to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown against the baseline (default: %(default)s).",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--git-sizes",
+        type=lambda value: [int(size) for size in value.split(",") if size],
+        default=list(DEFAULT_GIT_SIZES),
+        help="Comma separated numbers of commits of the generated git repositories.",
+    )
+    parser.add_argument(
+        "--repo-dir",
+        help="Directory to keep the generated git repositories in between runs.",
+    )
+    parser.add_argument(
+        "--filter", help="Only run the benchmarks whose name contains this text."
+    )
+    args = parser.parse_args()
+
+    repo_dir = args.repo_dir or tempfile.mkdtemp(prefix="commitlint-benchmarks-")
+    os.makedirs(repo_dir, exist_ok=True)
+
+    # skipping the generation of the repositories that aren't benchmarked
+    git_sizes = [
+        size
+        for size in args.git_sizes
+        if not args.filter
+        or args.filter in f"{RANGE_BENCHMARK}.{size}"
+        or args.filter in f"{OBJECTS_RANGE_BENCHMARK}.{size}"
+    ]
+    if args.filter and not git_sizes and args.git_sizes and "hash" in args.filter:
+        # the hash lookups use the smallest repository
+        git_sizes = [min(args.git_sizes)]
+
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        for benchmark in get_benchmarks(git_sizes, repo_dir):
+            if args.filter and args.filter not in benchmark.name:
+                continue
+
+            result = run_benchmark(benchmark, args.repeat)
+            results[benchmark.name] = result
+            print(
+                f"{benchmark.name}: {result['seconds'] * 1e3:.3f} ms/run, "
+                f"{result['items_per_second']:,.0f} items/s"
+            )
+    finally:
+        if not args.repo_dir:
+            shutil.rmtree(repo_dir, ignore_errors=True)
+
+    if args.output:
+        report = {
+            "metadata": {
+                "commitlint": __version__,
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+            },
+            "benchmarks": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+            output_file.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)["benchmarks"]
+
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            print(
+                f"{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}"
+            )
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,15 +4,28 @@ pull_request and pull_request_target events.
 """
 
 import os
-import subprocess
+import queue
 import sys
-from typing import Iterable, List, Optional, Tuple, cast
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from commitlint import console
+from commitlint.config import config
+from commitlint.exceptions import GitException
+from commitlint.git_helpers import (
+    get_commit_messages_of_hash_range,
+    get_merge_base,
+    has_complete_history,
+)
+from commitlint.linter import lint_commit_message
+from commitlint.messages import VALIDATION_SUCCESSFUL
 
 from .event import GitHubEvent
 from .utils import (
+    GitHubClient,
     get_boolean_input,
     get_input,
-    request_github_api,
     write_line_to_file,
     write_output,
 )
@@ -26,44 +39,185 @@ EVENT_PULL_REQUEST_TARGET = "pull_request_target"
 INPUT_TOKEN = "token"
 INPUT_FAIL_ON_ERROR = "fail_on_error"
 INPUT_VERBOSE = "verbose"
+INPUT_GRAPHQL = "graphql"
 
 # Status
 STATUS_SUCCESS = "success"
 STATUS_FAILURE = "failure"
 
 MAX_PR_COMMITS = 250
+# the commits array of a push payload is truncated to this many commits
+MAX_PUSH_PAYLOAD_COMMITS = 2048
 PER_PAGE_COMMITS = 50
 
+# at most 100 nodes can be requested by page of the GraphQL API
+GRAPHQL_PER_PAGE_COMMITS = 100
+PR_COMMITS_QUERY = """
+query ($owner: String!, $name: String!, $number: Int!, $first: Int!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      commits(first: $first, after: $after) {
+        nodes {
+          commit {
+            oid
+            message
+          }
+        }
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+      }
+    }
+  }
+}
+"""
+
+# the pages of PR commits are fetched concurrently, on at most this many
+# kept-alive connections
+MAX_PAGE_WORKERS = 5
+
+
+def _read_local_commit_messages(base: str, head: str) -> Optional[Iterator[str]]:
+    """
+    Read the commit messages of `base..head` from the local repository.
+
+    The messages are read lazily, and git only reports an invalid range once it
+    is read, so the first message is read here to fall back to the other
+    sources of commits.
+
+    Args:
+        base (str): The excluded base commit.
+        head (str): The head commit.
+
+    Returns:
+        Optional[Iterator[str]]: Iterator of the commit messages, oldest first,
+            or None if the range can't be read.
+    """
+    commit_messages = get_commit_messages_of_hash_range(
+        base, head, include_from_hash=False
+    )
+    try:
+        first_commit_message = next(commit_messages)
+    except StopIteration:
+        return iter(())
+    except GitException as ex:
+        console.verbose("%s: %s", ex.__class__.__name__, ex)
+        return None
+
+    return chain((first_commit_message,), commit_messages)
+
 
 def get_push_commit_messages(event: GitHubEvent) -> Iterable[str]:
     """
     Return push commits.
 
+    The commits array of the payload is truncated for large pushes. In that
+    case, the commits are read locally from `before..after`, or from the merge
+    base with the default branch for a new branch, if the complete history of
+    the repository is checked out.
+
     Args:
         event (GitHubEvent): An instance of the GitHubEvent class representing
             the GitHub event.
 
     Returns:
-        List[str]: List of github commits.
+        Iterable[str]: Iterable of github commits.
+    """
+    payload = event.payload
+    commits = payload["commits"]
+    total_commits = payload.get("size", len(commits))
+
+    if len(commits) < total_commits or len(commits) >= MAX_PUSH_PAYLOAD_COMMITS:
+        commit_messages = _get_local_push_commit_messages(payload)
+        if commit_messages is not None:
+            return commit_messages
+
+        sys.stdout.write(
+            f"::warning::The push payload only includes {len(commits)} commit(s), "
+            "the other commits aren't checked. To lint them from the local "
+            "repository, check out its complete history, e.g. with "
+            "`fetch-depth: 0`.\n"
+        )
+
+    return (commit_data["message"] for commit_data in commits)
+
+
+def _get_local_push_commit_messages(
+    payload: Dict[str, Any],
+) -> Optional[Iterator[str]]:
     """
-    return (commit_data["message"] for commit_data in event.payload["commits"])
+    Read the commits of a push from the local repository.
+
+    Args:
+        payload (Dict[str, Any]): The payload of the push event.
+
+    Returns:
+        Optional[Iterator[str]]: Iterator of the commits of `before..after`, or
+            None if the history of the push isn't available locally.
+    """
+    before: str = payload.get("before") or ""
+    after: str = payload.get("after") or ""
+    if not after or not has_complete_history(after):
+        return None
+
+    # `before` is all zeros for a new branch, and isn't fetched by the checkout
+    # after a force push
+    if before.strip("0") and has_complete_history(before):
+        base = before
+    else:
+        default_branch = payload.get("repository", {}).get("default_branch")
+        default_ref = f"origin/{default_branch}"
+        if not default_branch or not has_complete_history(default_ref):
+            return None
+
+        try:
+            base = get_merge_base(after, default_ref)
+        except GitException:
+            return None
+
+        # e.g. the first push of the default branch
+        if base == after:
+            return None
 
+    console.verbose("reading the push commits from the local repository")
+    return _read_local_commit_messages(base, after)
 
-def get_pr_commit_messages(event: GitHubEvent) -> Iterable[str]:
+
+def get_pr_commit_messages(event: GitHubEvent) -> Iterator[str]:
     """
     Return PR commits.
 
+    When the complete history of the repository is checked out, e.g. with
+    `actions/checkout` and `fetch-depth: 0`, the commits are read locally from
+    `base..head`, without any API call or limit on the number of commits.
+
+    Otherwise, the pages of commits are fetched concurrently from the GitHub API,
+    and the commit messages are yielded in order as soon as their page is
+    fetched, so the linting doesn't wait for the remaining pages. With the
+    `graphql` input, the commits are fetched from the GraphQL API instead, only
+    requesting their hash and message, 100 commits per request.
+
     Args:
         event (GitHubEvent): An instance of the GitHubEvent class representing
             the GitHub event.
 
     Returns:
-        List[str]: List of github commits.
+        Iterator[str]: Iterator of github commits.
     """
+    pull_request = event.payload["pull_request"]
+    base_sha = pull_request.get("base", {}).get("sha")
+    head_sha = pull_request.get("head", {}).get("sha")
+    if base_sha and head_sha and has_complete_history(base_sha, head_sha):
+        console.verbose("reading the PR commits from the local repository")
+        commit_messages = _read_local_commit_messages(base_sha, head_sha)
+        if commit_messages is not None:
+            return commit_messages
+
     token = get_input(INPUT_TOKEN)
     repo = event.repository
     pr_number: int = event.payload["number"]
-    total_commits: int = event.payload["pull_request"]["commits"]
+    total_commits: int = pull_request["commits"]
 
     if total_commits > MAX_PR_COMMITS:
         sys.exit(
@@ -71,60 +225,149 @@ def get_pr_commit_messages(event: GitHubEvent) -> Iterable[str]:
             f"{MAX_PR_COMMITS} commits.\n"
             "Please refer to "
             "https://docs.github.com/en/rest/pulls/pulls"
-            "?apiVersion=2022-11-28#list-commits-on-a-pull-request"
+            "?apiVersion=2022-11-28#list-commits-on-a-pull-request\n"
+            "To lint them from the local repository, check out its complete "
+            "history, e.g. with `fetch-depth: 0`."
         )
 
+    if get_boolean_input(INPUT_GRAPHQL):
+        return _iter_pr_commit_messages_graphql(token, repo, pr_number)
+
     # pagination
-    total_page = 1 + total_commits // PER_PAGE_COMMITS
-
-    commits: List[str] = []
-    for page in range(1, total_page + 1):
-        status, data = request_github_api(
-            method="GET",
-            url=f"/repos/{repo}/pulls/{pr_number}/commits",
-            token=token,
-            params={"per_page": PER_PAGE_COMMITS, "page": page},
-        )
+    total_page = max(1, -(-total_commits // PER_PAGE_COMMITS))
+
+    return _iter_pr_commit_messages(
+        token, f"/repos/{repo}/pulls/{pr_number}/commits", total_page
+    )
 
-        if status != 200:
-            sys.exit(
-                f"::error::Github API failed with status code {status}. Response: {data}"
+
+def _iter_pr_commit_messages(token: str, url: str, total_page: int) -> Iterator[str]:
+    """
+    Fetch the pages of PR commits concurrently and yield their messages in order.
+
+    Args:
+        token (str): The GitHub token.
+        url (str): The API URL of the PR commits.
+        total_page (int): The number of pages to fetch.
+
+    Yields:
+        str: The commit messages, in the order of the pages.
+    """
+    workers = min(MAX_PAGE_WORKERS, total_page)
+
+    # each worker takes a client, so a connection is used by one thread at a time
+    clients: "queue.Queue[GitHubClient]" = queue.Queue()
+    for _ in range(workers):
+        clients.put(GitHubClient(token))
+
+    def fetch_page(page: int) -> Tuple[int, Any]:
+        client = clients.get()
+        try:
+            return client.request(
+                method="GET",
+                url=url,
+                params={"per_page": PER_PAGE_COMMITS, "page": page},
             )
+        finally:
+            clients.put(client)
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            executor.submit(fetch_page, page) for page in range(1, total_page + 1)
+        ]
+        for future in futures:
+            status, data = future.result()
+
+            if status != 200:
+                sys.exit(
+                    f"::error::Github API failed with status code {status}. "
+                    f"Response: {data}"
+                )
+
+            yield from (commit_data["commit"]["message"] for commit_data in data)
+    finally:
+        executor.shutdown(cancel_futures=True)
+        while not clients.empty():
+            clients.get().close()
+
+
+def _iter_pr_commit_messages_graphql(
+    token: str, repo: str, pr_number: int
+) -> Iterator[str]:
+    """
+    Fetch the PR commits from the GraphQL API, following the page cursors.
+
+    Args:
+        token (str): The GitHub token.
+        repo (str): The repository, as `owner/name`.
+        pr_number (int): The number of the PR.
+
+    Yields:
+        str: The commit messages, oldest first.
+    """
+    owner, name = repo.split("/", 1)
+    variables = {
+        "owner": owner,
+        "name": name,
+        "number": pr_number,
+        "first": GRAPHQL_PER_PAGE_COMMITS,
+        "after": None,
+    }
+
+    with GitHubClient(token) as client:
+        while True:
+            status, data = client.graphql(PR_COMMITS_QUERY, variables)
+
+            if status != 200 or not data or data.get("errors"):
+                sys.exit(
+                    f"::error::Github GraphQL API failed with status code {status}. "
+                    f"Response: {data}"
+                )
 
-        commits.extend(commit_data["commit"]["message"] for commit_data in data)
+            commits = data["data"]["repository"]["pullRequest"]["commits"]
+            yield from (node["commit"]["message"] for node in commits["nodes"])
 
-    return commits
+            page_info = commits["pageInfo"]
+            if not page_info["hasNextPage"]:
+                break
 
+            variables["after"] = page_info["endCursor"]
 
-def run_commitlint(commit_message: str) -> Tuple[bool, Optional[str]]:
+
+def run_commitlint(commit_message: str) -> Tuple[bool, List[str]]:
     """
     Run the commitlint for the given commit message.
 
+    The commit message is linted in-process using `commitlint.linter`, stripped
+    like the `commitlint` command strips its argument.
+
     Args:
         commit_message (str): A commit message to check with commitlint.
 
     Returns:
-        Tuple[bool, Optional[str]]: A tuple with the success status as the first
-            element and error message as the second element.
+        Tuple[bool, List[str]]: A tuple with the success status as the first
+            element and the list of errors as the second element.
     """
+    return lint_commit_message(commit_message.strip())
 
-    try:
-        commands = ["commitlint", commit_message, "--hide-input"]
 
-        verbose = get_boolean_input(INPUT_VERBOSE)
-        if verbose:
-            commands.append("--verbose")
+def format_errors(errors: List[str]) -> str:
+    """
+    Format the lint errors of a commit message for the `::error` annotation.
 
-        output = subprocess.check_output(commands, text=True, stderr=subprocess.PIPE)
-        if output:
-            sys.stdout.write(f"{output}")
+    Args:
+        errors (List[str]): List of errors returned by the linter.
 
-        return True, None
-    except subprocess.CalledProcessError as error:
-        if error.stdout:
-            sys.stdout.write(f"{error.stdout}")
+    Returns:
+        str: The errors formatted as an annotation message, with the characters
+            escaped as required by the GitHub Actions workflow commands.
+    """
+    lines = [f"✖ Found {len(errors)} error(s)."]
+    lines.extend(f"- {error}" for error in errors)
+    message = "\n".join(lines)
 
-        return False, str(error.stderr)
+    return message.replace("%", "%25").replace("\r", "%0D").replace("\n", "%0A")
 
 
 def check_commit_messages(commit_messages: Iterable[str]) -> None:
@@ -143,17 +386,14 @@ def check_commit_messages(commit_messages: Iterable[str]) -> None:
         commit_message_header = commit_message.split("\n")[0]
         sys.stdout.write(f"\n⧗ {commit_message_header}\n")
 
-        success, error = run_commitlint(commit_message)
+        success, errors = run_commitlint(commit_message)
         if success:
+            sys.stdout.write(f"{VALIDATION_SUCCESSFUL}\n")
             continue
 
-        error = (
-            cast(str, error)
-            .replace("%", "%25")
-            .replace("\r", "%0D")
-            .replace("\n", "%0A")
+        sys.stdout.write(
+            f"::error title={commit_message_header}::{format_errors(errors)}\n"
         )
-        sys.stdout.write(f"::error title={commit_message_header}::{error}")
         failed_commits_count += 1
 
     # GitHub step summary path
@@ -204,6 +444,7 @@ def _handle_push_event(event: GitHubEvent) -> None:
 def run_action() -> None:
     """Run commitlint action"""
     event = GitHubEvent()
+    config.verbose = get_boolean_input(INPUT_VERBOSE)
 
     if event.event_name == EVENT_PUSH:
         _handle_push_event(event)
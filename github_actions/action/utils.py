@@ -1,11 +1,25 @@
 """Utility functions for GitHub Actions"""
 
+import gzip
 import http.client
 import json
 import os
 import urllib.parse
 from typing import Any, Dict, Optional, Tuple, Union
 
+# the API URL of the GitHub instance, set by GitHub Actions, e.g. for GitHub
+# Enterprise Server
+GITHUB_API_URL_ENV = "GITHUB_API_URL"
+GITHUB_GRAPHQL_URL_ENV = "GITHUB_GRAPHQL_URL"
+DEFAULT_GITHUB_API_URL = "https://api.github.com"
+
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+# methods retried once on a fresh connection when a kept-alive connection turns
+# out to be closed by the server
+_RETRIED_METHODS = ("GET", "HEAD")
+
 
 def get_input(key: str) -> str:
     """
@@ -80,6 +94,193 @@ def write_output(name: str, value: Union[str, int]) -> None:
     write_line_to_file(output_filepath, f"{name}={value}")
 
 
+class GitHubClient:
+    """
+    Small GitHub API client, keeping a persistent connection per host.
+
+    The connections are reused across the requests, e.g. the pages of a list, so
+    only the first request pays for the TCP and TLS handshakes. Responses are
+    requested gzip compressed.
+
+    Attributes:
+        token (str): The GitHub API token for authentication.
+        base_url (str): The base URL of the API, from the `GITHUB_API_URL`
+            environment variable by default, or `https://api.github.com`.
+        graphql_url (str): The URL of the GraphQL API, from the
+            `GITHUB_GRAPHQL_URL` environment variable by default, or `/graphql`
+            of the base URL.
+        connect_timeout (float): Seconds to wait for a connection.
+        read_timeout (float): Seconds to wait for a response.
+
+    Example:
+        ```python
+        with GitHubClient(token) as client:
+            for page in (1, 2):
+                status, data = client.request(
+                    "GET", "/repos/owner/repo/pulls/1/commits", params={"page": page}
+                )
+        ```
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: Optional[str] = None,
+        graphql_url: Optional[str] = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+    ) -> None:
+        self.token = token
+        self.base_url = (
+            base_url or os.environ.get(GITHUB_API_URL_ENV) or DEFAULT_GITHUB_API_URL
+        ).rstrip("/")
+        # e.g. `/api/graphql` rather than `/api/v3/graphql` on GitHub Enterprise
+        self.graphql_url = (
+            graphql_url
+            or os.environ.get(GITHUB_GRAPHQL_URL_ENV)
+            or f"{self.base_url}/graphql"
+        )
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._connections: Dict[Tuple[str, str], http.client.HTTPConnection] = {}
+
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the connections."""
+        for connection in self._connections.values():
+            connection.close()
+        self._connections.clear()
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        """Closes and forgets the connection to a host."""
+        connection = self._connections.pop(key, None)
+        if connection is not None:
+            connection.close()
+
+    def _connect(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """Opens a new connection to the host, with the timeouts of the client."""
+        connection_class = (
+            http.client.HTTPConnection
+            if scheme == "http"
+            else http.client.HTTPSConnection
+        )
+        connection = connection_class(host=netloc, timeout=self.connect_timeout)
+        connection.connect()
+        if connection.sock is not None:
+            connection.sock.settimeout(self.read_timeout)
+
+        return connection
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Tuple[int, Any]:
+        """
+        Sends a request to the GitHub API, on the kept-alive connection to the
+        host if any.
+
+        Args:
+            method (str): The HTTP request method, e.g., "GET" or "POST".
+            url (str): The endpoint URL, relative to the base URL, or absolute.
+            body (Optional[Dict[str, Any]]): The request body as a dictionary.
+            params (Optional[Dict[str, Any]]): The query parameters as a
+                dictionary.
+            idempotent (Optional[bool]): Whether the request can be retried on a
+                fresh connection (default is None, i.e. only for GET and HEAD).
+
+        Returns:
+            Tuple[int, Any]: A tuple with the status as the first element and the
+                response data as the second element, None for an empty response.
+
+        Raises:
+            OSError: If the host can't be reached or doesn't respond in time.
+        """
+        if idempotent is None:
+            idempotent = method in _RETRIED_METHODS
+        if not url.startswith(("http://", "https://")):
+            url = self.base_url + url
+        if params:
+            url += ("&" if "?" in url else "?") + urllib.parse.urlencode(params)
+
+        parts = urllib.parse.urlsplit(url)
+        path = urllib.parse.urlunsplit(("", "", parts.path, parts.query, ""))
+        key = (parts.scheme, parts.netloc)
+
+        headers = {
+            "Accept-Encoding": "gzip",
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+            "User-Agent": "commitlint",
+        }
+        payload = json.dumps(body) if body else None
+
+        while True:
+            connection = self._connections.get(key)
+            reused = connection is not None
+            if connection is None:
+                connection = self._connections[key] = self._connect(*key)
+
+            try:
+                connection.request(
+                    method=method, url=path, body=payload, headers=headers
+                )
+                response = connection.getresponse()
+                content = response.read()
+                break
+            except ConnectionError:
+                # e.g. the server closed the kept-alive connection in the meantime
+                self._drop(key)
+                if not reused or not idempotent:
+                    raise
+            except Exception:
+                self._drop(key)
+                raise
+
+        if response.will_close:
+            self._drop(key)
+
+        if response.getheader("Content-Encoding") == "gzip":
+            content = gzip.decompress(content)
+
+        data = json.loads(content.decode("utf-8")) if content else None
+        return response.status, data
+
+    def graphql(
+        self, query: str, variables: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Any]:
+        """
+        Sends a query to the GitHub GraphQL API.
+
+        Args:
+            query (str): The GraphQL query.
+            variables (Optional[Dict[str, Any]]): The variables of the query.
+
+        Returns:
+            Tuple[int, Any]: A tuple with the status as the first element and the
+                response data as the second element, with its `data` and
+                `errors` if any.
+
+        Raises:
+            OSError: If the host can't be reached or doesn't respond in time.
+        """
+        # queries don't modify anything, so they are retried like GET requests
+        return self.request(
+            method="POST",
+            url=self.graphql_url,
+            body={"query": query, "variables": variables or {}},
+            idempotent=True,
+        )
+
+
 def request_github_api(
     method: str,
     url: str,
@@ -88,7 +289,9 @@ def request_github_api(
     params: Optional[Dict[str, Any]] = None,
 ) -> Tuple[int, Any]:
     """
-    Sends a request to the GitHub API.
+    Sends a single request to the GitHub API.
+
+    Use a `GitHubClient` to reuse the connection across many requests.
 
     Args:
         method (str): The HTTP request method, e.g., "GET" or "POST".
@@ -102,22 +305,5 @@ def request_github_api(
             data as the second element.
 
     """
-    if params:
-        url += "?" + urllib.parse.urlencode(params)
-
-    conn = http.client.HTTPSConnection(host="api.github.com")
-    conn.request(
-        method=method,
-        url=url,
-        body=json.dumps(body) if body else None,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "User-Agent": "commitlint",
-        },
-    )
-    res = conn.getresponse()
-    json_data = res.read().decode("utf-8")
-    data = json.loads(json_data)
-
-    return res.status, data
+    with GitHubClient(token) as client:
+        return client.request(method=method, url=url, body=body, params=params)
@@ -1,5 +1,22 @@
 """Main module for commitlint."""
 
-from .linter import lint_commit_message
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["lint_commit_message"]
+if TYPE_CHECKING:  # pragma: no cover
+    from .linter import ErrorCode, Linter, LintResult, lint_commit_message
+
+__all__ = ["ErrorCode", "LintResult", "Linter", "lint_commit_message"]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports the linter on first use, so the thin `commitlint-client` doesn't pay
+    for it.
+    """
+    if name in __all__:
+        # pylint: disable=import-outside-toplevel
+        from . import linter
+
+        return getattr(linter, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,194 @@
+"""
+This module contains the persistent on-disk cache of the lint results.
+
+Each lint result is stored as a small JSON file named after a hash of the commit
+message, the lint options, the commitlint version and the active rules. Errors
+are stored as their codes and arguments, and are rendered when shown. Entries
+are written atomically, so multiple commitlint processes can share a cache
+directory. The least recently used entries are removed once the cache grows
+beyond its maximum number of entries.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import List, Optional, Tuple
+
+from . import console
+from .__version__ import __version__
+from .constants import COMMIT_HEADER_MAX_LENGTH, COMMIT_TYPES
+from .linter.result import ErrorCode, LintError, LintResult
+
+DEFAULT_CACHE_DIR_NAME = "commitlint-cache"
+DEFAULT_CACHE_MAX_ENTRIES = 10000
+
+# version of the entry format, part of the key so old entries are never read
+CACHE_FORMAT_VERSION = 2
+
+
+class LintCache:
+    """
+    Persistent cache of the lint results, keyed by the commit message content and
+    the ruleset.
+
+    Attributes:
+        cache_dir (str): The directory where the cache entries are stored.
+        max_entries (int): Maximum number of entries kept after pruning.
+
+    Example:
+        ```python
+        cache = LintCache(".git/commitlint-cache")
+        success, errors = lint_commit_message(commit_message, cache=cache)
+        cache.prune()
+        ```
+    """
+
+    def __init__(
+        self, cache_dir: str, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._ruleset = hashlib.sha256(
+            json.dumps(
+                [
+                    CACHE_FORMAT_VERSION,
+                    __version__,
+                    COMMIT_TYPES,
+                    COMMIT_HEADER_MAX_LENGTH,
+                ]
+            ).encode()
+        ).hexdigest()
+        self._has_writes = False
+
+    def _entry_path(
+        self, commit_message: str, skip_detail: bool, strip_comments: bool
+    ) -> str:
+        """Returns the path of the cache entry for the commit message and options."""
+        key = hashlib.sha256(
+            f"{self._ruleset}:{int(skip_detail)}{int(strip_comments)}:".encode()
+        )
+        key.update(commit_message.encode("utf-8", errors="surrogatepass"))
+        digest = key.hexdigest()
+
+        return os.path.join(self.cache_dir, digest[:2], f"{digest[2:]}.json")
+
+    def get(
+        self, commit_message: str, skip_detail: bool, strip_comments: bool
+    ) -> Optional[LintResult]:
+        """
+        Get the cached lint result of a commit message.
+
+        Args:
+            commit_message (str): The commit message.
+            skip_detail (bool): Whether the detailed error linting is skipped.
+            strip_comments (bool): Whether the comments are removed.
+
+        Returns:
+            Optional[LintResult]: The cached lint result, or None if the result is
+                not cached.
+        """
+        path = self._entry_path(commit_message, skip_detail, strip_comments)
+        try:
+            with open(path, encoding="utf-8") as entry_file:
+                entry = json.load(entry_file)
+
+            result = LintResult(
+                entry["success"],
+                [
+                    LintError(ErrorCode(code), tuple(args))
+                    for code, args in entry["errors"]
+                ],
+            )
+
+            # marking the entry as recently used
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        return result
+
+    def set(
+        self,
+        commit_message: str,
+        skip_detail: bool,
+        strip_comments: bool,
+        result: LintResult,
+    ) -> None:
+        """
+        Store the lint result of a commit message.
+
+        The entry is written to a temporary file and moved into place, so
+        concurrent readers and writers never see a partially written entry.
+        Failures to write are ignored, as the cache is only an optimization.
+
+        Args:
+            commit_message (str): The commit message.
+            skip_detail (bool): Whether the detailed error linting is skipped.
+            strip_comments (bool): Whether the comments are removed.
+            result (LintResult): The lint result to store.
+        """
+        path = self._entry_path(commit_message, skip_detail, strip_comments)
+        entry_dir = os.path.dirname(path)
+        entry = {
+            "success": result.success,
+            "errors": [[error.code.value, list(error.args)] for error in result.errors],
+        }
+        try:
+            os.makedirs(entry_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        except OSError as ex:
+            console.verbose("unable to write lint cache entry: %s", ex)
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(entry, tmp_file)
+
+            os.replace(tmp_path, path)
+            self._has_writes = True
+        except OSError as ex:
+            console.verbose("unable to write lint cache entry: %s", ex)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def prune(self) -> None:
+        """
+        Remove the least recently used entries beyond `max_entries`.
+
+        Pruning is skipped if nothing was written to the cache by this instance.
+        """
+        if not self._has_writes:
+            return
+
+        entries: List[Tuple[float, str]] = []
+        try:
+            with os.scandir(self.cache_dir) as subdirs:
+                for subdir in subdirs:
+                    if not subdir.is_dir():
+                        continue
+
+                    with os.scandir(subdir.path) as files:
+                        for entry in files:
+                            if entry.name.endswith(".json"):
+                                entries.append((entry.stat().st_mtime, entry.path))
+        except OSError as ex:
+            console.verbose("unable to read lint cache: %s", ex)
+            return
+
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+
+        console.verbose("removing %d least recently used lint cache entries", excess)
+        entries.sort()
+        for _, path in entries[:excess]:
+            try:
+                os.remove(path)
+            except OSError:
+                # already removed by a concurrent process
+                pass
+
+        self._has_writes = False
@@ -11,35 +11,147 @@ Usage:
     2. Check a commit message from a file:
         commitlint --file path/to/your/file.txt
 
+    3. Check NUL-delimited commit messages from stdin:
+        git log -z --format=%B | commitlint --stdin -z
+
+    4. Serve lint requests of `commitlint-client` from a warm daemon:
+        commitlint --serve
+
+
+Only the modules needed by the chosen mode are imported, e.g. the git helpers
+(and `subprocess`) aren't imported when linting a `--file` in a commit-msg hook.
 """
 
+# pylint: disable=import-outside-toplevel
+
 import argparse
 import os
 import sys
-from typing import List
+from collections import deque
+from contextlib import nullcontext
+from time import perf_counter
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    ContextManager,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
 
 from . import console
 from .__version__ import __version__
 from .config import config
-from .exceptions import CommitlintException
-from .git_helpers import get_commit_message_of_hash, get_commit_messages_of_hash_range
-from .linter import lint_commit_message
-from .linter.utils import remove_diff_from_commit_message
+from .constants import DEFAULT_IDLE_TIMEOUT, GIT_BACKENDS
+from .exceptions import CommitlintException, GitException
+from .linter import lint_commit_message_result, lint_commit_message_results
+from .linter.result import LintError
+from .linter.utils import VERBOSE_COMMIT_SEPARATOR, remove_diff_from_commit_message
 from .messages import VALIDATION_FAILED, VALIDATION_SUCCESSFUL
+from .streams import iter_commit_messages
+from .timings import TIMINGS_FORMATS, Timings
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .cache import LintCache
+    from .commits import Commit, RangeFilters
+
+
+def _parse_jobs(value: str) -> int:
+    """
+    Parse the value of the `--jobs` argument.
+
+    Args:
+        value (str): Number of jobs, or "auto" to use the number of CPUs.
+
+    Returns:
+        int: The number of jobs.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not "auto" or a positive integer.
+    """
+    if value == "auto":
+        return os.cpu_count() or 1
+
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(
+            f"invalid value '{value}', must be a positive integer or 'auto'"
+        )
+
+    return jobs
+
+
+def _parse_max_count(value: str) -> int:
+    """
+    Parse the value of the `--max-count` argument.
+
+    Args:
+        value (str): The maximum number of commits.
+
+    Returns:
+        int: The maximum number of commits.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        max_count = int(value)
+    except ValueError:
+        max_count = 0
+
+    if max_count < 1:
+        raise argparse.ArgumentTypeError(
+            f"invalid value '{value}', must be a positive integer"
+        )
+
+    return max_count
+
+
+def _parse_delimiter(value: str) -> str:
+    """
+    Parse the value of the `--delimiter` argument.
+
+    Args:
+        value (str): The delimiter of the commit messages read from stdin.
 
+    Returns:
+        str: The delimiter.
 
-def get_args() -> argparse.Namespace:
+    Raises:
+        argparse.ArgumentTypeError: If the value is empty.
+    """
+    if not value:
+        raise argparse.ArgumentTypeError("the delimiter must not be empty")
+
+    return value
+
+
+def get_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """
     Parse CLI arguments for checking if a commit message.
 
+    Args:
+        argv (Optional[List[str]], optional): The arguments to parse (default is
+            None, i.e. `sys.argv`).
+
     Returns:
         argparse.Namespace: The parsed CLI arguments.
 
     Raises:
         argparse.ArgumentError: If any argument error.
     """
+    # abbreviations are disabled, as `commitlint-client` matches the options of
+    # the arguments it forwards literally, e.g. `--stdin`
     parser = argparse.ArgumentParser(
-        description="Check if a commit message follows the conventional commit format."
+        description="Check if a commit message follows the conventional commit format.",
+        allow_abbrev=False,
     )
 
     # version
@@ -55,17 +167,123 @@ def get_args() -> argparse.Namespace:
     group.add_argument(
         "--file", type=str, help="Path to a file containing the commit message"
     )
-    group.add_argument("--hash", type=str, help="Commit hash")
+    group.add_argument("--hash", type=str, nargs="+", help="Commit hash(es)")
+    group.add_argument(
+        "--hash-file",
+        type=str,
+        help="Path to a file containing commit hashes, one per line, or - for stdin",
+    )
     group.add_argument("--from-hash", type=str, help="From commit hash")
+    group.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Read the commit message, or delimited commit messages, from stdin",
+    )
+    group.add_argument(
+        "--serve",
+        action="store_true",
+        help="Serve lint requests of commitlint-client until idle",
+    )
     # --to-hash is optional
     parser.add_argument("--to-hash", type=str, help="To commit hash", default="HEAD")
 
+    # filters of the hash range, passed down to git
+    parser.add_argument(
+        "--no-merges",
+        action="store_true",
+        help="Skip the merge commits of the hash range",
+    )
+    parser.add_argument(
+        "--first-parent",
+        action="store_true",
+        help="Follow only the first parent of the merge commits of the hash range",
+    )
+    parser.add_argument(
+        "--author",
+        type=str,
+        help="Only the commits of the hash range whose author matches the pattern",
+    )
+    parser.add_argument(
+        "--since",
+        type=str,
+        help="Only the commits of the hash range more recent than the date",
+    )
+    parser.add_argument(
+        "-n",
+        "--max-count",
+        type=_parse_max_count,
+        help="Only the given number of most recent commits of the hash range",
+    )
+    parser.add_argument(
+        "--path",
+        dest="paths",
+        action="append",
+        default=[],
+        help="Only the commits of the hash range modifying the path (repeatable)",
+    )
+
+    # delimiter of the commit messages read from stdin
+    parser.add_argument(
+        "-z",
+        "--null",
+        action="store_const",
+        const="\0",
+        dest="delimiter",
+        help="Commit messages from stdin are separated by NUL, as in git log -z",
+    )
+    parser.add_argument(
+        "--delimiter",
+        type=_parse_delimiter,
+        help="Separator of the commit messages read from stdin",
+    )
+
+    parser.add_argument(
+        "--git-backend",
+        choices=GIT_BACKENDS,
+        default="git",
+        help="Read the commits by running git, or from the .git directory in Python",
+    )
+
     # feature options
     parser.add_argument(
         "--skip-detail",
         action="store_true",
         help="Skip the detailed error message check",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_parse_jobs,
+        default=1,
+        help="Number of parallel jobs for linting a hash range, or 'auto'",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache the lint results in the .git directory",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Cache the lint results in the given directory",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help="Seconds without requests before --serve shuts down",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report the time of each phase to stderr",
+    )
+    parser.add_argument(
+        "--timings-format",
+        choices=TIMINGS_FORMATS,
+        default=TIMINGS_FORMATS[0],
+        help="Format of the --timings report, a table (default) or json",
+    )
     # --hide-input: specifically created for Github Actions
     # and is ignored from documentation.
     parser.add_argument(
@@ -95,30 +313,74 @@ def get_args() -> argparse.Namespace:
     )
 
     # parsing args
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    if args.delimiter is not None and not args.stdin:
+        parser.error("-z/--null and --delimiter can only be used with --stdin")
+
+    range_filters = (
+        args.no_merges,
+        args.first_parent,
+        args.author is not None,
+        args.since is not None,
+        args.max_count is not None,
+        args.paths,
+    )
+    if any(range_filters) and not args.from_hash:
+        parser.error(
+            "--no-merges, --first-parent, --author, --since, --max-count and --path "
+            "can only be used with --from-hash"
+        )
+
+    if args.git_backend == "python" and (args.since is not None or args.paths):
+        parser.error("--since and --path require --git-backend git")
 
     return args
 
 
+def _phase(name: str) -> ContextManager[None]:
+    """
+    Returns a context manager recording the time of a phase, if timings are enabled.
+
+    Args:
+        name (str): The name of the phase.
+
+    Returns:
+        ContextManager[None]: The context manager for the phase.
+    """
+    timings = config.timings
+    if timings is None:
+        return nullcontext()
+
+    return timings.phase(name)
+
+
 def _show_errors(
     commit_message: str,
-    errors: List[str],
+    errors: Sequence[LintError],
     skip_detail: bool = False,
     hide_input: bool = False,
+    commit: Optional["Commit"] = None,
 ) -> None:
     """
     Display a formatted error message for a list of errors.
 
     Args:
         commit_message (str): The commit message to display.
-        errors (List[str]): A list of error messages to be displayed.
+        errors (Sequence[LintError]): The errors to be displayed, rendered only
+            if the detailed error messages are shown.
         skip_detail (bool): Whether to skip the detailed error message.
         hide_input (bool): Hide input from stdout/stderr.
+        commit (Optional[Commit], optional): The commit of the message, whose
+            hash, author and date are displayed (default is None).
     """
     error_count = len(errors)
 
     commit_message = remove_diff_from_commit_message(commit_message)
 
+    if commit is not None:
+        console.error(f"⧗ Commit: {commit.hash} ({commit.author}, {commit.date})")
+
     if not hide_input:
         console.error(f"⧗ Input:\n{commit_message}\n")
 
@@ -128,13 +390,18 @@ def _show_errors(
 
     console.error(f"✖ Found {error_count} error(s).")
     for error in errors:
-        console.error(f"- {error}")
+        console.error(f"- {error.render()}")
 
 
 def _get_commit_message_from_file(filepath: str) -> str:
     """
     Reads and returns the commit message from the specified file.
 
+    The file is read line by line, and reading stops at the scissors line of
+    `git commit --verbose`, so the diff below it is never read. The comment lines
+    are kept: like for the whole file, they are removed by the linter after the
+    message is stripped.
+
     Args:
         filepath (str): The path to the file containing the commit message.
 
@@ -146,10 +413,137 @@ def _get_commit_message_from_file(filepath: str) -> str:
         IOError: If there is an issue reading the file.
     """
     abs_filepath = os.path.abspath(filepath)
-    console.verbose(f"reading commit message from file {abs_filepath}")
+    console.verbose("reading commit message from file %s", abs_filepath)
+
+    lines: List[str] = []
     with open(abs_filepath, encoding="utf-8") as commit_message_file:
-        commit_message = commit_message_file.read().strip()
-        return commit_message
+        for line in commit_message_file:
+            # found anywhere in the line, like `remove_diff_from_commit_message`
+            separator_index = line.find(VERBOSE_COMMIT_SEPARATOR)
+            if separator_index != -1:
+                console.verbose("scissors line found, skipping the rest of the file")
+                lines.append(line[:separator_index])
+                break
+
+            lines.append(line)
+
+    return "".join(lines).strip()
+
+
+def _get_commit_hashes_from_file(filepath: str) -> Iterator[str]:
+    """
+    Lazily reads the commit hashes from the specified file, one per line.
+
+    Empty lines and lines starting with `#` are skipped.
+
+    Args:
+        filepath (str): The path to the file containing the commit hashes, or `-`
+            for stdin.
+
+    Yields:
+        str: The commit hashes.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+    """
+    if filepath == "-":
+        console.verbose("reading commit hashes from stdin")
+        yield from _iter_commit_hashes(sys.stdin)
+        return
+
+    abs_filepath = os.path.abspath(filepath)
+    console.verbose("reading commit hashes from file %s", abs_filepath)
+    with open(abs_filepath, encoding="utf-8") as hashes_file:
+        yield from _iter_commit_hashes(hashes_file)
+
+
+def _iter_commit_hashes(lines: Iterable[str]) -> Iterator[str]:
+    """Yields the commit hashes of the lines, skipping empty and `#` lines."""
+    for line in lines:
+        commit_hash = line.strip()
+        if commit_hash and not commit_hash.startswith("#"):
+            yield commit_hash
+
+
+def _get_git_backend(args: argparse.Namespace) -> ModuleType:
+    """
+    Returns the module retrieving the commit messages, as chosen by the CLI
+    arguments: `git_helpers`, running git, or `git_objects`, reading the `.git`
+    directory in Python.
+
+    Args:
+        args (argparse.Namespace): The parsed CLI arguments.
+
+    Returns:
+        ModuleType: The module, providing `get_commit_message_of_hash`,
+            `get_commits_of_hashes`, `get_commit_messages_of_hash_range` and
+            `get_commits_of_hash_range`.
+    """
+    if args.git_backend == "python":
+        console.verbose("git backend: python")
+        from . import git_objects
+
+        return git_objects
+
+    from . import git_helpers
+
+    return git_helpers
+
+
+def _get_range_filters(args: argparse.Namespace) -> "RangeFilters":
+    """
+    Returns the filters of the hash range given by the CLI arguments.
+
+    Args:
+        args (argparse.Namespace): The parsed CLI arguments.
+
+    Returns:
+        RangeFilters: The filters of the commits of the range.
+    """
+    from .commits import RangeFilters
+
+    return RangeFilters(
+        no_merges=args.no_merges,
+        first_parent=args.first_parent,
+        author=args.author,
+        since=args.since,
+        max_count=args.max_count,
+        paths=tuple(args.paths or ()),
+    )
+
+
+def _get_cache(args: argparse.Namespace) -> Optional["LintCache"]:
+    """
+    Returns the lint result cache enabled by the CLI arguments.
+
+    Args:
+        args (argparse.Namespace): The parsed CLI arguments.
+
+    Returns:
+        Optional[LintCache]: The lint result cache, or None if caching is disabled.
+    """
+    if not args.cache and not args.cache_dir:
+        return None
+
+    from .cache import DEFAULT_CACHE_DIR_NAME, LintCache
+
+    if args.cache_dir:
+        return LintCache(args.cache_dir)
+
+    if args.git_backend == "python":
+        from .git_dir import find_git_dir
+
+        git_dir = find_git_dir(os.getcwd())
+        if git_dir is None:
+            raise GitException("Not inside a git repository")
+    else:
+        from .git_helpers import get_git_dir
+
+        git_dir = get_git_dir()
+
+    cache_dir = os.path.join(git_dir, DEFAULT_CACHE_DIR_NAME)
+    console.verbose("using lint cache directory %s", cache_dir)
+    return LintCache(cache_dir)
 
 
 def _handle_commit_message(
@@ -157,6 +551,7 @@ def _handle_commit_message(
     skip_detail: bool,
     hide_input: bool,
     strip_comments: bool = False,
+    cache: Optional["LintCache"] = None,
 ) -> None:
     """
     Handles a single commit message, checks its validity, and prints the result.
@@ -167,45 +562,67 @@ def _handle_commit_message(
         hide_input (bool): Hide input from stdout/stderr.
         strip_comments (bool, optional): Whether to remove comments from the
             commit message (default is False).
+        cache (Optional[LintCache], optional): Cache of the lint results
+            (default is None).
 
     Raises:
         SystemExit: If the commit message is invalid.
     """
-    success, errors = lint_commit_message(commit_message, skip_detail, strip_comments)
+    result = lint_commit_message_result(
+        commit_message, skip_detail, strip_comments, cache=cache
+    )
 
-    if success:
-        console.success(VALIDATION_SUCCESSFUL)
-        return
+    with _phase("render"):
+        if result.success:
+            console.success(VALIDATION_SUCCESSFUL)
+            return
+
+        _show_errors(commit_message, result.errors, skip_detail, hide_input)
 
-    _show_errors(commit_message, errors, skip_detail, hide_input)
     sys.exit(1)
 
 
 def _handle_multiple_commit_messages(
-    commit_messages: List[str], skip_detail: bool, hide_input: bool
+    commit_messages: Iterable[str],
+    skip_detail: bool,
+    hide_input: bool,
+    jobs: int = 1,
+    cache: Optional["LintCache"] = None,
+    commits: Optional[Deque["Commit"]] = None,
 ) -> None:
     """
     Handles multiple commit messages, checks their validity, and prints the result.
 
     Args:
-        commit_messages (List[str]): List of commit messages to be handled.
+        commit_messages (Iterable[str]): Commit messages to be handled, linted one
+            at a time as they are produced.
         skip_detail (bool): Whether to skip the detailed error linting.
         hide_input (bool): Hide input from stdout/stderr.
+        jobs (int, optional): Number of parallel jobs for linting (default is 1).
+        cache (Optional[LintCache], optional): Cache of the lint results
+            (default is None).
+        commits (Optional[Deque[Commit]], optional): The commits of the messages,
+            queued as the messages are produced, see `_iter_commit_messages_of`
+            (default is None).
 
     Raises:
         SystemExit: If any of the commit messages is invalid.
     """
     has_error = False
 
-    for commit_message in commit_messages:
-        success, errors = lint_commit_message(commit_message, skip_detail)
-        if success:
+    for commit_message, result in lint_commit_message_results(
+        commit_messages, skip_detail=skip_detail, jobs=jobs, cache=cache
+    ):
+        # the results come in the order of the messages
+        commit = commits.popleft() if commits is not None else None
+        if result.success:
             console.verbose("lint success")
             continue
 
         has_error = True
-        _show_errors(commit_message, errors, skip_detail, hide_input)
-        console.error("")
+        with _phase("render"):
+            _show_errors(commit_message, result.errors, skip_detail, hide_input, commit)
+            console.error("")
 
     if has_error:
         sys.exit(1)
@@ -213,57 +630,213 @@ def _handle_multiple_commit_messages(
     console.success(VALIDATION_SUCCESSFUL)
 
 
-def main() -> None:
+def _iter_commit_messages_of(
+    commits: Iterable["Commit"], pending: Deque["Commit"]
+) -> Iterator[str]:
+    """
+    Yields the messages of the commits, queueing each commit in `pending` so
+    its lint result can be mapped back to it.
+
+    Args:
+        commits (Iterable[Commit]): The commits.
+        pending (Deque[Commit]): The queue of the commits whose messages are
+            yielded but not handled yet.
+
+    Yields:
+        str: The commit messages.
+    """
+    for commit in commits:
+        pending.append(commit)
+        yield commit.message
+
+
+def _handle_stdin(
+    args: argparse.Namespace, cache: Optional["LintCache"] = None
+) -> None:
+    """
+    Handles the commit messages read from stdin.
+
+    Without a delimiter, the whole input is a single commit message. Otherwise,
+    the delimited commit messages are read and linted one at a time, so the
+    memory usage doesn't grow with the length of the input.
+
+    Args:
+        args (argparse.Namespace): The parsed CLI arguments.
+        cache (Optional[LintCache], optional): Cache of the lint results
+            (default is None).
+
+    Raises:
+        SystemExit: If any of the commit messages is invalid.
+    """
+    stdin = sys.stdin.buffer
+    if args.delimiter is None:
+        with _phase("retrieve"):
+            commit_message = stdin.read().decode("utf-8", errors="replace").strip()
+        _handle_commit_message(
+            commit_message,
+            skip_detail=args.skip_detail,
+            hide_input=args.hide_input,
+            cache=cache,
+        )
+        return
+
+    commit_messages: Iterable[str] = iter_commit_messages(
+        stdin, args.delimiter.encode("utf-8")
+    )
+    if config.timings is not None:
+        commit_messages = config.timings.iter_timed("retrieve", commit_messages)
+
+    _handle_multiple_commit_messages(
+        commit_messages,
+        skip_detail=args.skip_detail,
+        hide_input=args.hide_input,
+        jobs=args.jobs,
+        cache=cache,
+    )
+
+
+def _serve(idle_timeout: float) -> None:
+    """
+    Serves lint requests of `commitlint-client` for the current repository.
+
+    Args:
+        idle_timeout (float): Seconds without requests before shutting down.
+
+    Raises:
+        GitException: If the current directory is not inside a git repository.
+    """
+    from .client import get_socket_path
+    from .daemon import serve
+    from .git_dir import find_git_dir
+
+    git_dir = find_git_dir(os.getcwd())
+    if git_dir is None:
+        raise GitException("Not inside a git repository")
+
+    serve(get_socket_path(git_dir), main, idle_timeout)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Main function for cli to check a commit message.
+
+    Args:
+        argv (Optional[List[str]], optional): The CLI arguments (default is None,
+            i.e. `sys.argv`).
     """
-    args = get_args()
+    start = perf_counter()
+    args = get_args(argv)
 
     # setting config based on args
     config.quiet = args.quiet
     config.verbose = args.verbose
 
+    timings = Timings(start=start) if args.timings else None
+    config.timings = timings
+    if timings is not None:
+        timings.add("parse_args", perf_counter() - start)
+
     console.verbose("starting commitlint")
+    cache = None
     try:
+        if args.serve:
+            console.verbose("serving lint requests")
+            _serve(args.idle_timeout)
+            return
+
+        cache = _get_cache(args)
         if args.file:
             console.verbose("commit message source: file")
-            commit_message = _get_commit_message_from_file(args.file)
+            with _phase("retrieve"):
+                commit_message = _get_commit_message_from_file(args.file)
             _handle_commit_message(
                 commit_message,
                 skip_detail=args.skip_detail,
                 hide_input=args.hide_input,
                 strip_comments=True,
+                cache=cache,
             )
-        elif args.hash:
+        elif args.hash and len(args.hash) == 1:
             console.verbose("commit message source: hash")
-            commit_message = get_commit_message_of_hash(args.hash)
+            git_backend = _get_git_backend(args)
+            with _phase("retrieve"):
+                commit_message = git_backend.get_commit_message_of_hash(args.hash[0])
             _handle_commit_message(
-                commit_message, skip_detail=args.skip_detail, hide_input=args.hide_input
+                commit_message,
+                skip_detail=args.skip_detail,
+                hide_input=args.hide_input,
+                cache=cache,
+            )
+        elif args.hash or args.hash_file:
+            console.verbose("commit message source: hashes")
+            git_backend = _get_git_backend(args)
+            commit_hashes = args.hash or _get_commit_hashes_from_file(args.hash_file)
+            # like for a range, the hash of the commits is shown along the errors
+            pending_commits: Deque["Commit"] = deque()
+            commit_messages: Iterable[str] = _iter_commit_messages_of(
+                git_backend.get_commits_of_hashes(commit_hashes), pending_commits
+            )
+            if timings is not None:
+                commit_messages = timings.iter_timed("retrieve", commit_messages)
+
+            _handle_multiple_commit_messages(
+                commit_messages,
+                skip_detail=args.skip_detail,
+                hide_input=args.hide_input,
+                jobs=args.jobs,
+                cache=cache,
+                commits=pending_commits,
             )
         elif args.from_hash:
             console.verbose("commit message source: hash range")
-            commit_messages = get_commit_messages_of_hash_range(
-                args.from_hash, args.to_hash
+            git_backend = _get_git_backend(args)
+            # the commits are read with their hash, author and date in the same
+            # git call, to show them along the errors
+            commits = git_backend.get_commits_of_hash_range(
+                args.from_hash,
+                args.to_hash,
+                _get_range_filters(args),
             )
+            pending_commits = deque()
+            commit_messages = _iter_commit_messages_of(commits, pending_commits)
+            if timings is not None:
+                commit_messages = timings.iter_timed("retrieve", commit_messages)
+
             _handle_multiple_commit_messages(
                 commit_messages,
                 skip_detail=args.skip_detail,
                 hide_input=args.hide_input,
+                jobs=args.jobs,
+                cache=cache,
+                commits=pending_commits,
             )
+        elif args.stdin:
+            console.verbose("commit message source: stdin")
+            _handle_stdin(args, cache)
         else:
             console.verbose("commit message source: direct message")
             commit_message = args.commit_message.strip()
             _handle_commit_message(
-                commit_message, skip_detail=args.skip_detail, hide_input=args.hide_input
+                commit_message,
+                skip_detail=args.skip_detail,
+                hide_input=args.hide_input,
+                cache=cache,
             )
     except CommitlintException as ex:
         console.error(f"{ex}")
         sys.exit(1)
 
     except FileNotFoundError:
-        console.error(f"Error: file '{args.file}' not found")
+        console.error(f"Error: file '{args.file or args.hash_file}' not found")
         sys.exit(1)
 
+    finally:
+        if cache is not None:
+            cache.prune()
+
+        if timings is not None:
+            console.report(timings.render(args.timings_format))
+
 
 if __name__ == "__main__":
     main()  # pragma: no cover
@@ -0,0 +1,205 @@
+"""
+commitlint-client: thin client of the commitlint daemon (`commitlint --serve`).
+
+The client takes the same arguments as `commitlint` and forwards them to a warm
+daemon listening on a Unix domain socket in the `.git` directory, so a
+commit-msg hook doesn't pay for importing and compiling the linter on every
+commit. It only imports the few standard library modules it needs.
+
+When no daemon is running, the commit message is linted in-process, and a
+daemon is started in the background for the next calls.
+
+Usage:
+    commitlint-client --file .git/COMMIT_EDITMSG
+"""
+
+import json
+import os
+import socket
+import stat
+import sys
+from typing import Any, Dict, List, Optional
+
+from .__version__ import __version__
+from .git_dir import find_git_dir
+
+SOCKET_NAME = "commitlint.sock"
+
+# the path of a Unix domain socket is limited to about 100 bytes on most systems
+MAX_SOCKET_PATH_LENGTH = 100
+
+CONNECT_TIMEOUT = 1.0
+RESPONSE_TIMEOUT = 60.0
+
+# disables starting the daemon from the client when set to "0"
+DAEMON_AUTOSTART_ENV = "COMMITLINT_DAEMON_AUTOSTART"
+
+
+def get_runtime_dir() -> str:
+    """
+    Returns the per-user directory of the daemon sockets that don't fit in the
+    `.git` directory.
+
+    The directory is created by the daemon, private to the user (mode 0700), so
+    other local users can't create a socket in it.
+
+    Returns:
+        str: The path of the directory, in the temporary directory.
+    """
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+
+    user = os.getuid() if hasattr(os, "getuid") else "user"
+    return os.path.join(tempfile.gettempdir(), f"commitlint-{user}")
+
+
+def get_socket_path(git_dir: str) -> str:
+    """
+    Returns the path of the daemon socket of a repository.
+
+    The socket is placed in the `.git` directory, or in the per-user runtime
+    directory if that path is too long for a Unix domain socket.
+
+    Args:
+        git_dir (str): The absolute path of the common `.git` directory.
+
+    Returns:
+        str: The path of the daemon socket.
+    """
+    socket_path = os.path.join(git_dir, SOCKET_NAME)
+    if len(socket_path.encode()) <= MAX_SOCKET_PATH_LENGTH:
+        return socket_path
+
+    # pylint: disable=import-outside-toplevel
+    import hashlib
+
+    digest = hashlib.sha256(git_dir.encode()).hexdigest()[:16]
+    return os.path.join(get_runtime_dir(), f"commitlint-{digest}.sock")
+
+
+def is_trusted_socket(socket_path: str) -> bool:
+    """
+    Checks that the daemon socket belongs to the current user, so another local
+    user can't answer the lint requests with forged results.
+
+    Args:
+        socket_path (str): The path of the daemon socket.
+
+    Returns:
+        bool: True if the path is a socket owned by the current user.
+    """
+    try:
+        info = os.lstat(socket_path)
+    except OSError:
+        return False
+
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+def request_daemon(socket_path: str, argv: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Sends the arguments to the daemon and returns its response.
+
+    Args:
+        socket_path (str): The path of the daemon socket.
+        argv (List[str]): The `commitlint` arguments.
+
+    Returns:
+        Optional[Dict[str, Any]]: The response with the exit code and the output,
+            or None if the daemon isn't available or can't handle the request.
+    """
+    if not hasattr(socket, "AF_UNIX") or not is_trusted_socket(socket_path):
+        return None
+
+    request = {
+        "version": __version__,
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": {
+            name: value for name, value in os.environ.items() if name.startswith("GIT_")
+        },
+    }
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(CONNECT_TIMEOUT)
+            client.connect(socket_path)
+            client.settimeout(RESPONSE_TIMEOUT)
+            client.sendall(json.dumps(request).encode("utf-8"))
+            client.shutdown(socket.SHUT_WR)
+
+            chunks = []
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+
+        response: Dict[str, Any] = json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+
+    if "error" in response:
+        return None
+
+    return response
+
+
+def start_daemon(cwd: str) -> None:
+    """
+    Starts a daemon for the repository in the background.
+
+    Args:
+        cwd (str): The working directory of the daemon, inside the repository.
+    """
+    # pylint: disable=import-outside-toplevel, consider-using-with
+    import subprocess
+
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "commitlint.cli", "--serve"],
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def main() -> None:
+    """
+    Main function of the client, linting through the daemon when available.
+    """
+    argv = sys.argv[1:]
+    cwd = os.getcwd()
+
+    # the stdin of the client isn't forwarded to the daemon (the options can't be
+    # abbreviated, see `commitlint.cli.get_args`)
+    reads_stdin = (
+        "--stdin" in argv
+        or "--hash-file=-" in argv
+        or any(
+            arg == "--hash-file" and value == "-" for arg, value in zip(argv, argv[1:])
+        )
+    )
+    git_dir = None if reads_stdin else find_git_dir(cwd)
+    if git_dir is not None:
+        response = request_daemon(get_socket_path(git_dir), argv)
+        if response is not None:
+            sys.stdout.write(response["stdout"])
+            sys.stderr.write(response["stderr"])
+            sys.exit(response["exit_code"])
+
+        if os.environ.get(DAEMON_AUTOSTART_ENV) != "0" and hasattr(socket, "AF_UNIX"):
+            start_daemon(cwd)
+
+    # pylint: disable=import-outside-toplevel
+    from .cli import main as cli_main
+
+    cli_main(argv)
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
@@ -0,0 +1,154 @@
+"""
+This module contains the commits and the range filters shared by the git
+backends, and the parsers of the raw git commit objects.
+
+It's kept apart from `git_objects`, so `git_helpers`, the default backend,
+doesn't import the pure-Python reader of the object database.
+"""
+
+import codecs
+from typing import NamedTuple, Optional, Tuple
+
+
+class RangeFilters(NamedTuple):
+    """
+    Filters of the commits of a range, applied while the range is walked so the
+    filtered out commits are never read, decoded or linted.
+
+    Attributes:
+        no_merges (bool): Skip the commits with more than one parent.
+        first_parent (bool): Follow only the first parent of merge commits.
+        author (Optional[str]): Only the commits whose author matches this regular
+            expression.
+        since (Optional[str]): Only the commits more recent than this date, in
+            any format understood by `git log --since`.
+        max_count (Optional[int]): Only the given number of most recent commits.
+        paths (Tuple[str, ...]): Only the commits modifying these pathspecs.
+    """
+
+    no_merges: bool = False
+    first_parent: bool = False
+    author: Optional[str] = None
+    since: Optional[str] = None
+    max_count: Optional[int] = None
+    paths: Tuple[str, ...] = ()
+
+
+class Commit(NamedTuple):
+    """
+    A commit, with the metadata shown along its lint errors.
+
+    Attributes:
+        hash (str): The full hash of the commit.
+        author (str): The author of the commit, as "<name> <<email>>".
+        date (str): The author date, in the strict ISO 8601 format.
+        message (str): The commit message.
+    """
+
+    hash: str
+    author: str
+    date: str
+    message: str
+
+
+def parse_commit_message(commit_object: bytes) -> str:
+    """
+    Extract the commit message from the raw content of a git commit object.
+
+    The message follows the headers of the object after the first empty line,
+    and is decoded with the encoding of its `encoding` header, UTF-8 by default.
+
+    Args:
+        commit_object (bytes): The content of the commit object, as printed by
+            `git cat-file commit`.
+
+    Returns:
+        str: The stripped commit message.
+    """
+    headers, separator, message = commit_object.partition(b"\n\n")
+    if not separator:
+        return ""
+
+    return message.decode(_get_encoding(headers), errors="replace").strip()
+
+
+def _get_encoding(headers: bytes) -> str:
+    """Returns the encoding of the message given by the headers of a commit."""
+    encoding = "utf-8"
+    for header in headers.split(b"\n"):
+        if header.startswith(b"encoding "):
+            encoding = header[len(b"encoding ") :].decode("ascii", errors="replace")
+            break
+
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        encoding = "utf-8"
+
+    return encoding
+
+
+def _get_author(commit_object: bytes) -> bytes:
+    """Returns the author of a commit, as "<name> <<email>> <timestamp> <tz>"."""
+    headers = commit_object.partition(b"\n\n")[0]
+    for header in headers.split(b"\n"):
+        if header.startswith(b"author "):
+            return header[len(b"author ") :]
+
+    return b""
+
+
+def _get_author_ident(author: bytes) -> bytes:
+    """Returns the "<name> <<email>>" of an author, without its date."""
+    return author[: author.rfind(b">") + 1]
+
+
+def get_commit_author_ident(commit_object: bytes) -> bytes:
+    """
+    Extract the author of a commit from the raw content of its object, as
+    "<name> <<email>>" without its date, as matched by `git log --author`.
+
+    Args:
+        commit_object (bytes): The content of the commit object, as printed by
+            `git cat-file commit`.
+
+    Returns:
+        bytes: The undecoded author.
+    """
+    return _get_author_ident(_get_author(commit_object))
+
+
+def parse_commit_author(commit_object: bytes) -> Tuple[str, str]:
+    """
+    Extract the author of a commit from the raw content of its object, as the
+    `%an <%ae>` and `%aI` placeholders of `git log`.
+
+    Args:
+        commit_object (bytes): The content of the commit object, as printed by
+            `git cat-file commit`.
+
+    Returns:
+        Tuple[str, str]: The author as "<name> <<email>>", and the author date in
+            the strict ISO 8601 format, or an empty string if it's invalid.
+    """
+    # pylint: disable=import-outside-toplevel
+    from datetime import datetime, timedelta, timezone
+
+    author = _get_author(commit_object)
+    name_end = len(_get_author_ident(author))
+    encoding = _get_encoding(commit_object.partition(b"\n\n")[0])
+    name = author[:name_end].decode(encoding, errors="replace")
+
+    try:
+        timestamp, timezone_offset = author[name_end:].split()
+        offset = int(timezone_offset)
+        sign = -1 if offset < 0 else 1
+        offset = abs(offset)
+        date = datetime.fromtimestamp(
+            int(timestamp),
+            timezone(sign * timedelta(hours=offset // 100, minutes=offset % 100)),
+        ).isoformat()
+    except (ValueError, OverflowError, OSError):
+        date = ""
+
+    return name, date
@@ -4,6 +4,8 @@ Contains config for the commitlint.
 
 from typing import Optional
 
+from .timings import Timings
+
 
 class _CommitlintConfig:
     """
@@ -14,6 +16,7 @@ class _CommitlintConfig:
 
     _verbose: bool = False
     _quiet: bool = False
+    _timings: Optional[Timings] = None
 
     def __new__(cls) -> "_CommitlintConfig":
         """
@@ -70,6 +73,27 @@ class _CommitlintConfig:
 
         self._quiet = value
 
+    @property
+    def timings(self) -> Optional[Timings]:
+        """
+        Get the current timings recorder.
+
+        Returns:
+            Optional[Timings]: The timings recorder, or None if timings are disabled.
+        """
+        return self._timings
+
+    @timings.setter
+    def timings(self, value: Optional[Timings]) -> None:
+        """
+        Set the timings recorder.
+
+        Args:
+            value (Optional[Timings]): New timings recorder, or None to disable
+                timings.
+        """
+        self._timings = value
+
 
 config = _CommitlintConfig()
 
@@ -8,9 +8,12 @@ TODO: Add color on success and error (#5).
 """
 
 import sys
+from typing import Callable, Union
 
 from .config import config
 
+Message = Union[str, Callable[[], str]]
+
 
 def success(message: str) -> None:
     """
@@ -38,14 +41,64 @@ def error(message: str) -> None:
     sys.stderr.write(f"{message}\n")
 
 
-def verbose(message: str) -> None:
+def report(message: str) -> None:
+    """
+    Print a report explicitly requested by an option, e.g. `--timings`.
+
+    The report is printed to stderr even in quiet mode, so it doesn't mix with
+    the lint output.
+
+    Args:
+        message (str): The report to print.
+    """
+    sys.stderr.write(f"{message}\n")
+
+
+def verbose(message: Message, *args: object) -> None:
     """
     Print a verbose message if in verbose mode.
 
+    The message is only formatted in verbose mode, so the callers don't pay the
+    formatting cost otherwise. It can be a callable returning the message, or a
+    `%`-style format string with its arguments.
+
     Args:
-        message (str): The verbose message to print.
+        message (Union[str, Callable[[], str]]): The verbose message to print, or a
+            callable returning it.
+        *args (object): The arguments for the `%`-style format of the message.
+
+    Example:
+        ```python
+        console.verbose("running validator %s", validator_name)
+        console.verbose(lambda: stderr.decode("utf-8"))
+        ```
     """
     if not config.verbose:
         return
 
+    if callable(message):
+        message = message()
+
+    if args:
+        message = message % args
+
     sys.stdout.write(f"{message}\n")
+
+
+def verbose_block(*chunks: str) -> None:
+    """
+    Print large verbose payloads if in verbose mode, one line per chunk.
+
+    The chunks are written one after another instead of being concatenated, so
+    large payloads (e.g. commit messages) are streamed to the output as is.
+
+    Args:
+        *chunks (str): The chunks to print, each followed by a line break.
+    """
+    if not config.verbose:
+        return
+
+    write = sys.stdout.write
+    for chunk in chunks:
+        write(chunk)
+        write("\n")
@@ -2,6 +2,12 @@
 
 COMMIT_HEADER_MAX_LENGTH = 72
 
+# seconds without requests before the daemon (`commitlint --serve`) shuts down
+DEFAULT_IDLE_TIMEOUT = 600.0
+
+# ways of reading the commits: running git, or reading the `.git` directory
+GIT_BACKENDS = ("git", "python")
+
 COMMIT_TYPES = (
     "build",
     "ci",
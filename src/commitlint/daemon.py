@@ -0,0 +1,259 @@
+"""
+This module provides the commitlint daemon (`commitlint --serve`).
+
+The daemon listens on a Unix domain socket in the `.git` directory, or in a
+per-user runtime directory if that path is too long, and runs the `commitlint`
+arguments sent by `commitlint-client` in its own warm process, where the linter
+is already imported and its patterns compiled. Requests are handled one at a
+time, and the daemon shuts down after being idle for a while.
+
+Each request is a JSON object with the client version, the arguments, the
+working directory and the `GIT_*` environment variables. The response is a
+JSON object with the exit code and the output, or with an error if the request
+can't be handled, in which case the client lints in-process.
+"""
+
+import io
+import json
+import os
+import socket
+import stat
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any, Callable, Dict, List
+
+from . import console
+from .__version__ import __version__
+from .client import get_runtime_dir
+from .constants import DEFAULT_IDLE_TIMEOUT
+from .exceptions import CommitlintException
+
+REQUEST_TIMEOUT = 10.0
+MAX_REQUEST_SIZE = 1024 * 1024
+
+
+def _run_request(
+    request: Dict[str, Any], run_cli: Callable[[List[str]], None]
+) -> Dict[str, Any]:
+    """
+    Runs the `commitlint` arguments of a request, capturing the output.
+
+    The working directory and the `GIT_*` environment variables of the client
+    are applied while the request runs.
+
+    Args:
+        request (Dict[str, Any]): The request of the client.
+        run_cli (Callable[[List[str]], None]): Runs `commitlint` with the given
+            arguments.
+
+    Returns:
+        Dict[str, Any]: The response with the exit code and the output.
+    """
+    argv = [str(arg) for arg in request["argv"]]
+    if "--serve" in argv:
+        return {"error": "the daemon can't serve requests to serve"}
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+
+    saved_cwd = os.getcwd()
+    saved_env = {
+        name: value for name, value in os.environ.items() if name.startswith("GIT_")
+    }
+    try:
+        os.chdir(request["cwd"])
+        for name in saved_env:
+            del os.environ[name]
+        os.environ.update(request.get("env", {}))
+
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                run_cli(argv)
+            except SystemExit as ex:
+                if isinstance(ex.code, int):
+                    exit_code = ex.code
+                elif ex.code is not None:
+                    stderr.write(f"{ex.code}\n")
+                    exit_code = 1
+    finally:
+        for name in [name for name in os.environ if name.startswith("GIT_")]:
+            del os.environ[name]
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+    return {
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def _handle_connection(
+    connection: socket.socket, run_cli: Callable[[List[str]], None]
+) -> bool:
+    """
+    Reads a request from the connection and sends its response.
+
+    Args:
+        connection (socket.socket): The accepted client connection.
+        run_cli (Callable[[List[str]], None]): Runs `commitlint` with the given
+            arguments.
+
+    Returns:
+        bool: Whether the daemon should keep serving, False on a version mismatch.
+    """
+    connection.settimeout(REQUEST_TIMEOUT)
+    chunks = []
+    size = 0
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+
+        size += len(chunk)
+        if size > MAX_REQUEST_SIZE:
+            connection.sendall(json.dumps({"error": "request too large"}).encode())
+            return True
+
+        chunks.append(chunk)
+
+    try:
+        request = json.loads(b"".join(chunks))
+    except ValueError:
+        request = None
+
+    keep_serving = True
+    if not isinstance(request, dict):
+        response: Dict[str, Any] = {"error": "invalid request"}
+    elif request.get("version") != __version__:
+        # a client of another version starts its own daemon once this one is gone
+        response = {"error": f"version mismatch, the daemon runs {__version__}"}
+        keep_serving = False
+    else:
+        try:
+            response = _run_request(request, run_cli)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # the client lints in-process instead
+            response = {"error": traceback.format_exc()}
+
+    connection.sendall(json.dumps(response).encode("utf-8"))
+    return keep_serving
+
+
+def _ensure_private_dir(directory: str) -> None:
+    """
+    Creates the per-user runtime directory, or checks that it is private.
+
+    Raises:
+        CommitlintException: If the directory can't be created, or if it isn't a
+            directory owned by the current user and inaccessible to others.
+    """
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    except OSError as ex:
+        raise CommitlintException(
+            f"Unable to create {directory}: {ex.strerror}"
+        ) from None
+
+    info = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise CommitlintException(
+            f"{directory} isn't a directory private to the current user"
+        )
+
+
+def _bind(socket_path: str) -> socket.socket:
+    """
+    Binds the daemon socket, replacing a stale socket file.
+
+    Raises:
+        CommitlintException: If another daemon is already serving the socket, or
+            if the runtime directory of the socket isn't private.
+    """
+    if os.path.dirname(socket_path) == get_runtime_dir():
+        _ensure_private_dir(os.path.dirname(socket_path))
+
+    if os.path.exists(socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+            except OSError:
+                # left behind by a daemon that didn't shut down cleanly
+                os.remove(socket_path)
+            else:
+                raise CommitlintException(
+                    f"A commitlint daemon is already running on {socket_path}"
+                )
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # the socket is created with mode 0600, only the user can connect to it
+    umask = os.umask(0o177)
+    try:
+        server.bind(socket_path)
+    except OSError as ex:
+        server.close()
+        raise CommitlintException(
+            f"Unable to listen on {socket_path}: {ex.strerror}"
+        ) from None
+    finally:
+        os.umask(umask)
+
+    server.listen()
+    return server
+
+
+def serve(
+    socket_path: str,
+    run_cli: Callable[[List[str]], None],
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+) -> None:
+    """
+    Serves lint requests on a Unix domain socket until idle for `idle_timeout`.
+
+    Args:
+        socket_path (str): The path of the socket to listen on.
+        run_cli (Callable[[List[str]], None]): Runs `commitlint` with the given
+            arguments.
+        idle_timeout (float, optional): Seconds without requests before shutting
+            down (default is DEFAULT_IDLE_TIMEOUT).
+
+    Raises:
+        CommitlintException: If Unix domain sockets aren't supported, or if the
+            socket can't be listened on.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise CommitlintException("The daemon requires Unix domain sockets")
+
+    server = _bind(socket_path)
+    console.verbose("serving on %s", socket_path)
+    try:
+        server.settimeout(idle_timeout)
+        while True:
+            try:
+                connection, _ = server.accept()
+            except socket.timeout:
+                console.verbose("idle for %s seconds, shutting down", idle_timeout)
+                return
+
+            with connection:
+                try:
+                    keep_serving = _handle_connection(connection, run_cli)
+                except OSError as ex:
+                    console.verbose("unable to handle the request: %s", ex)
+                    keep_serving = True
+
+            if not keep_serving:
+                console.verbose("client version mismatch, shutting down")
+                return
+    finally:
+        server.close()
+        try:
+            os.remove(socket_path)
+        except OSError:
+            pass
@@ -0,0 +1,62 @@
+"""
+This module finds the `.git` directory of a repository without running git.
+
+It only depends on the standard library, so it can be imported by the daemon
+client and by the pure-Python git backend alike.
+"""
+
+import os
+from typing import Optional
+
+
+def find_git_dir(cwd: str, common: bool = True) -> Optional[str]:
+    """
+    Finds the common `.git` directory of the repository, without running git.
+
+    The `GIT_DIR` environment variable is used if set, e.g. in git hooks.
+    Otherwise, the parent directories are searched for `.git`, following the
+    `gitdir:` file of worktrees and submodules.
+
+    Args:
+        cwd (str): The directory to start from.
+        common (bool, optional): Whether to return the `.git` directory shared by
+            all the worktrees, rather than the one of the current worktree, which
+            holds its `HEAD` (default is True).
+
+    Returns:
+        Optional[str]: The absolute path of the `.git` directory, or None if the
+            directory is not inside a git repository.
+    """
+    git_dir = os.environ.get("GIT_DIR")
+    if git_dir:
+        git_dir = os.path.join(cwd, git_dir)
+    else:
+        directory = os.path.abspath(cwd)
+        while True:
+            candidate = os.path.join(directory, ".git")
+            if os.path.exists(candidate):
+                git_dir = candidate
+                break
+
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return None
+
+            directory = parent
+
+        if os.path.isfile(git_dir):
+            with open(git_dir, encoding="utf-8") as git_file:
+                content = git_file.read().strip()
+
+            if not content.startswith("gitdir:"):
+                return None
+
+            git_dir = os.path.join(directory, content[len("gitdir:") :].strip())
+
+    # worktrees share the `.git` directory of the main repository
+    commondir_path = os.path.join(git_dir, "commondir")
+    if common and os.path.isfile(commondir_path):
+        with open(commondir_path, encoding="utf-8") as commondir_file:
+            git_dir = os.path.join(git_dir, commondir_file.read().strip())
+
+    return os.path.abspath(git_dir)
@@ -2,11 +2,114 @@
 This module contains the git related helper functions.
 """
 
+import os
 import subprocess
-from typing import List
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, cast
 
 from . import console
-from .exceptions import GitCommitNotFoundException, GitInvalidCommitRangeException
+from .exceptions import (
+    GitCommitNotFoundException,
+    GitException,
+    GitInvalidCommitRangeException,
+)
+from .commits import Commit, RangeFilters, parse_commit_author, parse_commit_message
+from .streams import iter_commit_messages
+
+# the metadata of the commits, preceding their message in the `git log` format,
+# separated by the ASCII unit separator
+COMMIT_METADATA_SEPARATOR = "\x1f"
+COMMIT_METADATA_FORMAT = "%H%x1f%an <%ae>%x1f%aI%x1f"
+
+
+def get_git_dir() -> str:
+    """
+    Retrieve the absolute path of the `.git` directory of the current repository.
+
+    For linked worktrees, the directory shared by all the worktrees is returned.
+
+    Returns:
+        str: The absolute path of the `.git` directory.
+
+    Raises:
+        GitException: If the current directory is not inside a Git repository.
+    """
+    try:
+        git_dir = subprocess.check_output(
+            ["git", "rev-parse", "--git-common-dir"],
+            text=True,
+            stderr=subprocess.PIPE,
+        ).strip()
+    except subprocess.CalledProcessError as ex:
+        console.verbose("%s: %s", ex.__class__.__name__, ex)
+        raise GitException("Not inside a git repository") from None
+
+    return os.path.abspath(git_dir)
+
+
+def has_complete_history(*commit_hashes: str) -> bool:
+    """
+    Check whether the commits and all of their history are available locally.
+
+    A shallow clone, e.g. the default `actions/checkout` with `fetch-depth: 1`,
+    doesn't have the complete history, so a range can't be listed reliably.
+
+    Args:
+        *commit_hashes (str): The Git commit hashes to check.
+
+    Returns:
+        bool: True if the current directory is inside a complete (non-shallow)
+            repository containing all the commits, False otherwise.
+    """
+    commands = [["git", "rev-parse", "--is-shallow-repository"]]
+    commands.extend(
+        ["git", "cat-file", "-e", f"{commit_hash}^{{commit}}"]
+        for commit_hash in commit_hashes
+    )
+
+    for command in commands:
+        try:
+            output = subprocess.check_output(
+                command, text=True, stderr=subprocess.PIPE
+            ).strip()
+        except (subprocess.CalledProcessError, OSError) as ex:
+            console.verbose("%s: %s", ex.__class__.__name__, ex)
+            return False
+
+        if output == "true":
+            console.verbose("the repository is a shallow clone")
+            return False
+
+    return True
+
+
+def get_merge_base(first_hash: str, second_hash: str) -> str:
+    """
+    Retrieve the best common ancestor of two Git commits.
+
+    Args:
+        first_hash (str): The first Git commit hash or branch.
+        second_hash (str): The second Git commit hash or branch.
+
+    Returns:
+        str: The hash of the merge base of the two commits.
+
+    Raises:
+        GitException: If the commits have no common ancestor, or if they can't
+            be found.
+    """
+    try:
+        merge_base = subprocess.check_output(
+            ["git", "merge-base", first_hash, second_hash],
+            text=True,
+            stderr=subprocess.PIPE,
+        ).strip()
+    except subprocess.CalledProcessError as ex:
+        console.verbose("%s: %s", ex.__class__.__name__, ex)
+        raise GitException(
+            f"No merge base found for {first_hash} and {second_hash}"
+        ) from None
+
+    return merge_base
 
 
 def get_commit_message_of_hash(commit_hash: str) -> str:
@@ -24,10 +127,10 @@ def get_commit_message_of_hash(commit_hash: str) -> str:
         GitCommitNotFoundException: If the specified commit hash is not found
             or if there is an error retrieving the commit message.
     """
-    console.verbose(f"fetching commit message from hash {commit_hash}")
+    console.verbose("fetching commit message from hash %s", commit_hash)
     try:
         # Run 'git show --format=%B -s' command to get the commit message
-        console.verbose(f"executing: git show --format=%B -s {commit_hash}")
+        console.verbose("executing: git show --format=%%B -s %s", commit_hash)
         commit_message = subprocess.check_output(
             ["git", "show", "--format=%B", "-s", commit_hash],
             text=True,
@@ -39,71 +142,359 @@ def get_commit_message_of_hash(commit_hash: str) -> str:
         return commit_message
     except subprocess.CalledProcessError as ex:
         console.verbose("unable to fetch commit message using git command")
-        console.verbose(f"{ex.__class__.__name__}: {ex}")
+        console.verbose("%s: %s", ex.__class__.__name__, ex)
         raise GitCommitNotFoundException(
             f"Failed to retrieve commit message for hash {commit_hash}"
         ) from None
 
 
+def _get_filter_args(filters: RangeFilters) -> List[str]:
+    """Returns the `git log` options of the range filters, before the revisions."""
+    args = []
+    if filters.no_merges:
+        args.append("--no-merges")
+    if filters.first_parent:
+        args.append("--first-parent")
+    if filters.author is not None:
+        args.append(f"--author={filters.author}")
+    if filters.since is not None:
+        args.append(f"--since={filters.since}")
+    if filters.max_count is not None:
+        args.append(f"--max-count={filters.max_count}")
+
+    return args
+
+
 def get_commit_messages_of_hash_range(
-    from_hash: str, to_hash: str = "HEAD"
-) -> List[str]:
+    from_hash: str,
+    to_hash: str = "HEAD",
+    filters: Optional[RangeFilters] = None,
+    include_from_hash: bool = True,
+) -> Iterator[str]:
     """
-    Retrieve an array of commit messages for a range of Git commit hashes.
+    Lazily retrieve the commit messages for a range of Git commit hashes.
+
+    The messages are read from a single NUL-delimited `git log` process and are
+    yielded as soon as git produces them, oldest commit first. The commit of
+    `from_hash` itself is included in the range, unless `include_from_hash` is
+    False, e.g. for the commits of a pull request, `base..head`.
 
-    Note:
-        This function will not support initial commit as from_hash.
+    The filters are passed to `git log`, so the commits filtered out are never
+    sent, decoded or linted.
 
     Args:
         from_hash (str): The starting Git commit hash.
         to_hash (str, optional): The ending Git commit hash or branch
             (default is "HEAD").
+        filters (Optional[RangeFilters], optional): The filters of the commits
+            (default is None, i.e. all the commits).
+        include_from_hash (bool, optional): Whether the commit of `from_hash` is
+            part of the range (default is True).
 
-    Returns:
-        List[str]: A list of commit messages for the specified commit range.
+    Yields:
+        str: The commit messages for the specified commit range.
 
     Raises:
-        GitCommitNotFoundException: If the commit hash of `from_hash` is not found
-            or if there is an error retrieving the commit message.
+        GitInvalidCommitRangeException: If the commit range of from_hash..to_hash is not
+            found or if there is an error retrieving the commit messages.
+    """
+    console.verbose(
+        "fetching commit messages from hash range, from: %s, to: %s",
+        from_hash,
+        to_hash,
+    )
+    yield from _iter_git_log(
+        from_hash,
+        to_hash,
+        "%B",
+        filters or RangeFilters(),
+        include_from_hash,
+    )
+
+
+def get_commits_of_hash_range(
+    from_hash: str,
+    to_hash: str = "HEAD",
+    filters: Optional[RangeFilters] = None,
+) -> Iterator[Commit]:
+    """
+    Lazily retrieve the commits of a range with their hash, author and date.
+
+    Like `get_commit_messages_of_hash_range`, the commits are read from a single
+    `git log` process, the metadata being added to the format of the messages,
+    so a lint error can be mapped back to its commit without running git again.
 
+    Args:
+        from_hash (str): The starting Git commit hash.
+        to_hash (str, optional): The ending Git commit hash or branch
+            (default is "HEAD").
+        filters (Optional[RangeFilters], optional): The filters of the commits
+            (default is None, i.e. all the commits).
+
+    Yields:
+        Commit: The commits of the specified commit range, oldest first.
+
+    Raises:
         GitInvalidCommitRangeException: If the commit range of from_hash..to_hash is not
-            found or if there is an error retrieving the commit message.
+            found or if there is an error retrieving the commits.
     """
-    # as the commit range doesn't support initial commit hash,
-    # commit message of `from_hash` is taken separately
     console.verbose(
-        f"fetching commit messages from hash range, from: {from_hash}, to: {to_hash}"
+        "fetching commits from hash range, from: %s, to: %s", from_hash, to_hash
+    )
+    records = _iter_git_log(
+        from_hash,
+        to_hash,
+        COMMIT_METADATA_FORMAT + "%B",
+        filters or RangeFilters(),
     )
-    from_commit_message = get_commit_message_of_hash(from_hash)
+    for record in records:
+        # the unit separator after an empty message is stripped with the record
+        fields_of_record = record.split(COMMIT_METADATA_SEPARATOR, 3)
+        if len(fields_of_record) < 4:
+            continue
 
-    try:
-        # Runs the below git command:
-        # git log --format=%B --reverse FROM_HASH..TO_HASH
-        # This outputs the commit messages excluding of FROM_HASH
-        delimiter = "========commit-delimiter========"
-        hash_range = f"{from_hash}..{to_hash}"
-
-        console.verbose(
-            f"executing: git log --format=%B{delimiter} --reverse {hash_range}"
-        )
-        commit_messages_output = subprocess.check_output(
-            ["git", "log", f"--format=%B{delimiter}", "--reverse", hash_range],
-            text=True,
-            stderr=subprocess.PIPE,
-        )
-        console.verbose(commit_messages_output)
-        console.verbose("execute complete")
+        commit_hash, author, date, commit_message = fields_of_record
+        commit_message = commit_message.strip()
+        if commit_message:
+            yield Commit(commit_hash, author, date, commit_message)
 
-        commit_messages = commit_messages_output.split(f"{delimiter}\n")
-        return [from_commit_message] + [
-            commit_message.strip()
-            for commit_message in commit_messages
-            if commit_message.strip()
-        ]
-    except subprocess.CalledProcessError as ex:
+
+def _iter_git_log(
+    from_hash: str,
+    to_hash: str,
+    log_format: str,
+    filters: RangeFilters,
+    include_from_hash: bool = True,
+) -> Iterator[str]:
+    """
+    Yields the stripped, non-empty records of the commits of a range, formatted
+    by a single NUL-delimited `git log` process.
+
+    Raises:
+        GitInvalidCommitRangeException: If git fails to list the range.
+    """
+    # Commits reachable from `to_hash` but not from any parent of `from_hash`,
+    # i.e. `from_hash..to_hash` along with `from_hash` itself. This also works
+    # when `from_hash` is the initial commit, as it has no parents.
+    excluded = f"{from_hash}^@" if include_from_hash else from_hash
+    command = [
+        "git",
+        "log",
+        "-z",
+        f"--format={log_format}",
+        "--reverse",
+        *_get_filter_args(filters),
+        to_hash,
+        "--not",
+        excluded,
+        "--",
+        *filters.paths,
+    ]
+    console.verbose(lambda: f"executing: {' '.join(command)}")
+
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+
+    # stderr goes to a file rather than a pipe, so git can't block on writing
+    # many warnings while stdout is being read
+    with (
+        tempfile.TemporaryFile() as stderr,
+        subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr) as process,
+    ):
+        try:
+            stdout = cast(IO[bytes], process.stdout)
+            yield from iter_commit_messages(stdout)
+
+            return_code = process.wait()
+        finally:
+            # the consumer might stop iterating before git finishes
+            if process.poll() is None:
+                process.kill()
+
+        if return_code != 0:
+            stderr.seek(0)
+            error_output = stderr.read()
+
+    if return_code != 0:
         console.verbose("unable to fetch commit messages using git command")
-        console.verbose(f"{ex.__class__.__name__}: {ex}")
+        console.verbose(lambda: error_output.decode("utf-8", errors="replace"))
 
         raise GitInvalidCommitRangeException(
             f"Failed to retrieve commit messages for the range {from_hash} to {to_hash}"
-        ) from None
+        )
+
+    console.verbose("execute complete")
+
+
+class GitCatFileBatch:
+    """
+    Reads commit messages through a single long-lived `git cat-file --batch`
+    process, instead of spawning a git process for every commit.
+
+    The process is started on first use and stopped by `close`, or when used as a
+    context manager.
+
+    Example:
+        ```python
+        with GitCatFileBatch() as batch:
+            for commit_hash in commit_hashes:
+                print(batch.get_commit_message(commit_hash))
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._process: Optional["subprocess.Popen[bytes]"] = None
+
+    def __enter__(self) -> "GitCatFileBatch":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _start(self) -> "subprocess.Popen[bytes]":
+        console.verbose("executing: git cat-file --batch")
+        try:
+            return subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as ex:
+            console.verbose("%s: %s", ex.__class__.__name__, ex)
+            raise GitException("Unable to run git cat-file") from None
+
+    def get_commit_message(self, commit_hash: str) -> str:
+        """
+        Retrieve the commit message of a commit.
+
+        Args:
+            commit_hash (str): The hash of the commit, or any revision naming a
+                commit (tags are peeled to their commit).
+
+        Returns:
+            str: The stripped commit message.
+
+        Raises:
+            GitCommitNotFoundException: If the commit is not found.
+        """
+        console.verbose("fetching commit message from hash %s", commit_hash)
+        return parse_commit_message(self._read_commit(commit_hash)[1])
+
+    def get_commit(self, commit_hash: str) -> Commit:
+        """
+        Retrieve a commit with its full hash, author and date.
+
+        Args:
+            commit_hash (str): The hash of the commit, or any revision naming a
+                commit (tags are peeled to their commit).
+
+        Returns:
+            Commit: The commit, with its stripped commit message.
+
+        Raises:
+            GitCommitNotFoundException: If the commit is not found.
+        """
+        console.verbose("fetching commit from hash %s", commit_hash)
+        oid, commit_object = self._read_commit(commit_hash)
+        author, date = parse_commit_author(commit_object)
+        return Commit(oid, author, date, parse_commit_message(commit_object))
+
+    def _read_commit(self, commit_hash: str) -> Tuple[str, bytes]:
+        """Returns the full hash and the raw content of a commit."""
+        if not commit_hash or any(char.isspace() for char in commit_hash):
+            raise GitCommitNotFoundException(
+                f"Failed to retrieve commit message for hash {commit_hash}"
+            )
+
+        if self._process is None:
+            self._process = self._start()
+
+        stdin = cast(IO[bytes], self._process.stdin)
+        stdout = cast(IO[bytes], self._process.stdout)
+        try:
+            stdin.write(f"{commit_hash}^{{commit}}\n".encode("utf-8"))
+            stdin.flush()
+
+            # "<oid> commit <size>", or "<object> missing" and the like
+            header = stdout.readline().split()
+            if len(header) != 3 or header[1] != b"commit":
+                raise GitCommitNotFoundException(
+                    f"Failed to retrieve commit message for hash {commit_hash}"
+                )
+
+            oid = header[0].decode("ascii")
+            size = int(header[2])
+            commit_object = stdout.read(size + 1)[:size]
+        except (OSError, ValueError) as ex:
+            console.verbose("%s: %s", ex.__class__.__name__, ex)
+            self.close()
+            raise GitException("Unable to read from git cat-file") from None
+
+        if len(commit_object) != size:
+            self.close()
+            raise GitException("Unable to read from git cat-file")
+
+        return oid, commit_object
+
+    def close(self) -> None:
+        """
+        Stops the `git cat-file` process, if started.
+        """
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        try:
+            cast(IO[bytes], process.stdin).close()
+        except OSError:
+            pass
+
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+        cast(IO[bytes], process.stdout).close()
+
+
+def get_commit_messages_of_hashes(commit_hashes: Iterable[str]) -> Iterator[str]:
+    """
+    Lazily retrieve the commit messages of many commits through a single
+    `git cat-file --batch` process.
+
+    Args:
+        commit_hashes (Iterable[str]): The commit hashes, consumed lazily.
+
+    Yields:
+        str: The commit messages, in the order of the hashes.
+
+    Raises:
+        GitCommitNotFoundException: If any of the commits is not found.
+    """
+    with GitCatFileBatch() as batch:
+        for commit_hash in commit_hashes:
+            yield batch.get_commit_message(commit_hash)
+
+
+def get_commits_of_hashes(commit_hashes: Iterable[str]) -> Iterator[Commit]:
+    """
+    Lazily retrieve many commits with their full hash, author and date, through
+    a single `git cat-file --batch` process.
+
+    Like for a range, the hash, author and date are shown along the lint errors
+    of each commit.
+
+    Args:
+        commit_hashes (Iterable[str]): The commit hashes, consumed lazily.
+
+    Yields:
+        Commit: The commits, in the order of the hashes.
+
+    Raises:
+        GitCommitNotFoundException: If any of the commits is not found.
+    """
+    with GitCatFileBatch() as batch:
+        for commit_hash in commit_hashes:
+            yield batch.get_commit(commit_hash)
@@ -0,0 +1,1103 @@
+"""
+This module contains a pure-Python reader of the git object database.
+
+It reads the commit objects directly from the `.git` directory, so commit
+messages can be retrieved without the `git` binary (e.g. in minimal build
+containers) and without the cost of starting git processes. Loose objects and
+pack files (through their `.idx` index, memory mapped) are supported, along with
+the delta compressed objects of the pack files.
+
+The functions mirror the ones of `git_helpers`, and are used by the CLI with
+`--git-backend python`.
+
+Not supported: the reftable ref storage, replace refs and grafts, the revision
+syntax beyond `<ref>`, `<hash>`, `~<n>` and `^<n>` suffixes, and the `since` and
+`paths` range filters.
+"""
+
+import heapq
+import mmap
+import os
+import re
+import zlib
+from itertools import count
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from . import console
+from .commits import (
+    Commit,
+    RangeFilters,
+    get_commit_author_ident,
+    parse_commit_author,
+    parse_commit_message,
+)
+from .exceptions import (
+    GitCommitNotFoundException,
+    GitException,
+    GitInvalidCommitRangeException,
+)
+from .git_dir import find_git_dir
+
+# object types of the pack files
+_OBJECT_TYPES = {1: "commit", 2: "tree", 3: "blob", 4: "tag"}
+_OBJECT_TYPE_CODES = {name: code for code, name in _OBJECT_TYPES.items()}
+_OFS_DELTA = 6
+_REF_DELTA = 7
+
+_PACK_INDEX_V2_MAGIC = b"\377tOc"
+
+# the refs searched for a short name, in the order used by git
+_REF_RULES = (
+    "%s",
+    "refs/%s",
+    "refs/tags/%s",
+    "refs/heads/%s",
+    "refs/remotes/%s",
+    "refs/remotes/%s/HEAD",
+)
+
+# a name followed by `~<n>` and `^<n>` suffixes, as refs can't contain `~` or `^`
+_REVISION_PATTERN = re.compile(r"([^~^]+)((?:[~^]\d*)*)")
+_REVISION_SUFFIX_PATTERN = re.compile(r"([~^])(\d*)")
+
+# number of extra commits walked once only uninteresting commits are left, to
+# cope with commits whose committer date is older than the one of their parents
+_WALK_SLOP = 5
+
+# number of the delta bases kept decompressed
+_DELTA_BASE_CACHE_SIZE = 64
+
+
+def _parse_commit_headers(commit_object: bytes) -> Tuple[List[bytes], int]:
+    """Returns the hex parent hashes and the committer timestamp of a commit."""
+    headers = commit_object.partition(b"\n\n")[0]
+    parents = []
+    timestamp = 0
+    for header in headers.split(b"\n"):
+        if header.startswith(b"parent "):
+            parents.append(header[len(b"parent ") :])
+        elif header.startswith(b"committer "):
+            # "committer <name> <<email>> <timestamp> <timezone>"
+            try:
+                timestamp = int(header.rsplit(b" ", 2)[1])
+            except (IndexError, ValueError):
+                timestamp = 0
+
+    return parents, timestamp
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Reads a little-endian base-128 size of a delta, returns it and the end."""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, pos
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    """
+    Applies a git delta to its base object.
+
+    Raises:
+        GitException: If the delta is corrupt.
+    """
+    source_size, pos = _read_varint(delta, 0)
+    target_size, pos = _read_varint(delta, pos)
+    if source_size != len(base):
+        raise GitException("Corrupt git delta: base size mismatch")
+
+    result = bytearray()
+    end = len(delta)
+    while pos < end:
+        opcode = delta[pos]
+        pos += 1
+        if opcode & 0x80:
+            # copy from the base
+            offset = size = 0
+            for shift in range(4):
+                if opcode & (1 << shift):
+                    offset |= delta[pos] << (8 * shift)
+                    pos += 1
+            for shift in range(3):
+                if opcode & (0x10 << shift):
+                    size |= delta[pos] << (8 * shift)
+                    pos += 1
+            result += base[offset : offset + (size or 0x10000)]
+        elif opcode:
+            # insert the following bytes
+            result += delta[pos : pos + opcode]
+            pos += opcode
+        else:
+            raise GitException("Corrupt git delta: invalid opcode")
+
+    if len(result) != target_size:
+        raise GitException("Corrupt git delta: result size mismatch")
+
+    return bytes(result)
+
+
+def _inflate(data: "mmap.mmap", pos: int, size: int) -> bytes:
+    """Decompresses a zlib stream of the pack, knowing its decompressed size."""
+    # compressed data is rarely bigger than the original, apart from the header,
+    # and the data following the stream is ignored
+    try:
+        result = zlib.decompress(data[pos : pos + size + 64])
+    except zlib.error:
+        # incompressible data, decompressing until the end of the stream
+        decompressor = zlib.decompressobj()
+        chunks = []
+        while not decompressor.eof:
+            chunk = data[pos : pos + 65536]
+            if not chunk:
+                raise GitException("Corrupt git pack: truncated object") from None
+            pos += len(chunk)
+            try:
+                chunks.append(decompressor.decompress(chunk))
+            except zlib.error as ex:
+                raise GitException(f"Corrupt git pack: {ex}") from None
+        result = b"".join(chunks)
+
+    if len(result) != size:
+        raise GitException("Corrupt git pack: object size mismatch")
+
+    return result
+
+
+class _Pack:
+    """A pack file and its memory mapped `.idx` index."""
+
+    __slots__ = ("path", "hash_size", "_index", "_pack", "_version", "_count")
+
+    def __init__(self, index_path: str, hash_size: int) -> None:
+        self.path = index_path
+        self.hash_size = hash_size
+        with open(index_path, "rb") as index_file:
+            self._index = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with open(index_path[: -len(".idx")] + ".pack", "rb") as pack_file:
+                self._pack = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self._index.close()
+            raise
+
+        # version 1 indexes have no header, and interleave offsets and names
+        self._version = 2 if self._index[:4] == _PACK_INDEX_V2_MAGIC else 1
+        self._count = self._fanout(255)
+
+    def close(self) -> None:
+        """Unmaps the pack and its index."""
+        self._index.close()
+        self._pack.close()
+
+    def _fanout(self, byte: int) -> int:
+        """Returns the number of names whose first byte is lower or equal."""
+        start = (8 if self._version == 2 else 0) + byte * 4
+        return int.from_bytes(self._index[start : start + 4], "big")
+
+    def _name(self, position: int) -> bytes:
+        """Returns the binary name of the object at a position of the index."""
+        if self._version == 2:
+            start = 8 + 256 * 4 + position * self.hash_size
+        else:
+            start = 256 * 4 + position * (4 + self.hash_size) + 4
+        return self._index[start : start + self.hash_size]
+
+    def _offset(self, position: int) -> int:
+        """Returns the pack offset of the object at a position of the index."""
+        if self._version == 1:
+            start = 256 * 4 + position * (4 + self.hash_size)
+            return int.from_bytes(self._index[start : start + 4], "big")
+
+        # after the names and their CRC32
+        table_start = 8 + 256 * 4 + self._count * (self.hash_size + 4)
+        start = table_start + position * 4
+        offset = int.from_bytes(self._index[start : start + 4], "big")
+        if offset & 0x80000000:
+            # an index in the following table of 8 bytes offsets
+            start = table_start + self._count * 4 + (offset & 0x7FFFFFFF) * 8
+            offset = int.from_bytes(self._index[start : start + 8], "big")
+
+        return offset
+
+    def _search(self, prefix: bytes) -> int:
+        """Returns the position of the first name not lower than the prefix."""
+        low = self._fanout(prefix[0] - 1) if prefix[0] else 0
+        high = self._fanout(prefix[0])
+        while low < high:
+            middle = (low + high) // 2
+            if self._name(middle) < prefix:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def find(self, oid: bytes) -> Optional[int]:
+        """
+        Finds an object in the pack.
+
+        Args:
+            oid (bytes): The binary name of the object.
+
+        Returns:
+            Optional[int]: The offset of the object in the pack, or None.
+        """
+        position = self._search(oid)
+        if position < self._count and self._name(position) == oid:
+            return self._offset(position)
+        return None
+
+    def find_prefix(self, hex_prefix: str) -> Set[bytes]:
+        """Returns the binary names of the objects starting with a hex prefix."""
+        position = self._search(bytes.fromhex(hex_prefix[: len(hex_prefix) // 2 * 2]))
+        matches = set()
+        while position < self._count:
+            name = self._name(position)
+            if not name.hex().startswith(hex_prefix):
+                break
+            matches.add(name)
+            position += 1
+        return matches
+
+    def read_header(self, offset: int) -> Tuple[int, int, int]:
+        """Returns the type, the size and the data offset of an entry."""
+        pack = self._pack
+        byte = pack[offset]
+        offset += 1
+        object_type = (byte >> 4) & 7
+        size = byte & 0x0F
+        shift = 4
+        while byte & 0x80:
+            byte = pack[offset]
+            offset += 1
+            size |= (byte & 0x7F) << shift
+            shift += 7
+        return object_type, size, offset
+
+    def read_delta_base(
+        self, object_type: int, offset: int
+    ) -> Tuple[Union[int, bytes], int]:
+        """
+        Returns the base of a delta entry, as the distance to its pack offset for
+        `OFS_DELTA` or its binary name for `REF_DELTA`, along with the offset of
+        the delta data.
+        """
+        pack = self._pack
+        if object_type == _REF_DELTA:
+            return pack[offset : offset + self.hash_size], offset + self.hash_size
+
+        byte = pack[offset]
+        offset += 1
+        distance = byte & 0x7F
+        while byte & 0x80:
+            byte = pack[offset]
+            offset += 1
+            distance = ((distance + 1) << 7) | (byte & 0x7F)
+        return distance, offset
+
+    def inflate(self, offset: int, size: int) -> bytes:
+        """Decompresses the data of an entry."""
+        return _inflate(self._pack, offset, size)
+
+
+class GitRepository:
+    """
+    Pure-Python reader of the commits of a git repository.
+
+    Attributes:
+        git_dir (str): The `.git` directory of the worktree, holding its `HEAD`.
+        common_dir (str): The `.git` directory shared by all the worktrees.
+
+    Example:
+        ```python
+        with GitRepository.discover() as repository:
+            for commit_message in repository.iter_commit_messages("v1.0", "HEAD"):
+                print(commit_message)
+        ```
+    """
+
+    def __init__(self, git_dir: str, common_dir: Optional[str] = None) -> None:
+        self.git_dir = os.path.abspath(git_dir)
+        if common_dir is None:
+            common_dir = self.git_dir
+            commondir_path = os.path.join(self.git_dir, "commondir")
+            if os.path.isfile(commondir_path):
+                with open(commondir_path, encoding="utf-8") as commondir_file:
+                    relative_dir = commondir_file.read().strip()
+                common_dir = os.path.join(self.git_dir, relative_dir)
+        self.common_dir = os.path.abspath(common_dir)
+
+        self.hash_size = 20
+        self._read_config()
+
+        self._object_dirs = self._get_object_dirs()
+        self._packs: Optional[List[_Pack]] = None
+        self._packed_refs: Optional[Dict[str, bytes]] = None
+        self._delta_bases: Dict[Tuple[str, int], Tuple[int, bytes]] = {}
+
+    @classmethod
+    def discover(cls, cwd: Optional[str] = None) -> "GitRepository":
+        """
+        Opens the repository containing a directory.
+
+        Args:
+            cwd (Optional[str], optional): The directory (default is None, i.e. the
+                current directory).
+
+        Returns:
+            GitRepository: The repository.
+
+        Raises:
+            GitException: If the directory is not inside a git repository.
+        """
+        git_dir = find_git_dir(cwd or os.getcwd(), common=False)
+        if git_dir is None or not os.path.isdir(git_dir):
+            raise GitException("Not inside a git repository")
+
+        return cls(git_dir)
+
+    def __enter__(self) -> "GitRepository":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmaps the pack files."""
+        for pack in self._packs or ():
+            pack.close()
+        self._packs = None
+        self._delta_bases.clear()
+
+    def _read_config(self) -> None:
+        """Reads the repository format extensions from the config."""
+        config_path = os.path.join(self.common_dir, "config")
+        try:
+            with open(config_path, encoding="utf-8", errors="replace") as config_file:
+                config_text = config_file.read()
+        except OSError:
+            return
+
+        for line in config_text.splitlines():
+            name, _, value = line.strip().partition("=")
+            name, value = name.strip().lower(), value.strip().lower()
+            if name == "objectformat" and value == "sha256":
+                self.hash_size = 32
+            elif name == "refstorage" and value != "files":
+                raise GitException(f"Unsupported git ref storage: {value}")
+
+    def _get_object_dirs(self) -> List[str]:
+        """Returns the object directories, including the alternates."""
+        object_dirs = [os.path.join(self.common_dir, "objects")]
+        alternates_path = os.path.join(object_dirs[0], "info", "alternates")
+        try:
+            with open(alternates_path, encoding="utf-8") as alternates_file:
+                for line in alternates_file:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        object_dirs.append(os.path.join(object_dirs[0], line))
+        except OSError:
+            pass
+        return object_dirs
+
+    def _get_packs(self, rescan: bool = False) -> List[_Pack]:
+        """Returns the pack files, opening them on first use."""
+        if self._packs is not None and not rescan:
+            return self._packs
+
+        known = {pack.path: pack for pack in self._packs or ()}
+        packs = []
+        for object_dir in self._object_dirs:
+            pack_dir = os.path.join(object_dir, "pack")
+            try:
+                names = sorted(os.listdir(pack_dir))
+            except OSError:
+                continue
+
+            for name in names:
+                if not name.endswith(".idx"):
+                    continue
+                index_path = os.path.join(pack_dir, name)
+                if index_path in known:
+                    packs.append(known.pop(index_path))
+                    continue
+                try:
+                    packs.append(_Pack(index_path, self.hash_size))
+                except (OSError, ValueError):
+                    # e.g. a pack being written, or an empty file
+                    console.verbose("unable to open the git pack %s", index_path)
+
+        for pack in known.values():
+            pack.close()
+        self._packs = packs
+        return packs
+
+    def _read_loose_object(self, oid: bytes) -> Optional[Tuple[str, bytes]]:
+        hex_oid = oid.hex()
+        for object_dir in self._object_dirs:
+            path = os.path.join(object_dir, hex_oid[:2], hex_oid[2:])
+            try:
+                with open(path, "rb") as object_file:
+                    data = zlib.decompress(object_file.read())
+            except FileNotFoundError:
+                continue
+            except (OSError, zlib.error) as ex:
+                raise GitException(f"Unable to read the git object {hex_oid}") from ex
+
+            header, _, content = data.partition(b"\0")
+            object_type, _, _ = header.partition(b" ")
+            return object_type.decode("ascii"), content
+        return None
+
+    def _read_packed_object(self, pack: _Pack, offset: int) -> Tuple[int, bytes]:
+        """Reads an entry of a pack, resolving its chain of deltas."""
+        deltas = []
+        base_key: Optional[Tuple[str, int]] = None
+        while True:
+            cached = self._delta_bases.get((pack.path, offset))
+            if cached is not None:
+                object_type, data = cached
+                break
+
+            object_type, size, data_offset = pack.read_header(offset)
+            if object_type in _OBJECT_TYPES:
+                data = pack.inflate(data_offset, size)
+                base_key = (pack.path, offset)
+                break
+
+            if object_type not in (_OFS_DELTA, _REF_DELTA):
+                raise GitException(f"Corrupt git pack: invalid type {object_type}")
+
+            base, data_offset = pack.read_delta_base(object_type, data_offset)
+            deltas.append(pack.inflate(data_offset, size))
+            if isinstance(base, int):
+                offset -= base
+                continue
+
+            base_type, data = self.read_object(base)
+            object_type = _OBJECT_TYPE_CODES[base_type]
+            break
+
+        if deltas:
+            if base_key is not None:
+                # keeping the base of the chain, as other deltas likely share it
+                if len(self._delta_bases) >= _DELTA_BASE_CACHE_SIZE:
+                    self._delta_bases.pop(next(iter(self._delta_bases)))
+                self._delta_bases[base_key] = (object_type, data)
+
+            for delta in reversed(deltas):
+                data = _apply_delta(data, delta)
+
+        return object_type, data
+
+    def read_object(self, oid: bytes) -> Tuple[str, bytes]:
+        """
+        Reads an object of the repository.
+
+        Args:
+            oid (bytes): The binary name of the object.
+
+        Returns:
+            Tuple[str, bytes]: The type ("commit", "tree", "blob" or "tag") and the
+                content of the object.
+
+        Raises:
+            GitException: If the object is not found or can't be read.
+        """
+        for rescan in (False, True):
+            for pack in self._get_packs(rescan):
+                offset = pack.find(oid)
+                if offset is not None:
+                    object_type, data = self._read_packed_object(pack, offset)
+                    return _OBJECT_TYPES[object_type], data
+
+            loose_object = self._read_loose_object(oid)
+            if loose_object is not None:
+                return loose_object
+
+        raise GitException(f"Git object {oid.hex()} not found")
+
+    def _peel_to_commit(self, oid: bytes) -> Tuple[bytes, bytes]:
+        """Follows the tags to a commit, returns its name and content."""
+        for _ in range(64):
+            object_type, data = self.read_object(oid)
+            if object_type == "commit":
+                return oid, data
+            if object_type != "tag" or not data.startswith(b"object "):
+                raise GitException(f"Git object {oid.hex()} is not a commit")
+            oid = bytes.fromhex(data[len(b"object ") : data.index(b"\n")].decode())
+        raise GitException(f"Too many nested tags at {oid.hex()}")
+
+    def _read_packed_refs(self) -> Dict[str, bytes]:
+        if self._packed_refs is None:
+            self._packed_refs = {}
+            path = os.path.join(self.common_dir, "packed-refs")
+            try:
+                with open(path, encoding="utf-8") as packed_refs_file:
+                    for line in packed_refs_file:
+                        if line.startswith(("#", "^")):
+                            continue
+                        hex_oid, _, name = line.strip().partition(" ")
+                        if name:
+                            self._packed_refs[name] = bytes.fromhex(hex_oid)
+            except OSError:
+                pass
+        return self._packed_refs
+
+    def read_ref(self, name: str) -> Optional[bytes]:
+        """
+        Resolves a full ref name, e.g. "HEAD" or "refs/heads/main".
+
+        Args:
+            name (str): The full name of the ref.
+
+        Returns:
+            Optional[bytes]: The binary name of the object, or None if the ref
+                doesn't exist.
+        """
+        for _ in range(10):
+            content = None
+            for directory in (self.git_dir, self.common_dir):
+                try:
+                    with open(os.path.join(directory, name), encoding="utf-8") as ref:
+                        content = ref.read().strip()
+                    break
+                except (OSError, ValueError):
+                    continue
+
+            if content is None:
+                return self._read_packed_refs().get(name)
+
+            if not content.startswith("ref:"):
+                try:
+                    return bytes.fromhex(content)
+                except ValueError:
+                    return None
+
+            # a symbolic ref
+            name = content[len("ref:") :].strip()
+
+        return None
+
+    def _find_prefix(self, hex_prefix: str) -> Set[bytes]:
+        matches = set()
+        for pack in self._get_packs():
+            matches |= pack.find_prefix(hex_prefix)
+        for object_dir in self._object_dirs:
+            try:
+                names = os.listdir(os.path.join(object_dir, hex_prefix[:2]))
+            except OSError:
+                continue
+            matches.update(
+                bytes.fromhex(hex_prefix[:2] + name)
+                for name in names
+                if name.startswith(hex_prefix[2:])
+                and len(name) == self.hash_size * 2 - 2
+            )
+        return matches
+
+    def _resolve_name(self, name: str) -> Optional[bytes]:
+        if name == "@":
+            name = "HEAD"
+
+        if name and ".." not in name:
+            for rule in _REF_RULES:
+                oid = self.read_ref(rule % name)
+                if oid is not None:
+                    return oid
+
+        if 4 <= len(name) <= self.hash_size * 2 and re.fullmatch(r"[0-9a-fA-F]+", name):
+            hex_prefix = name.lower()
+            if len(hex_prefix) == self.hash_size * 2:
+                return bytes.fromhex(hex_prefix)
+
+            matches = self._find_prefix(hex_prefix)
+            if len(matches) > 1:
+                raise GitException(f"Short object id {name} is ambiguous")
+            if matches:
+                return matches.pop()
+
+        return None
+
+    def resolve(self, revision: str) -> bytes:
+        """
+        Resolves a revision to a commit.
+
+        Args:
+            revision (str): A ref, a full or abbreviated hash, optionally followed
+                by `~<n>` and `^<n>` suffixes.
+
+        Returns:
+            bytes: The binary name of the commit.
+
+        Raises:
+            GitCommitNotFoundException: If the revision can't be resolved.
+        """
+        not_found = GitCommitNotFoundException(
+            f"Failed to retrieve commit message for hash {revision}"
+        )
+
+        match = _REVISION_PATTERN.fullmatch(revision)
+        if match is None:
+            raise not_found
+
+        name, suffixes = match.groups()
+        oid = self._resolve_name(name)
+        if oid is None:
+            raise not_found
+
+        try:
+            oid, commit_object = self._peel_to_commit(oid)
+            for operator, number in _REVISION_SUFFIX_PATTERN.findall(suffixes):
+                steps = int(number) if number else 1
+                if operator == "~":
+                    for _ in range(steps):
+                        parents, _ = _parse_commit_headers(commit_object)
+                        if not parents:
+                            raise not_found
+                        oid, commit_object = self._peel_to_commit(
+                            bytes.fromhex(parents[0].decode())
+                        )
+                elif steps:
+                    parents, _ = _parse_commit_headers(commit_object)
+                    if len(parents) < steps:
+                        raise not_found
+                    oid, commit_object = self._peel_to_commit(
+                        bytes.fromhex(parents[steps - 1].decode())
+                    )
+        except GitCommitNotFoundException:
+            raise
+        except GitException as ex:
+            console.verbose("%s: %s", ex.__class__.__name__, ex)
+            raise not_found from None
+
+        return oid
+
+    def get_commit_message(self, revision: str) -> str:
+        """
+        Retrieve the commit message of a commit.
+
+        Args:
+            revision (str): The revision of the commit, see `resolve`.
+
+        Returns:
+            str: The stripped commit message.
+
+        Raises:
+            GitCommitNotFoundException: If the commit is not found.
+        """
+        oid = self.resolve(revision)
+        return parse_commit_message(self._peel_to_commit(oid)[1])
+
+    def get_commit(self, revision: str) -> Commit:
+        """
+        Retrieve a commit with its hash, author and date.
+
+        Args:
+            revision (str): The revision of the commit, see `resolve`.
+
+        Returns:
+            Commit: The commit, with its stripped commit message.
+
+        Raises:
+            GitCommitNotFoundException: If the commit is not found.
+        """
+        oid, commit_object = self._peel_to_commit(self.resolve(revision))
+        author, date = parse_commit_author(commit_object)
+        return Commit(oid.hex(), author, date, parse_commit_message(commit_object))
+
+    def _read_shallow(self) -> Set[bytes]:
+        """Returns the commits of a shallow clone whose parents are missing."""
+        try:
+            with open(os.path.join(self.common_dir, "shallow"), encoding="utf-8") as f:
+                return {bytes.fromhex(line.strip()) for line in f if line.strip()}
+        except OSError:
+            return set()
+
+    def walk(
+        self,
+        include: Iterable[bytes],
+        exclude: Iterable[bytes],
+        first_parent: bool = False,
+    ) -> List[Tuple[bytes, bytes]]:
+        """
+        Walks the commits reachable from `include` but not from `exclude`.
+
+        Like `git rev-list`, the commits are walked from the newest committer date
+        to the oldest, and the walk stops once only commits reachable from
+        `exclude` are left.
+
+        The objects of all the walked commits are returned at once, so the memory
+        usage grows with the size of the range (about the size of the commit
+        objects, e.g. tens of MB for 100k commits). Reading them again one at a
+        time when yielded would keep only their names, but costs about 15% more
+        time on large ranges.
+
+        Args:
+            include (Iterable[bytes]): The binary names of the tip commits.
+            exclude (Iterable[bytes]): The binary names of the excluded commits.
+            first_parent (bool, optional): Whether to follow only the first parent
+                of merge commits (default is False).
+
+        Returns:
+            List[Tuple[bytes, bytes]]: The binary names and the objects of the
+                commits, newest first.
+        """
+        shallow = self._read_shallow()
+        order = count()
+        # binary name -> [uninteresting, parents, commit object]
+        commits: Dict[bytes, list] = {}
+        queue: List[Tuple[int, int, bytes]] = []
+        interesting_in_queue = 0
+
+        def push(oid: bytes, uninteresting: bool) -> None:
+            nonlocal interesting_in_queue
+            state = commits.get(oid)
+            if state is not None:
+                if uninteresting and not state[0]:
+                    mark_uninteresting(oid)
+                return
+
+            oid, commit_object = self._peel_to_commit(oid)
+            parents, timestamp = _parse_commit_headers(commit_object)
+            if oid in shallow:
+                parents = []
+            elif first_parent:
+                parents = parents[:1]
+            commits[oid] = [
+                uninteresting,
+                [bytes.fromhex(parent.decode()) for parent in parents],
+                commit_object,
+            ]
+            heapq.heappush(queue, (-timestamp, next(order), oid))
+            if not uninteresting:
+                interesting_in_queue += 1
+
+        def mark_uninteresting(oid: bytes) -> None:
+            nonlocal interesting_in_queue
+            stack = [oid]
+            while stack:
+                state = commits.get(stack.pop())
+                if state is None or state[0]:
+                    continue
+                state[0] = True
+                if state[2] is not None:
+                    # still in the queue
+                    interesting_in_queue -= 1
+                stack.extend(state[1])
+
+        for oid in exclude:
+            try:
+                push(oid, True)
+            except GitException:
+                # e.g. the missing parents of the first commit of a shallow clone
+                console.verbose("excluded commit %s not found", oid.hex())
+        for oid in include:
+            push(oid, False)
+
+        walked = []
+        slop = _WALK_SLOP
+        while queue:
+            if not interesting_in_queue:
+                slop -= 1
+                if slop < 0:
+                    break
+
+            _, _, oid = heapq.heappop(queue)
+            state = commits[oid]
+            uninteresting, parents, commit_object = state
+            # dropping the content of the walked commits, keeping the message
+            state[2] = None
+            if not uninteresting:
+                interesting_in_queue -= 1
+                walked.append((oid, commit_object))
+
+            for parent in parents:
+                try:
+                    push(parent, uninteresting)
+                except GitException:
+                    if not uninteresting:
+                        raise
+
+        return [
+            (oid, commit_object)
+            for oid, commit_object in walked
+            # excluding the commits found to be uninteresting later in the walk
+            if not commits[oid][0]
+        ]
+
+    def _walk_range(
+        self, from_hash: str, to_hash: str, filters: Optional[RangeFilters]
+    ) -> List[Tuple[bytes, bytes]]:
+        """
+        Walks the commits of `from_hash^@..to_hash` matching the filters.
+
+        Returns:
+            List[Tuple[bytes, bytes]]: The binary names and the objects of the
+                commits, newest first.
+
+        Raises:
+            GitException: If the filters aren't supported or are invalid.
+            GitInvalidCommitRangeException: If the range can't be resolved.
+        """
+        filters = filters or RangeFilters()
+        if filters.since is not None or filters.paths:
+            raise GitException("The since and paths filters require the git backend")
+
+        try:
+            author_pattern = (
+                re.compile(filters.author.encode("utf-8"))
+                if filters.author is not None
+                else None
+            )
+        except re.error as ex:
+            raise GitException(f"Invalid author pattern: {ex}") from None
+
+        try:
+            from_oid = self.resolve(from_hash)
+            to_oid = self.resolve(to_hash)
+            from_parents, _ = _parse_commit_headers(self._peel_to_commit(from_oid)[1])
+            commits = self.walk(
+                [to_oid],
+                [bytes.fromhex(parent.decode()) for parent in from_parents],
+                first_parent=filters.first_parent,
+            )
+        except GitException as ex:
+            console.verbose("%s: %s", ex.__class__.__name__, ex)
+            raise GitInvalidCommitRangeException(
+                f"Failed to retrieve commit messages for the range {from_hash} to "
+                f"{to_hash}"
+            ) from None
+
+        if filters.no_merges:
+            commits = [
+                (oid, commit_object)
+                for oid, commit_object in commits
+                if len(_parse_commit_headers(commit_object)[0]) <= 1
+            ]
+        if author_pattern is not None:
+            commits = [
+                (oid, commit_object)
+                for oid, commit_object in commits
+                if author_pattern.search(get_commit_author_ident(commit_object))
+            ]
+        if filters.max_count is not None:
+            # the most recent commits, as `git log --max-count --reverse`
+            del commits[filters.max_count :]
+
+        return commits
+
+    def iter_commit_messages(
+        self,
+        from_hash: str,
+        to_hash: str = "HEAD",
+        filters: Optional[RangeFilters] = None,
+    ) -> Iterator[str]:
+        """
+        Yields the commit messages of `from_hash^@..to_hash`, i.e. the commits of
+        `from_hash..to_hash` along with `from_hash` itself, oldest first.
+
+        Unlike the `git log` reader of `git_helpers`, the whole range is walked
+        and kept in memory before the oldest commit is yielded, see `walk`.
+
+        Args:
+            from_hash (str): The starting revision, included in the range.
+            to_hash (str, optional): The ending revision (default is "HEAD").
+            filters (Optional[RangeFilters], optional): The filters of the commits
+                (default is None, i.e. all the commits). `since` and `paths` are
+                not supported.
+
+        Yields:
+            str: The commit messages, empty messages excluded.
+
+        Raises:
+            GitException: If the filters aren't supported or are invalid.
+            GitInvalidCommitRangeException: If the range can't be resolved.
+        """
+        commits = self._walk_range(from_hash, to_hash, filters)
+        while commits:
+            commit_message = parse_commit_message(commits.pop()[1])
+            if commit_message:
+                yield commit_message
+
+    def iter_commits(
+        self,
+        from_hash: str,
+        to_hash: str = "HEAD",
+        filters: Optional[RangeFilters] = None,
+    ) -> Iterator[Commit]:
+        """
+        Yields the commits of `from_hash^@..to_hash` like `iter_commit_messages`,
+        along with their hash, author and date.
+
+        Args:
+            from_hash (str): The starting revision, included in the range.
+            to_hash (str, optional): The ending revision (default is "HEAD").
+            filters (Optional[RangeFilters], optional): The filters of the commits
+                (default is None, i.e. all the commits). `since` and `paths` are
+                not supported.
+
+        Yields:
+            Commit: The commits, oldest first, empty messages excluded.
+
+        Raises:
+            GitException: If the filters aren't supported or are invalid.
+            GitInvalidCommitRangeException: If the range can't be resolved.
+        """
+        commits = self._walk_range(from_hash, to_hash, filters)
+        while commits:
+            oid, commit_object = commits.pop()
+            commit_message = parse_commit_message(commit_object)
+            if commit_message:
+                author, date = parse_commit_author(commit_object)
+                yield Commit(oid.hex(), author, date, commit_message)
+
+
+def get_commit_message_of_hash(commit_hash: str) -> str:
+    """
+    Retrieve the commit message for a given commit hash, without running git.
+
+    Args:
+        commit_hash (str): The commit hash, or any revision supported by
+            `GitRepository.resolve`.
+
+    Returns:
+        str: The commit message.
+
+    Raises:
+        GitCommitNotFoundException: If the commit is not found.
+    """
+    console.verbose("fetching commit message from hash %s", commit_hash)
+    with GitRepository.discover() as repository:
+        return repository.get_commit_message(commit_hash)
+
+
+def get_commit_messages_of_hashes(commit_hashes: Iterable[str]) -> Iterator[str]:
+    """
+    Lazily retrieve the commit messages of many commits, without running git.
+
+    Args:
+        commit_hashes (Iterable[str]): The commit hashes, consumed lazily.
+
+    Yields:
+        str: The commit messages, in the order of the hashes.
+
+    Raises:
+        GitCommitNotFoundException: If any of the commits is not found.
+    """
+    with GitRepository.discover() as repository:
+        for commit_hash in commit_hashes:
+            console.verbose("fetching commit message from hash %s", commit_hash)
+            yield repository.get_commit_message(commit_hash)
+
+
+def get_commits_of_hashes(commit_hashes: Iterable[str]) -> Iterator[Commit]:
+    """
+    Lazily retrieve many commits with their hash, author and date, without
+    running git, like `get_commit_messages_of_hashes`.
+
+    Args:
+        commit_hashes (Iterable[str]): The commit hashes, consumed lazily.
+
+    Yields:
+        Commit: The commits, in the order of the hashes.
+
+    Raises:
+        GitCommitNotFoundException: If any of the commits is not found.
+    """
+    with GitRepository.discover() as repository:
+        for commit_hash in commit_hashes:
+            console.verbose("fetching commit from hash %s", commit_hash)
+            yield repository.get_commit(commit_hash)
+
+
+def get_commit_messages_of_hash_range(
+    from_hash: str,
+    to_hash: str = "HEAD",
+    filters: Optional[RangeFilters] = None,
+) -> Iterator[str]:
+    """
+    Lazily retrieve the commit messages for a range of commits, without running
+    git, oldest commit first. The commit of `from_hash` itself is included.
+
+    Args:
+        from_hash (str): The starting commit hash.
+        to_hash (str, optional): The ending commit hash or branch (default is
+            "HEAD").
+        filters (Optional[RangeFilters], optional): The filters of the commits
+            (default is None, i.e. all the commits). `since` and `paths` are not
+            supported.
+
+    Yields:
+        str: The commit messages for the specified commit range.
+
+    Raises:
+        GitException: If the filters aren't supported or are invalid.
+        GitInvalidCommitRangeException: If the commit range is not found.
+    """
+    console.verbose(
+        "reading commit messages from hash range, from: %s, to: %s",
+        from_hash,
+        to_hash,
+    )
+    try:
+        repository = GitRepository.discover()
+    except GitException as ex:
+        console.verbose("%s: %s", ex.__class__.__name__, ex)
+        raise GitInvalidCommitRangeException(
+            f"Failed to retrieve commit messages for the range {from_hash} to {to_hash}"
+        ) from None
+
+    with repository:
+        yield from repository.iter_commit_messages(from_hash, to_hash, filters)
+
+
+def get_commits_of_hash_range(
+    from_hash: str,
+    to_hash: str = "HEAD",
+    filters: Optional[RangeFilters] = None,
+) -> Iterator[Commit]:
+    """
+    Lazily retrieve the commits of a range with their hash, author and date,
+    without running git, like `get_commit_messages_of_hash_range`.
+
+    Args:
+        from_hash (str): The starting commit hash.
+        to_hash (str, optional): The ending commit hash or branch (default is
+            "HEAD").
+        filters (Optional[RangeFilters], optional): The filters of the commits
+            (default is None, i.e. all the commits). `since` and `paths` are not
+            supported.
+
+    Yields:
+        Commit: The commits of the specified commit range, oldest first.
+
+    Raises:
+        GitException: If the filters aren't supported or are invalid.
+        GitInvalidCommitRangeException: If the commit range is not found.
+    """
+    console.verbose(
+        "reading commits from hash range, from: %s, to: %s", from_hash, to_hash
+    )
+    try:
+        repository = GitRepository.discover()
+    except GitException as ex:
+        console.verbose("%s: %s", ex.__class__.__name__, ex)
+        raise GitInvalidCommitRangeException(
+            f"Failed to retrieve commit messages for the range {from_hash} to {to_hash}"
+        ) from None
+
+    with repository:
+        yield from repository.iter_commits(from_hash, to_hash, filters)
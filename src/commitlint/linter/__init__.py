@@ -1,7 +1,21 @@
 """Main module for commit linters and validators"""
 
-from ._linter import lint_commit_message
+from ._linter import (
+    Linter,
+    lint_commit_message,
+    lint_commit_message_result,
+    lint_commit_message_results,
+    lint_commit_messages,
+)
+from .result import ErrorCode, LintError, LintResult
 
 __all__ = [
+    "ErrorCode",
+    "LintError",
+    "LintResult",
+    "Linter",
     "lint_commit_message",
+    "lint_commit_message_result",
+    "lint_commit_message_results",
+    "lint_commit_messages",
 ]
@@ -3,60 +3,406 @@ This module provides detailed functionality for linting commit messages accordin
 to conventional commit standards.
 """
 
-from typing import List, Tuple
+from functools import lru_cache
+from itertools import islice
+from time import perf_counter
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple
 
 from .. import console
+from ..config import config
+from ..timings import Timings
+from .result import LintResult
 from .utils import is_ignored, remove_comments
 from .validators import (
+    CommitValidator,
     HeaderLengthValidator,
     PatternValidator,
     SimplePatternValidator,
     run_validators,
 )
+from .view import CommitMessageView
+
+if TYPE_CHECKING:
+    from ..cache import LintCache
+
+# minimum number of commit messages for linting them in parallel, smaller
+# batches are linted serially to avoid the process pool start-up cost.
+PARALLEL_MIN_COMMITS = 256
+
+# number of commit messages sent to a worker process at a time
+PARALLEL_CHUNK_SIZE = 64
+
+
+class Linter:
+    """
+    Reusable commit message linter.
+
+    The validator pipeline is built once when the linter is created, and all the
+    validators are stateless with precompiled patterns, so a single linter can
+    lint any number of commit messages without any per-call setup.
+
+    Attributes:
+        skip_detail (bool): Whether to skip the detailed error linting.
+        strip_comments (bool): Whether to remove comments from the commit message.
+        cache (Optional[LintCache]): Cache of the lint results to consult and
+            update.
+
+    Example:
+        ```python
+        linter = Linter()
+        success, errors = linter.lint("feat: add new feature")
+        for success, errors in linter.lint_many(commit_messages):
+            ...
+
+        # without rendering the error messages
+        result = linter.lint_result("feat: add new feature")
+        ```
+    """
+
+    __slots__ = ("skip_detail", "strip_comments", "cache", "_validators")
+
+    def __init__(
+        self,
+        skip_detail: bool = False,
+        strip_comments: bool = False,
+        cache: Optional["LintCache"] = None,
+    ) -> None:
+        self.skip_detail = skip_detail
+        self.strip_comments = strip_comments
+        self.cache = cache
+
+        self._validators: Tuple[CommitValidator, ...]
+        if skip_detail:
+            self._validators = (HeaderLengthValidator(), SimplePatternValidator())
+        else:
+            self._validators = (HeaderLengthValidator(), PatternValidator())
+
+    def lint(self, commit_message: str) -> Tuple[bool, List[str]]:
+        """
+        Lints a commit message.
+
+        This is the compatibility wrapper of `lint_result`, rendering all the
+        error messages.
+
+        Args:
+            commit_message (str): The commit message to be linted.
+
+        Returns:
+            Tuple[bool, List[str]]: Returns success as a first element and list of
+                errors on the second elements. If success is true, errors will be
+                empty.
+        """
+        return self.lint_result(commit_message).as_tuple()
+
+    def lint_result(self, commit_message: str) -> LintResult:
+        """
+        Lints a commit message, without rendering the error messages.
+
+        Args:
+            commit_message (str): The commit message to be linted.
+
+        Returns:
+            LintResult: The success and the errors of the commit message.
+        """
+        cache = self.cache
+        if cache is None:
+            return self._lint(commit_message)
+
+        start = perf_counter()
+        cached_result = cache.get(commit_message, self.skip_detail, self.strip_comments)
+        if cached_result is not None:
+            console.verbose("lint result found in cache")
+            timings = config.timings
+            if timings is not None:
+                # cache hits aren't linted, so they get their own phase
+                timings.add("cache", perf_counter() - start)
+            return cached_result
+
+        result = self._lint(commit_message)
+        cache.set(commit_message, self.skip_detail, self.strip_comments, result)
+        return result
+
+    def lint_many(
+        self, commit_messages: Iterable[str]
+    ) -> Iterator[Tuple[bool, List[str]]]:
+        """
+        Lints multiple commit messages, one at a time.
+
+        Args:
+            commit_messages (Iterable[str]): The commit messages to be linted.
+
+        Yields:
+            Tuple[bool, List[str]]: The success and the list of errors of each
+                commit message, in the same order as the commit messages.
+        """
+        lint = self.lint
+        for commit_message in commit_messages:
+            yield lint(commit_message)
+
+    def _lint(self, commit_message: str) -> LintResult:
+        """Lints a commit message without consulting the cache."""
+        timings = config.timings
+        if timings is not None:
+            return self._lint_timed(commit_message, timings)
+
+        console.verbose("linting commit message:")
+        console.verbose_block("----------", commit_message, "----------")
+
+        # perform processing and pre checks
+        # removing unnecessary commit comments
+        if self.strip_comments:
+            console.verbose("removing comments from the commit message")
+            commit_message = remove_comments(commit_message)
+
+        # single view of the message shared by the helpers and validators
+        view = CommitMessageView(commit_message)
+
+        # checking if commit message should be ignored
+        console.verbose("checking if the commit message is in ignored list")
+        if is_ignored(view):
+            console.verbose("commit message ignored, skipping lint")
+            return LintResult(True)
+
+        # for skip_detail check
+        if self.skip_detail:
+            console.verbose("running simple validators for linting")
+            return run_validators(view, self._validators, fail_fast=True)
+
+        console.verbose("running detailed validators for linting")
+        return run_validators(view, self._validators)
+
+    def _lint_timed(self, commit_message: str, timings: Timings) -> LintResult:
+        """
+        Lints a commit message like `_lint`, recording the time of each phase.
+
+        Kept apart from `_lint`, so untimed runs don't pay for the timing.
+        """
+        start = perf_counter()
+        raw_commit_message = commit_message
+
+        if self.strip_comments:
+            with timings.phase("preprocess.strip_comments"):
+                commit_message = remove_comments(commit_message)
+
+        view = CommitMessageView(commit_message)
+        with timings.phase("preprocess.is_ignored"):
+            ignored = is_ignored(view)
+
+        if ignored:
+            result = LintResult(True)
+        else:
+            result = run_validators(
+                view, self._validators, fail_fast=self.skip_detail, timings=timings
+            )
+
+        timings.add_message(raw_commit_message, perf_counter() - start)
+        return result
+
+
+@lru_cache(maxsize=None)
+def _get_default_linter(skip_detail: bool, strip_comments: bool) -> Linter:
+    """Returns the shared linter for the options, created on first use."""
+    return Linter(skip_detail=skip_detail, strip_comments=strip_comments)
 
 
 def lint_commit_message(
-    commit_message: str, skip_detail: bool = False, strip_comments: bool = False
+    commit_message: str,
+    skip_detail: bool = False,
+    strip_comments: bool = False,
+    cache: Optional["LintCache"] = None,
 ) -> Tuple[bool, List[str]]:
     """
     Lints a commit message.
 
+    This is the compatibility wrapper of `lint_commit_message_result`, rendering
+    all the error messages.
+
     Args:
         commit_message (str): The commit message to be linted.
         skip_detail (bool, optional): Whether to skip the detailed error linting
             (default is False).
         strip_comments (bool, optional): Whether to remove comments from the
             commit message (default is False).
+        cache (Optional[LintCache], optional): Cache of the lint results to
+            consult and update (default is None).
 
     Returns:
         Tuple[bool, List[str]]: Returns success as a first element and list of errors
             on the second elements. If success is true, errors will be empty.
     """
-    console.verbose("linting commit message:")
-    console.verbose(f"----------\n{commit_message}\n----------")
-
-    # perform processing and pre checks
-    # removing unnecessary commit comments
-    if strip_comments:
-        console.verbose("removing comments from the commit message")
-        commit_message = remove_comments(commit_message)
-
-    # checking if commit message should be ignored
-    console.verbose("checking if the commit message is in ignored list")
-    if is_ignored(commit_message):
-        console.verbose("commit message ignored, skipping lint")
-        return True, []
-
-    # for skip_detail check
-    if skip_detail:
-        console.verbose("running simple validators for linting")
-        return run_validators(
-            commit_message,
-            validator_classes=[HeaderLengthValidator, SimplePatternValidator],
-            fail_fast=True,
-        )
-
-    console.verbose("running detailed validators for linting")
-    return run_validators(
-        commit_message, validator_classes=[HeaderLengthValidator, PatternValidator]
-    )
+    return lint_commit_message_result(
+        commit_message, skip_detail, strip_comments, cache
+    ).as_tuple()
+
+
+def lint_commit_message_result(
+    commit_message: str,
+    skip_detail: bool = False,
+    strip_comments: bool = False,
+    cache: Optional["LintCache"] = None,
+) -> LintResult:
+    """
+    Lints a commit message, without rendering the error messages.
+
+    Args:
+        commit_message (str): The commit message to be linted.
+        skip_detail (bool, optional): Whether to skip the detailed error linting
+            (default is False).
+        strip_comments (bool, optional): Whether to remove comments from the
+            commit message (default is False).
+        cache (Optional[LintCache], optional): Cache of the lint results to
+            consult and update (default is None).
+
+    Returns:
+        LintResult: The success and the errors of the commit message.
+    """
+    if cache is None:
+        linter = _get_default_linter(bool(skip_detail), bool(strip_comments))
+    else:
+        linter = Linter(skip_detail, strip_comments, cache)
+
+    return linter.lint_result(commit_message)
+
+
+def lint_commit_messages(
+    commit_messages: Iterable[str],
+    skip_detail: bool = False,
+    jobs: int = 1,
+    cache: Optional["LintCache"] = None,
+) -> Iterator[Tuple[str, bool, List[str]]]:
+    """
+    Lints multiple commit messages, optionally in parallel.
+
+    This is the compatibility wrapper of `lint_commit_message_results`, rendering
+    all the error messages.
+
+    Args:
+        commit_messages (Iterable[str]): The commit messages to be linted.
+        skip_detail (bool, optional): Whether to skip the detailed error linting
+            (default is False).
+        jobs (int, optional): Number of worker processes (default is 1).
+        cache (Optional[LintCache], optional): Cache of the lint results to
+            consult and update (default is None).
+
+    Yields:
+        Tuple[str, bool, List[str]]: The commit message, its success and its list
+            of errors.
+    """
+    for commit_message, result in lint_commit_message_results(
+        commit_messages, skip_detail=skip_detail, jobs=jobs, cache=cache
+    ):
+        yield commit_message, result.success, result.render_errors()
+
+
+def lint_commit_message_results(
+    commit_messages: Iterable[str],
+    skip_detail: bool = False,
+    jobs: int = 1,
+    cache: Optional["LintCache"] = None,
+) -> Iterator[Tuple[str, LintResult]]:
+    """
+    Lints multiple commit messages, optionally in parallel, without rendering the
+    error messages.
+
+    With more than one job, the commit messages are linted in chunks by a pool
+    of worker processes. Batches smaller than `PARALLEL_MIN_COMMITS`, verbose
+    runs and timed runs are always linted serially. Results are yielded in the
+    same order as the commit messages.
+
+    Args:
+        commit_messages (Iterable[str]): The commit messages to be linted.
+        skip_detail (bool, optional): Whether to skip the detailed error linting
+            (default is False).
+        jobs (int, optional): Number of worker processes (default is 1).
+        cache (Optional[LintCache], optional): Cache of the lint results to
+            consult and update (default is None).
+
+    Yields:
+        Tuple[str, LintResult]: The commit message and its lint result.
+    """
+    commit_messages = iter(commit_messages)
+
+    if jobs > 1 and not config.verbose and config.timings is None:
+        head = list(islice(commit_messages, PARALLEL_MIN_COMMITS))
+        if len(head) == PARALLEL_MIN_COMMITS:
+            console.verbose("linting commit messages using %d jobs", jobs)
+            yield from _lint_commit_messages_parallel(
+                Linter(skip_detail=skip_detail), cache, head, commit_messages, jobs
+            )
+            return
+
+        commit_messages = iter(head)
+
+    lint = Linter(skip_detail=skip_detail, cache=cache).lint_result
+    for commit_message in commit_messages:
+        yield commit_message, lint(commit_message)
+
+
+def _lint_commit_messages_parallel(
+    linter: Linter,
+    cache: Optional["LintCache"],
+    head: List[str],
+    commit_messages: Iterator[str],
+    jobs: int,
+) -> Iterator[Tuple[str, LintResult]]:
+    """
+    Lints the commit messages using a process pool, preserving their order.
+
+    The commit messages are consumed in bounded batches, so the memory usage
+    doesn't depend on the number of commit messages. The next batch is submitted
+    before the results of the current one are yielded.
+
+    The cache is read and written by this process, and only the commit messages
+    missing from it are sent to the workers, so the writes are seen by
+    `LintCache.prune`.
+    """
+    # imported here as `concurrent.futures` pulls in `multiprocessing`, which is
+    # too costly for the common case of linting a single commit message
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    options = (linter.skip_detail, linter.strip_comments)
+
+    def lookup(batch: List[str]) -> List[Optional[LintResult]]:
+        if cache is None:
+            return [None] * len(batch)
+
+        return [cache.get(commit_message, *options) for commit_message in batch]
+
+    def merge(
+        batch: List[str],
+        cached: List[Optional[LintResult]],
+        results: Iterator[LintResult],
+    ) -> Iterator[Tuple[str, LintResult]]:
+        for commit_message, result in zip(batch, cached):
+            if result is None:
+                result = next(results)
+                if cache is not None:
+                    cache.set(commit_message, *options, result)
+
+            yield commit_message, result
+
+    batch_size = jobs * PARALLEL_CHUNK_SIZE * 4
+    pending: Optional[
+        Tuple[List[str], List[Optional[LintResult]], Iterator[LintResult]]
+    ] = None
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        batch = head
+        while batch:
+            cached = lookup(batch)
+            misses = [
+                commit_message
+                for commit_message, result in zip(batch, cached)
+                if result is None
+            ]
+            results = executor.map(
+                linter.lint_result, misses, chunksize=PARALLEL_CHUNK_SIZE
+            )
+            if pending is not None:
+                yield from merge(*pending)
+
+            pending = (batch, cached, results)
+            batch = list(islice(commit_messages, batch_size))
+
+        if pending is not None:
+            yield from merge(*pending)
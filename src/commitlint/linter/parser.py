@@ -0,0 +1,173 @@
+"""
+This module provides a single-pass scanner for the conventional commit header.
+
+The scanner walks the header once and records the positions of each part of the
+header, so the validators can check them without any regex or intermediate
+strings.
+"""
+
+from typing import NamedTuple, Optional
+
+
+class ParsedHeader(NamedTuple):
+    """
+    Positions of the parts of a conventional commit header.
+
+    All the positions are offsets into `message`, and the ends are exclusive.
+    Optional parts that are missing have their positions set to -1.
+
+    The layout of the header is:
+    `type[whitespace](scope)[whitespace][!]:[whitespace]description`, where
+    every part is optional, followed by up to two line breaks and the body.
+
+    Attributes:
+        message (str): The commit message.
+        type_end (int): End of the type word, -1 if the type is missing.
+        type_space_end (int): End of the whitespace after the type.
+        scope_start (int): Start of the scope inside the parentheses.
+        scope_end (int): End of the scope, i.e. position of the `)`.
+        scope_space_end (int): End of the whitespace after the `)`.
+        has_bang (bool): Whether the breaking change `!` is present.
+        colon_start (int): Position of the `:`, -1 if the colon is missing.
+        colon_end (int): End of the colon and its optional whitespace.
+        description_start (int): Start of the description.
+        description_end (int): End of the description, equal to its start if the
+            description is missing.
+        body_start (int): Start of the body, after up to two line breaks.
+    """
+
+    message: str
+    type_end: int
+    type_space_end: int
+    scope_start: int
+    scope_end: int
+    scope_space_end: int
+    has_bang: bool
+    colon_start: int
+    colon_end: int
+    description_start: int
+    description_end: int
+    body_start: int
+
+    @property
+    def commit_type(self) -> Optional[str]:
+        """The commit type without the whitespace after it, if present."""
+        if self.type_end == -1:
+            return None
+
+        return self.message[: self.type_end]
+
+    @property
+    def scope(self) -> Optional[str]:
+        """The scope without the parentheses, if present."""
+        if self.scope_start == -1:
+            return None
+
+        return self.message[self.scope_start : self.scope_end]
+
+    @property
+    def description(self) -> str:
+        """The description, empty if missing."""
+        return self.message[self.description_start : self.description_end]
+
+
+_new_parsed_header = tuple.__new__
+
+
+def parse_header(message: str, header_end: int = -1) -> ParsedHeader:
+    """
+    Scans the header of a commit message in a single pass.
+
+    The scanner is greedy and never backtracks, the same as the conventional
+    commit pattern it replaces: each part is consumed as far as possible and
+    skipped if it isn't present at the current position.
+
+    Args:
+        message (str): The commit message to scan.
+        header_end (int, optional): The position of the first line feed, or the
+            message length, if already known (default is -1, i.e. unknown).
+
+    Returns:
+        ParsedHeader: The positions of the parts of the header.
+    """
+    length = len(message)
+
+    # type: word characters (same as regex `\w`) followed by any whitespace
+    pos = 0
+    for char in message:
+        if not (char.isalnum() or char == "_"):
+            break
+        pos += 1
+
+    type_end = type_space_end = -1
+    if pos > 0:
+        type_end = pos
+        while pos < length and message[pos].isspace():
+            pos += 1
+        type_space_end = pos
+
+    # scope: anything up to the first `)`, followed by any whitespace
+    scope_start = scope_end = scope_space_end = -1
+    if pos < length and message[pos] == "(":
+        closing = message.find(")", pos + 1)
+        if closing != -1:
+            scope_start = pos + 1
+            scope_end = closing
+            pos = closing + 1
+            while pos < length and message[pos].isspace():
+                pos += 1
+            scope_space_end = pos
+
+    # breaking change
+    has_bang = pos < length and message[pos] == "!"
+    if has_bang:
+        pos += 1
+
+    # colon, followed by an optional whitespace
+    colon_start = colon_end = -1
+    if pos < length and message[pos] == ":":
+        colon_start = pos
+        pos += 1
+        if pos < length and message[pos].isspace():
+            pos += 1
+        colon_end = pos
+
+    # description: up to the first line break
+    description_start = pos
+    if header_end < pos:
+        # the type or scope whitespace spans over the first line feed
+        header_end = message.find("\n", pos)
+        if header_end == -1:
+            header_end = length
+
+    description_end = header_end
+
+    carriage_return = message.find("\r", pos, description_end)
+    if carriage_return != -1:
+        description_end = carriage_return
+
+    # body separation: up to two line feeds
+    pos = description_end
+    if pos < length and message[pos] == "\n":
+        pos += 1
+        if pos < length and message[pos] == "\n":
+            pos += 1
+
+    # creating the tuple directly, skipping the keyword handling of NamedTuple
+    return _new_parsed_header(
+        ParsedHeader,
+        (
+            message,
+            type_end,
+            type_space_end,
+            scope_start,
+            scope_end,
+            scope_space_end,
+            has_bang,
+            colon_start,
+            colon_end,
+            description_start,
+            description_end,
+            pos,
+        ),
+    )
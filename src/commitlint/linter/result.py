@@ -0,0 +1,146 @@
+"""
+This module provides the structured lint result.
+
+Validators report errors as compact `LintError` records made of a stable error
+code and the arguments of its message. The messages are only rendered when
+they're shown, so consumers that only need the success or the error count never
+build them.
+"""
+
+from enum import Enum
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
+
+from ..messages import (
+    COMMIT_TYPE_INVALID_ERROR,
+    COMMIT_TYPE_MISSING_ERROR,
+    DESCRIPTION_FULL_STOP_END_ERROR,
+    DESCRIPTION_LINE_BREAK_ERROR,
+    DESCRIPTION_MISSING_ERROR,
+    DESCRIPTION_MULTIPLE_SPACE_START_ERROR,
+    DESCRIPTION_NO_LEADING_SPACE_ERROR,
+    HEADER_LENGTH_ERROR,
+    INCORRECT_FORMAT_ERROR,
+    SCOPE_EMPTY_ERROR,
+    SCOPE_WHITESPACE_ERROR,
+    SPACE_AFTER_COMMIT_TYPE_ERROR,
+    SPACE_AFTER_SCOPE_ERROR,
+)
+
+
+class ErrorCode(str, Enum):
+    """
+    Stable codes of the lint errors.
+
+    The values are part of the public interface (e.g. in the lint cache), so they
+    must never change.
+    """
+
+    INCORRECT_FORMAT = "incorrect-format"
+    HEADER_LENGTH = "header-length"
+    COMMIT_TYPE_MISSING = "type-missing"
+    COMMIT_TYPE_INVALID = "type-invalid"
+    SPACE_AFTER_COMMIT_TYPE = "space-after-type"
+    SCOPE_EMPTY = "scope-empty"
+    SCOPE_WHITESPACE = "scope-whitespace"
+    SPACE_AFTER_SCOPE = "space-after-scope"
+    DESCRIPTION_MISSING = "description-missing"
+    DESCRIPTION_NO_LEADING_SPACE = "description-no-leading-space"
+    DESCRIPTION_MULTIPLE_SPACE_START = "description-multiple-space-start"
+    DESCRIPTION_LINE_BREAK = "description-line-break"
+    DESCRIPTION_FULL_STOP_END = "description-full-stop-end"
+
+
+# message templates of the error codes, formatted with the error arguments
+ERROR_MESSAGES: Dict[ErrorCode, str] = {
+    ErrorCode.INCORRECT_FORMAT: INCORRECT_FORMAT_ERROR,
+    ErrorCode.HEADER_LENGTH: HEADER_LENGTH_ERROR,
+    ErrorCode.COMMIT_TYPE_MISSING: COMMIT_TYPE_MISSING_ERROR,
+    ErrorCode.COMMIT_TYPE_INVALID: COMMIT_TYPE_INVALID_ERROR,
+    ErrorCode.SPACE_AFTER_COMMIT_TYPE: SPACE_AFTER_COMMIT_TYPE_ERROR,
+    ErrorCode.SCOPE_EMPTY: SCOPE_EMPTY_ERROR,
+    ErrorCode.SCOPE_WHITESPACE: SCOPE_WHITESPACE_ERROR,
+    ErrorCode.SPACE_AFTER_SCOPE: SPACE_AFTER_SCOPE_ERROR,
+    ErrorCode.DESCRIPTION_MISSING: DESCRIPTION_MISSING_ERROR,
+    ErrorCode.DESCRIPTION_NO_LEADING_SPACE: DESCRIPTION_NO_LEADING_SPACE_ERROR,
+    ErrorCode.DESCRIPTION_MULTIPLE_SPACE_START: DESCRIPTION_MULTIPLE_SPACE_START_ERROR,
+    ErrorCode.DESCRIPTION_LINE_BREAK: DESCRIPTION_LINE_BREAK_ERROR,
+    ErrorCode.DESCRIPTION_FULL_STOP_END: DESCRIPTION_FULL_STOP_END_ERROR,
+}
+
+
+class LintError(NamedTuple):
+    """
+    A lint error, rendered to its message on demand.
+
+    Attributes:
+        code (ErrorCode): The code of the error.
+        args (Tuple[Any, ...]): The arguments of the error message, e.g. the
+            invalid commit type.
+    """
+
+    code: ErrorCode
+    args: Tuple[Any, ...] = ()
+
+    def render(self) -> str:
+        """
+        Renders the error message.
+
+        Returns:
+            str: The error message.
+        """
+        template = ERROR_MESSAGES[self.code]
+        if self.args:
+            return template % self.args
+
+        return template
+
+
+class LintResult:
+    """
+    Result of linting a commit message.
+
+    Attributes:
+        success (bool): Whether the commit message is valid.
+        errors (Tuple[LintError, ...]): The lint errors, empty on success.
+
+    Example:
+        ```python
+        result = Linter().lint_result("feat: add new feature")
+        if not result.success:
+            for message in result.render_errors():
+                print(message)
+        ```
+    """
+
+    __slots__ = ("success", "errors")
+
+    def __init__(self, success: bool, errors: Iterable[LintError] = ()) -> None:
+        self.success = success
+        self.errors = tuple(errors)
+
+    def render_errors(self) -> List[str]:
+        """
+        Renders the messages of the errors.
+
+        Returns:
+            List[str]: The error messages, in the order the errors were found.
+        """
+        return [error.render() for error in self.errors]
+
+    def as_tuple(self) -> Tuple[bool, List[str]]:
+        """
+        Returns the result in the tuple format of `lint_commit_message`.
+
+        Returns:
+            Tuple[bool, List[str]]: The success and the rendered error messages.
+        """
+        return self.success, self.render_errors()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LintResult):
+            return NotImplemented
+
+        return self.success == other.success and self.errors == other.errors
+
+    def __repr__(self) -> str:
+        return f"LintResult(success={self.success!r}, errors={self.errors!r})"
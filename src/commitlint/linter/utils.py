@@ -3,12 +3,18 @@ Contains the utility methods for linters.
 """
 
 import re
-from typing import List
+from typing import Union
 
 from ..constants import IGNORE_COMMIT_PATTERNS
+from .view import CommitMessageView
 
+IGNORE_COMMIT_RE = re.compile(IGNORE_COMMIT_PATTERNS)
 
-def is_ignored(commit_message: str) -> bool:
+# separator line added by `git commit --verbose` above the diff
+VERBOSE_COMMIT_SEPARATOR = "# ------------------------ >8 ------------------------"
+
+
+def is_ignored(commit_message: Union[str, CommitMessageView]) -> bool:
     """
     Checks if a commit message should be ignored.
 
@@ -16,13 +22,14 @@ def is_ignored(commit_message: str) -> bool:
     from linting.
 
     Args:
-        commit_message (str): The commit message to check.
+        commit_message (Union[str, CommitMessageView]): The commit message, or its
+            view, to check.
 
     Returns:
         bool: True if the commit message should be ignored, False otherwise.
     """
-    commit_first_line = commit_message.splitlines()[0]
-    return bool(re.match(IGNORE_COMMIT_PATTERNS, commit_first_line))
+    commit_first_line = CommitMessageView.of(commit_message).first_line
+    return IGNORE_COMMIT_RE.match(commit_first_line) is not None
 
 
 def remove_comments(commit_message: str) -> str:
@@ -36,12 +43,13 @@ def remove_comments(commit_message: str) -> str:
     """
     commit_message = remove_diff_from_commit_message(commit_message)
 
-    lines: List[str] = []
-    for line in commit_message.split("\n"):
-        if not line.startswith("#"):
-            lines.append(line)
+    # avoid splitting the whole message if there aren't any comments
+    if not commit_message.startswith("#") and "\n#" not in commit_message:
+        return commit_message
 
-    return "\n".join(lines)
+    return "\n".join(
+        line for line in commit_message.split("\n") if not line.startswith("#")
+    )
 
 
 def remove_diff_from_commit_message(commit_message: str) -> str:
@@ -65,5 +73,8 @@ def remove_diff_from_commit_message(commit_message: str) -> str:
     Returns:
         str: The commit message without diff.
     """
-    verbose_commit_separator = "# ------------------------ >8 ------------------------"
-    return commit_message.split(verbose_commit_separator)[0].strip()
+    separator_index = commit_message.find(VERBOSE_COMMIT_SEPARATOR)
+    if separator_index != -1:
+        commit_message = commit_message[:separator_index]
+
+    return commit_message.strip()
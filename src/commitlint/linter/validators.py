@@ -6,73 +6,77 @@ conventional commit standards.
 
 import re
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Type, Union
+from typing import List, Optional, Sequence
 
 from .. import console
 from ..constants import COMMIT_HEADER_MAX_LENGTH, COMMIT_TYPES
-from ..messages import (
-    COMMIT_TYPE_INVALID_ERROR,
-    COMMIT_TYPE_MISSING_ERROR,
-    DESCRIPTION_FULL_STOP_END_ERROR,
-    DESCRIPTION_LINE_BREAK_ERROR,
-    DESCRIPTION_MISSING_ERROR,
-    DESCRIPTION_MULTIPLE_SPACE_START_ERROR,
-    DESCRIPTION_NO_LEADING_SPACE_ERROR,
-    HEADER_LENGTH_ERROR,
-    INCORRECT_FORMAT_ERROR,
-    SCOPE_EMPTY_ERROR,
-    SCOPE_WHITESPACE_ERROR,
-    SPACE_AFTER_COMMIT_TYPE_ERROR,
-    SPACE_AFTER_SCOPE_ERROR,
+from ..timings import Timings
+from .parser import parse_header
+from .result import ErrorCode, LintError, LintResult
+from .view import CommitMessageView
+
+_COMMIT_TYPES_SET = frozenset(COMMIT_TYPES)
+
+# the errors without arguments are shared, as they're immutable
+_INCORRECT_FORMAT = LintError(ErrorCode.INCORRECT_FORMAT)
+_HEADER_LENGTH = LintError(ErrorCode.HEADER_LENGTH)
+_COMMIT_TYPE_MISSING = LintError(ErrorCode.COMMIT_TYPE_MISSING)
+_SPACE_AFTER_COMMIT_TYPE = LintError(ErrorCode.SPACE_AFTER_COMMIT_TYPE)
+_SCOPE_EMPTY = LintError(ErrorCode.SCOPE_EMPTY)
+_SCOPE_WHITESPACE = LintError(ErrorCode.SCOPE_WHITESPACE)
+_SPACE_AFTER_SCOPE = LintError(ErrorCode.SPACE_AFTER_SCOPE)
+_DESCRIPTION_MISSING = LintError(ErrorCode.DESCRIPTION_MISSING)
+_DESCRIPTION_NO_LEADING_SPACE = LintError(ErrorCode.DESCRIPTION_NO_LEADING_SPACE)
+_DESCRIPTION_MULTIPLE_SPACE_START = LintError(
+    ErrorCode.DESCRIPTION_MULTIPLE_SPACE_START
 )
+_DESCRIPTION_LINE_BREAK = LintError(ErrorCode.DESCRIPTION_LINE_BREAK)
+_DESCRIPTION_FULL_STOP_END = LintError(ErrorCode.DESCRIPTION_FULL_STOP_END)
 
 
 class CommitValidator(ABC):
-    """Abstract Base validator for commit message."""
+    """
+    Abstract Base validator for commit message.
 
-    def __init__(self, commit_message: str) -> None:
-        self._commit_message = commit_message
-        self._errors: List[str] = []
+    Validators are stateless, so a single instance can validate any number of
+    commit messages.
+    """
 
-        # start validation
-        self.validate()
+    __slots__ = ()
 
     @abstractmethod
-    def validate(self) -> None:
-        """Performs the validation."""
-        raise NotImplementedError  # pragma: no cover
-
-    def add_error(self, error: str) -> None:
-        """Adds an error to the list of errors."""
-        self._errors.append(error)
-
-    def is_valid(self) -> bool:
-        """Checks if there are any errors."""
-        return len(self._errors) == 0
+    def validate(self, commit_message: CommitMessageView) -> List[LintError]:
+        """
+        Performs the validation.
 
-    def errors(self) -> List[str]:
-        """Get the list of errors."""
-        return self._errors
+        Args:
+            commit_message (CommitMessageView): The commit message to validate.
 
-    @property
-    def commit_message(self) -> str:
-        """Gets the commit message."""
-        return self._commit_message
+        Returns:
+            List[LintError]: The list of errors, empty if the commit message is valid.
+        """
+        raise NotImplementedError  # pragma: no cover
 
 
 class HeaderLengthValidator(CommitValidator):
     """Validator for checking commit header length."""
 
-    def validate(self) -> None:
+    __slots__ = ()
+
+    def validate(self, commit_message: CommitMessageView) -> List[LintError]:
         """
         Validates the length of the commit header.
 
+        Args:
+            commit_message (CommitMessageView): The commit message to validate.
+
         Returns:
-            None
+            List[LintError]: The list of errors, empty if the header length is valid.
         """
-        header = self.commit_message.split("\n")[0]
-        if len(header) > COMMIT_HEADER_MAX_LENGTH:
-            self.add_error(HEADER_LENGTH_ERROR)
+        if commit_message.header_end > COMMIT_HEADER_MAX_LENGTH:
+            return [_HEADER_LENGTH]
+
+        return []
 
 
 class SimplePatternValidator(CommitValidator):
@@ -89,235 +93,158 @@ class SimplePatternValidator(CommitValidator):
         r"(?: (?P<description>[^\s][^\n\r]+[^\.]))"
         r"((\n\n(?P<body>.*))|(\s*))?$"
     )
+    _COMMIT_RE = re.compile(COMMIT_PATTERN)
 
-    def validate(self) -> None:
-        """
-        Validates the commit message using the regex pattern.
-
-        Returns:
-            None
-        """
-        pattern_match = re.match(self.COMMIT_PATTERN, self.commit_message)
-        if pattern_match is None:
-            self.add_error(INCORRECT_FORMAT_ERROR)
-
+    __slots__ = ()
 
-class PatternValidator(CommitValidator):
-    """
-    A Detailed validator for commit message using the conventional commit regex
-    pattern. This validator checks for the detailed error message.
-    """
-
-    COMMIT_PATTERN = (
-        r"(?s)"  # To explicitly make . match new line
-        r"(?P<type>\w+\s*)?"
-        r"(?:\((?P<scope>[^\)]*)\)(?P<space_after_scope>\s*))?"
-        r"!?(?P<colon>:\s?)?"
-        r"(?:(?P<description>[^\n\r]+))?"
-        r"(?P<body_separation>\n?\n?)"
-        r"(((?P<body>.*))|(\s*))?$"
-    )
-
-    def validate(self) -> None:
+    def validate(self, commit_message: CommitMessageView) -> List[LintError]:
         """
         Validates the commit message using the regex pattern.
 
-        Returns:
-            None
-        """
-
-        # Matching commit message with the commit pattern
-        pattern_match = re.match(self.COMMIT_PATTERN, self.commit_message)
-        if pattern_match is None or pattern_match.group("colon") is None:
-            self.add_error(INCORRECT_FORMAT_ERROR)
-            return
-
-        self.re_match = pattern_match
-
-        validators = [
-            self.validate_commit_type,
-            self.validate_commit_type_no_space_after,
-            self.validate_scope,
-            self.validate_scope_no_space_after,
-            self.validate_description,
-            self.validate_description_no_multiple_whitespace,
-            self.validate_description_no_line_break,
-            self.validate_description_no_full_stop_at_end,
-        ]
-
-        for validator in validators:
-            error = validator()
-            if error:
-                self.add_error(error)
-
-    def validate_commit_type(self) -> Union[None, str]:
-        """
-        Validates the commit type.
+        Args:
+            commit_message (CommitMessageView): The commit message to validate.
 
         Returns:
-            Union[None, str]: If the commit type is valid, returns None; otherwise,
-                returns an error message.
+            List[LintError]: The list of errors, empty if the commit message is valid.
         """
-        commit_type = self.re_match.group("type")
-        if commit_type is None:
-            return COMMIT_TYPE_MISSING_ERROR
-
-        commit_type = commit_type.strip()
-        if commit_type not in COMMIT_TYPES:
-            return COMMIT_TYPE_INVALID_ERROR % commit_type
-
-        return None
+        if self._COMMIT_RE.match(commit_message.text) is None:
+            return [_INCORRECT_FORMAT]
 
-    def validate_commit_type_no_space_after(self) -> Union[None, str]:
-        """
-        Validates that there is no space after the commit type.
-
-        Returns:
-            Union[None, str]: If there is no space after the commit type, returns
-                None; otherwise, returns an error message.
-        """
-        commit_type = self.re_match.group("type")
+        return []
 
-        if commit_type and commit_type.endswith(" "):
-            commit_type = commit_type.strip()
-            return SPACE_AFTER_COMMIT_TYPE_ERROR
 
-        return None
-
-    def validate_scope(self) -> Union[None, str]:
-        """
-        Validates the commit scope.
-
-        Returns:
-            Union[None, str]: If the commit scope is valid, returns None; otherwise,
-                returns an error message.
-        """
-        scope = self.re_match.group("scope")
-        if scope is not None:
-            if scope == "":
-                return SCOPE_EMPTY_ERROR
-
-            if " " in scope:
-                return SCOPE_WHITESPACE_ERROR
-
-        return None
-
-    def validate_scope_no_space_after(self) -> Union[None, str]:
-        """
-        Validates that there is no space after the commit scope.
-
-        Returns:
-            Union[None, str]: If there is no space after the commit scope, returns
-                None; otherwise, returns an error message.
-        """
-        space_after_scope = self.re_match.group("space_after_scope")
-        if space_after_scope and " " in space_after_scope:
-            return SPACE_AFTER_SCOPE_ERROR
-
-        return None
-
-    def validate_description(self) -> Union[None, str]:
-        """
-        Validates the commit description.
-
-        Returns:
-            Union[None, str]: If the description is valid, returns None; otherwise,
-                returns an error message.
-        """
-        if not self.re_match.group("description"):
-            return DESCRIPTION_MISSING_ERROR
-
-        if not self.re_match.group("colon").endswith(" "):
-            return DESCRIPTION_NO_LEADING_SPACE_ERROR
-
-        return None
-
-    def validate_description_no_multiple_whitespace(
-        self,
-    ) -> Union[None, str]:
-        """
-        Validates that there are no multiple whitespace characters at the beginning of
-          the description.
-
-        Returns:
-            Union[None, str]: If the description has no multiple whitespace characters
-                at the beginning, returns None; otherwise, returns an error message.
-        """
-        if self.re_match.group("description") and self.re_match.group(
-            "description"
-        ).startswith(" "):
-            return DESCRIPTION_MULTIPLE_SPACE_START_ERROR
-
-        return None
+class PatternValidator(CommitValidator):
+    """
+    A Detailed validator for commit message using the conventional commit header
+    scanner. This validator checks for the detailed error message.
+    """
 
-    def validate_description_no_line_break(
-        self,
-    ) -> Union[None, str]:
-        """
-        Validates that the description has no line break at the end.
+    __slots__ = ()
 
-        Returns:
-            Union[None, str]: If there is no line break at the end of the
-                description, returns None; otherwise, returns an error message.
+    # pylint: disable=R0912; Too many branches
+    def validate(self, commit_message: CommitMessageView) -> List[LintError]:
         """
-        if self.re_match.group("body_separation") == "\n" and self.re_match.group(
-            "body"
-        ):
-            return DESCRIPTION_LINE_BREAK_ERROR
+        Validates the commit message using the parsed commit header.
 
-        return None
+        All the detailed checks are done on the positions found by the header
+        scanner, without creating any intermediate string.
 
-    def validate_description_no_full_stop_at_end(
-        self,
-    ) -> Union[None, str]:
-        """
-        Validates that the description doesn't have full stop at the end.
+        Args:
+            commit_message (CommitMessageView): The commit message to validate.
 
         Returns:
-            Union[None, str]: If there is no full stop at the end of the description,
-                returns None; otherwise, returns an error message.
-        """
-        if self.re_match.group("description") and self.re_match.group(
-            "description"
-        ).strip().endswith("."):
-            return DESCRIPTION_FULL_STOP_END_ERROR
-
-        return None
+            List[LintError]: The list of errors, empty if the commit message is valid.
+        """
+        (
+            message,
+            type_end,
+            type_space_end,
+            scope_start,
+            scope_end,
+            scope_space_end,
+            _,
+            colon_start,
+            colon_end,
+            description_start,
+            description_end,
+            body_start,
+        ) = parse_header(commit_message.text, commit_message.header_end)
+
+        if colon_start == -1:
+            return [_INCORRECT_FORMAT]
+
+        errors: List[LintError] = []
+
+        # commit type
+        if type_end == -1:
+            errors.append(_COMMIT_TYPE_MISSING)
+        else:
+            commit_type = message[:type_end]
+            if commit_type not in _COMMIT_TYPES_SET:
+                errors.append(LintError(ErrorCode.COMMIT_TYPE_INVALID, (commit_type,)))
+
+            # no space after the commit type
+            if type_space_end > type_end and message[type_space_end - 1] == " ":
+                errors.append(_SPACE_AFTER_COMMIT_TYPE)
+
+        if scope_start != -1:
+            # commit scope
+            if scope_start == scope_end:
+                errors.append(_SCOPE_EMPTY)
+            elif " " in message[scope_start:scope_end]:
+                errors.append(_SCOPE_WHITESPACE)
+
+            # no space after the commit scope
+            if " " in message[scope_end:scope_space_end]:
+                errors.append(_SPACE_AFTER_SCOPE)
+
+        if description_start == description_end:
+            # description
+            errors.append(_DESCRIPTION_MISSING)
+        else:
+            # description, with a leading space
+            if message[colon_end - 1] != " ":
+                errors.append(_DESCRIPTION_NO_LEADING_SPACE)
+
+            # no multiple whitespace at the beginning of the description
+            if message[description_start] == " ":
+                errors.append(_DESCRIPTION_MULTIPLE_SPACE_START)
+
+        # no line break at the end of the description
+        if body_start - description_end == 1 and body_start < len(message):
+            errors.append(_DESCRIPTION_LINE_BREAK)
+
+        # no full stop at the end of the description
+        end = description_end
+        while end > description_start and message[end - 1].isspace():
+            end -= 1
+
+        if end > description_start and message[end - 1] == ".":
+            errors.append(_DESCRIPTION_FULL_STOP_END)
+
+        return errors
 
 
 def run_validators(
-    commit_message: str,
-    validator_classes: List[Type[CommitValidator]],
+    commit_message: CommitMessageView,
+    validators: Sequence[CommitValidator],
     fail_fast: bool = False,
-) -> Tuple[bool, List[str]]:
+    timings: Optional[Timings] = None,
+) -> LintResult:
     """Runs the provided validators for the commit message.
 
     Args:
-        commit_message (str): The commit message to validate.
-        validator_classes (List[Type[CommitValidator]]): List of validator classes to
-            run.
+        commit_message (CommitMessageView): The commit message to validate.
+        validators (Sequence[CommitValidator]): The validators to run.
         fail_fast (bool, optional): Return early if one validator fails. Defaults to
             False.
+        timings (Optional[Timings], optional): Records the time of each validator.
+            Defaults to None.
 
     Returns:
-        Tuple[bool, List[str]]: Returns success as the first element and a list of
-            errors as the second element. If success is True, errors will be empty.
+        LintResult: The success and the errors of the validators. If success is
+            True, errors will be empty.
     """
 
-    success = True
-    errors: List[str] = []
+    errors: List[LintError] = []
+
+    for validator in validators:
+        console.verbose("running validator %s", validator.__class__.__name__)
+        if timings is None:
+            validator_errors = validator.validate(commit_message)
+        else:
+            with timings.phase(f"validator.{validator.__class__.__name__}"):
+                validator_errors = validator.validate(commit_message)
 
-    for validator_class in validator_classes:
-        console.verbose(f"running validator {validator_class.__name__}")
-        validator = validator_class(commit_message)
-        if not validator.is_valid():
-            console.verbose(f"{validator_class.__name__}: validation failed")
+        if validator_errors:
+            console.verbose("%s: validation failed", validator.__class__.__name__)
             if fail_fast:
-                console.verbose(f"fail_fast: {fail_fast}, skipping further validations")
+                console.verbose(
+                    "fail_fast: %s, skipping further validations", fail_fast
+                )
                 # returning immediately if any error occurs.
-                return False, validator.errors()
+                return LintResult(False, validator_errors)
 
-            success = False
-            errors.extend(validator.errors())
+            errors.extend(validator_errors)
 
-    return success, errors
+    return LintResult(not errors, errors)
@@ -0,0 +1,91 @@
+"""
+This module provides the shared read-only view of a commit message.
+
+The linter creates one view per commit message and passes it to every helper and
+validator. The header boundary is found lazily with `str.find` and cached, so the
+message is scanned at most once, however large the body is.
+"""
+
+from typing import Optional, Union
+
+
+class CommitMessageView:
+    """
+    Read-only view of a commit message with lazily computed header boundaries.
+
+    Attributes:
+        text (str): The full commit message.
+
+    Example:
+        ```python
+        view = CommitMessageView("feat: add new feature\n\nbody")
+        view.header  # "feat: add new feature"
+        view.body_start  # 23
+        ```
+    """
+
+    __slots__ = ("text", "_header_end", "_header", "_first_line")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._header_end = -1
+        self._header: Optional[str] = None
+        self._first_line: Optional[str] = None
+
+    @classmethod
+    def of(cls, commit_message: Union[str, "CommitMessageView"]) -> "CommitMessageView":
+        """
+        Returns a view of the commit message, reusing it if it's already a view.
+
+        Args:
+            commit_message (Union[str, CommitMessageView]): The commit message or
+                its view.
+
+        Returns:
+            CommitMessageView: The view of the commit message.
+        """
+        if isinstance(commit_message, CommitMessageView):
+            return commit_message
+
+        return cls(commit_message)
+
+    @property
+    def header_end(self) -> int:
+        """The position of the first line feed, or the length of the message."""
+        if self._header_end == -1:
+            header_end = self.text.find("\n")
+            self._header_end = len(self.text) if header_end == -1 else header_end
+
+        return self._header_end
+
+    @property
+    def header(self) -> str:
+        """The header of the commit message, i.e. its text up to the first line feed."""
+        if self._header is None:
+            self._header = self.text[: self.header_end]
+
+        return self._header
+
+    @property
+    def first_line(self) -> str:
+        """
+        The first line of the commit message, using all the line boundaries of
+        `str.splitlines` (e.g. a carriage return also ends the line).
+        """
+        if self._first_line is None:
+            # all the line boundaries are inside the header or at its end
+            lines = self.header.splitlines()
+            self._first_line = lines[0] if lines else ""
+
+        return self._first_line
+
+    @property
+    def body_start(self) -> int:
+        """The position right after the first line feed, or the message length."""
+        return min(self.header_end + 1, len(self.text))
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __str__(self) -> str:
+        return self.text
@@ -0,0 +1,76 @@
+"""
+This module contains helpers for reading delimited records from binary streams.
+"""
+
+from typing import IO, Iterator
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def iter_delimited_records(
+    stream: IO[bytes], delimiter: bytes = b"\0", chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Incrementally read delimiter separated records from a binary stream.
+
+    Only the record currently being read is kept in memory, so the memory usage
+    doesn't grow with the size of the stream. A trailing record without the
+    delimiter is yielded as well.
+
+    Buffered streams are read with `read1`, so the records are yielded as soon as
+    they're written to a pipe instead of once a whole chunk is available.
+
+    Args:
+        stream (IO[bytes]): The binary stream to read from.
+        delimiter (bytes, optional): The record delimiter (default is NUL).
+        chunk_size (int, optional): Number of bytes to read at a time.
+
+    Yields:
+        bytes: The records without the delimiter.
+    """
+    read = getattr(stream, "read1", stream.read)
+    buffer = bytearray()
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+
+        # searching only the newly read bytes (and a possible partial delimiter)
+        search_from = max(0, len(buffer) - len(delimiter) + 1)
+        buffer += chunk
+
+        start = 0
+        end = buffer.find(delimiter, search_from)
+        while end != -1:
+            yield bytes(buffer[start:end])
+            start = end + len(delimiter)
+            end = buffer.find(delimiter, start)
+
+        del buffer[:start]
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def iter_commit_messages(
+    stream: IO[bytes], delimiter: bytes = b"\0", chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Incrementally read delimiter separated commit messages from a binary stream,
+    e.g. the output of `git log -z --format=%B`.
+
+    The messages are decoded as UTF-8, replacing invalid bytes, and stripped.
+    Empty messages are skipped.
+
+    Args:
+        stream (IO[bytes]): The binary stream to read from.
+        delimiter (bytes, optional): The message delimiter (default is NUL).
+        chunk_size (int, optional): Number of bytes to read at a time.
+
+    Yields:
+        str: The commit messages.
+    """
+    for record in iter_delimited_records(stream, delimiter, chunk_size):
+        commit_message = record.decode("utf-8", errors="replace").strip()
+        if commit_message:
+            yield commit_message
@@ -0,0 +1,220 @@
+"""
+This module provides the wall time recorder used by the `--timings` option.
+
+The recorder collects the duration of each phase of a commitlint run (e.g.
+argument parsing, message retrieval, preprocessing, each validator and
+rendering) and summarizes them as a table or as JSON.
+"""
+
+import heapq
+from contextlib import contextmanager
+from itertools import count
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# number of the slowest commit messages shown in the summary
+SLOWEST_MESSAGES_COUNT = 5
+
+TIMINGS_FORMATS = ("table", "json")
+
+
+def _percentile(sorted_values: List[float], percent: int) -> float:
+    """Returns the nearest-rank percentile of the sorted values."""
+    index = max(0, -(-len(sorted_values) * percent // 100) - 1)
+    return sorted_values[index]
+
+
+class Timings:
+    """
+    Wall time recorder of the phases of a commitlint run.
+
+    Attributes:
+        slowest_count (int): Number of the slowest commit messages to keep.
+        start (float): The `perf_counter` value at the start of the run.
+
+    Example:
+        ```python
+        timings = Timings()
+        with timings.phase("retrieve"):
+            commit_message = get_commit_message_of_hash("HEAD")
+
+        print(timings.render_table())
+        ```
+    """
+
+    __slots__ = ("slowest_count", "start", "_phases", "_slowest", "_counter")
+
+    def __init__(
+        self,
+        slowest_count: int = SLOWEST_MESSAGES_COUNT,
+        start: Optional[float] = None,
+    ) -> None:
+        self.slowest_count = slowest_count
+        self.start = perf_counter() if start is None else start
+        self._phases: Dict[str, List[float]] = {}
+        self._slowest: List[Tuple[float, int, str]] = []
+        self._counter = count()
+
+    def add(self, name: str, seconds: float) -> None:
+        """
+        Records a duration of a phase.
+
+        Args:
+            name (str): The name of the phase.
+            seconds (float): The duration in seconds.
+        """
+        durations = self._phases.get(name)
+        if durations is None:
+            durations = self._phases[name] = []
+
+        durations.append(seconds)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Records the wall time of the enclosed block as a phase.
+
+        Args:
+            name (str): The name of the phase.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, perf_counter() - start)
+
+    def iter_timed(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """
+        Yields the items of the iterable, recording the time to produce each one.
+
+        Only the yielded items are recorded, not the final call that exhausts the
+        iterable. This is used for the lazily produced commit messages, whose
+        retrieval is interleaved with the linting.
+
+        Args:
+            name (str): The name of the phase.
+            iterable (Iterable[T]): The iterable to consume.
+
+        Yields:
+            T: The items of the iterable.
+        """
+        start = perf_counter()
+        for item in iterable:
+            self.add(name, perf_counter() - start)
+            yield item
+            # the time spent by the consumer isn't part of the phase
+            start = perf_counter()
+
+    def add_message(self, commit_message: str, seconds: float) -> None:
+        """
+        Records the lint duration of a commit message.
+
+        Args:
+            commit_message (str): The linted commit message.
+            seconds (float): The duration in seconds.
+        """
+        self.add("lint", seconds)
+
+        entry = (seconds, next(self._counter), commit_message)
+        if len(self._slowest) < self.slowest_count:
+            heapq.heappush(self._slowest, entry)
+        elif self._slowest and seconds > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarizes the recorded durations.
+
+        Returns:
+            Dict[str, Any]: The count, total, p50, p95 and max of each phase in
+                seconds, the total wall time, and the slowest commit messages.
+        """
+        phases = []
+        for name, durations in self._phases.items():
+            sorted_durations = sorted(durations)
+            phases.append(
+                {
+                    "name": name,
+                    "count": len(durations),
+                    "total": sum(durations),
+                    "p50": _percentile(sorted_durations, 50),
+                    "p95": _percentile(sorted_durations, 95),
+                    "max": sorted_durations[-1],
+                }
+            )
+
+        slowest_messages = [
+            {"seconds": seconds, "header": commit_message.split("\n", 1)[0]}
+            for seconds, _, commit_message in sorted(self._slowest, reverse=True)
+        ]
+
+        return {
+            "total": perf_counter() - self.start,
+            "phases": phases,
+            "slowest_messages": slowest_messages,
+        }
+
+    def render_json(self) -> str:
+        """
+        Renders the summary as JSON.
+
+        Returns:
+            str: The summary as a JSON document.
+        """
+        import json  # pylint: disable=import-outside-toplevel
+
+        return json.dumps(self.summary(), indent=2)
+
+    def render_table(self) -> str:
+        """
+        Renders the summary as a table, with the durations in milliseconds.
+
+        Returns:
+            str: The summary as a table.
+        """
+        summary = self.summary()
+        name_width = max(
+            [len("phase")] + [len(phase["name"]) for phase in summary["phases"]]
+        )
+
+        lines = [
+            f"{'phase':<{name_width}}  {'count':>7}  {'total ms':>10}  "
+            f"{'p50 ms':>9}  {'p95 ms':>9}  {'max ms':>9}"
+        ]
+        for phase in summary["phases"]:
+            lines.append(
+                f"{phase['name']:<{name_width}}  {phase['count']:>7}  "
+                f"{phase['total'] * 1e3:>10.3f}  {phase['p50'] * 1e3:>9.3f}  "
+                f"{phase['p95'] * 1e3:>9.3f}  {phase['max'] * 1e3:>9.3f}"
+            )
+
+        lines.append(
+            f"{'total':<{name_width}}  {'':>7}  {summary['total'] * 1e3:>10.3f}"
+        )
+
+        if summary["slowest_messages"]:
+            lines.append("")
+            lines.append("slowest commit messages:")
+            for message in summary["slowest_messages"]:
+                lines.append(
+                    f"{message['seconds'] * 1e3:>10.3f} ms  {message['header']}"
+                )
+
+        return "\n".join(lines)
+
+    def render(self, timings_format: str) -> str:
+        """
+        Renders the summary in the given format.
+
+        Args:
+            timings_format (str): Either "table" or "json".
+
+        Returns:
+            str: The rendered summary.
+        """
+        if timings_format == "json":
+            return self.render_json()
+
+        return self.render_table()
@@ -0,0 +1,35 @@
+# type: ignore
+# pylint: disable=all
+import os
+import subprocess
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "commitlint",
+    "GIT_AUTHOR_EMAIL": "commitlint@example.com",
+    "GIT_COMMITTER_NAME": "commitlint",
+    "GIT_COMMITTER_EMAIL": "commitlint@example.com",
+    "GIT_CONFIG_NOSYSTEM": "1",
+    "GIT_CONFIG_GLOBAL": os.devnull,
+}
+
+
+def git(repo_path, *args):
+    """Runs a git command in the repository and returns the stripped stdout."""
+    return subprocess.check_output(
+        ["git", *args], cwd=repo_path, env={**os.environ, **GIT_ENV}, text=True
+    ).strip()
+
+
+def create_git_repo(repo_path, commit_messages):
+    """
+    Creates a git repository with an empty commit for each of the commit messages.
+
+    Returns the list of commit hashes, oldest first.
+    """
+    git(repo_path, "init", "--quiet")
+    hashes = []
+    for commit_message in commit_messages:
+        git(repo_path, "commit", "--quiet", "--allow-empty", "-m", commit_message)
+        hashes.append(git(repo_path, "rev-parse", "HEAD"))
+
+    return hashes
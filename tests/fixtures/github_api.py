@@ -0,0 +1,115 @@
+# type: ignore
+# pylint: disable=all
+import gzip
+import json
+import pathlib
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # keeps the connections alive between the requests
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        self._respond(dict(urllib.parse.parse_qsl(url.query)))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self._respond(json.loads(self.rfile.read(length) or b"null"))
+
+    def _respond(self, request_data):
+        server = self.server
+        url = urllib.parse.urlsplit(self.path)
+        server.requests.append(
+            {
+                "method": self.command,
+                "path": url.path,
+                "params": dict(urllib.parse.parse_qsl(url.query)),
+                "headers": dict(self.headers),
+                "body": request_data if self.command == "POST" else None,
+            }
+        )
+        if server.delay:
+            time.sleep(server.delay)
+
+        status, data = server.routes.get(url.path, (404, {"message": "Not Found"}))
+        if callable(data):
+            data = data(request_data)
+
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        if server.close_connections:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeGitHubAPI(ThreadingHTTPServer):
+    """
+    Local stand-in of the GitHub API, serving JSON responses by path.
+
+    Attributes:
+        routes (dict): The `(status, data)` response of each path, where `data`
+            can be a function of the query parameters, or of the JSON body of
+            POST requests.
+        requests (list): The received requests, with their method, path, query
+            parameters, headers and body.
+        connections (int): The number of accepted connections.
+        delay (float): Seconds to wait before each response.
+        close_connections (bool): Whether to close the connection after each
+            response.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.routes = {}
+        self.requests = []
+        self.connections = 0
+        self.delay = 0.0
+        self.close_connections = False
+        self._thread = threading.Thread(
+            target=self.serve_forever, args=(0.01,), daemon=True
+        )
+
+    def handle_error(self, request, client_address):
+        # the clients may drop the connection, e.g. on a read timeout
+        pass
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self.shutdown()
+        self.server_close()
+
+
+RECORDED_RESPONSES_DIR = pathlib.Path(__file__).parent / "github_api_responses"
+
+
+def load_recorded_response(name):
+    """Loads a recorded response of the GitHub API, from `github_api_responses`."""
+    return json.loads((RECORDED_RESPONSES_DIR / f"{name}.json").read_text())
@@ -0,0 +1,198 @@
+# type: ignore
+# pylint: disable=all
+import os
+from unittest.mock import patch
+
+from commitlint.cache import LintCache
+from commitlint.config import config
+from commitlint.linter import (
+    ErrorCode,
+    LintError,
+    LintResult,
+    lint_commit_message,
+    lint_commit_messages,
+)
+from commitlint.messages import INCORRECT_FORMAT_ERROR
+from commitlint.timings import Timings
+
+SUCCESS_RESULT = LintResult(True)
+FAILURE_RESULT = LintResult(
+    False,
+    [
+        LintError(ErrorCode.COMMIT_TYPE_INVALID, ("feet",)),
+        LintError(ErrorCode.DESCRIPTION_MISSING),
+    ],
+)
+
+
+def test__lint_cache__get_returns_none_for_missing_entry(tmp_path):
+    cache = LintCache(str(tmp_path))
+    assert cache.get("feat: commit message", False, False) is None
+
+
+def test__lint_cache__set_and_get(tmp_path):
+    cache = LintCache(str(tmp_path))
+    cache.set("Invalid commit message", False, False, FAILURE_RESULT)
+
+    assert cache.get("Invalid commit message", False, False) == FAILURE_RESULT
+    # entries are shared between instances
+    assert (
+        LintCache(str(tmp_path)).get("Invalid commit message", False, False)
+        == FAILURE_RESULT
+    )
+
+
+def test__lint_cache__key_depends_on_options(tmp_path):
+    cache = LintCache(str(tmp_path))
+    cache.set("Invalid commit message", False, False, FAILURE_RESULT)
+
+    assert cache.get("Invalid commit message", True, False) is None
+    assert cache.get("Invalid commit message", False, True) is None
+
+
+def test__lint_cache__key_depends_on_version(tmp_path):
+    LintCache(str(tmp_path)).set("commit message", False, False, SUCCESS_RESULT)
+
+    with patch("commitlint.cache.__version__", "0.0.0"):
+        assert LintCache(str(tmp_path)).get("commit message", False, False) is None
+
+
+def test__lint_cache__key_depends_on_rules(tmp_path):
+    LintCache(str(tmp_path)).set("commit message", False, False, SUCCESS_RESULT)
+
+    with patch("commitlint.cache.COMMIT_TYPES", ("feat",)):
+        assert LintCache(str(tmp_path)).get("commit message", False, False) is None
+
+
+def test__lint_cache__corrupted_entry_is_a_miss(tmp_path):
+    cache = LintCache(str(tmp_path))
+    cache.set("commit message", False, False, SUCCESS_RESULT)
+    path = cache._entry_path("commit message", False, False)
+    with open(path, "w") as entry_file:
+        entry_file.write("{not json")
+
+    assert cache.get("commit message", False, False) is None
+
+
+def test__lint_cache__unknown_error_code_is_a_miss(tmp_path):
+    cache = LintCache(str(tmp_path))
+    cache.set("commit message", False, False, SUCCESS_RESULT)
+    path = cache._entry_path("commit message", False, False)
+    with open(path, "w") as entry_file:
+        entry_file.write('{"success": false, "errors": [["unknown-code", []]]}')
+
+    assert cache.get("commit message", False, False) is None
+
+
+def test__lint_cache__key_depends_on_format_version(tmp_path):
+    LintCache(str(tmp_path)).set("commit message", False, False, SUCCESS_RESULT)
+
+    with patch("commitlint.cache.CACHE_FORMAT_VERSION", 1):
+        assert LintCache(str(tmp_path)).get("commit message", False, False) is None
+
+
+def test__lint_cache__prune_removes_least_recently_used_entries(tmp_path):
+    cache = LintCache(str(tmp_path), max_entries=2)
+    for i in range(3):
+        cache.set(f"commit message {i}", False, False, SUCCESS_RESULT)
+        path = cache._entry_path(f"commit message {i}", False, False)
+        os.utime(path, (i, i))
+
+    # reading the oldest entry marks it as recently used
+    assert cache.get("commit message 0", False, False) == SUCCESS_RESULT
+    cache.prune()
+
+    assert cache.get("commit message 0", False, False) == SUCCESS_RESULT
+    assert cache.get("commit message 1", False, False) is None
+    assert cache.get("commit message 2", False, False) == SUCCESS_RESULT
+
+
+def test__lint_cache__prune_without_writes_does_nothing(tmp_path):
+    cache = LintCache(str(tmp_path), max_entries=0)
+    cache.set("commit message", False, False, SUCCESS_RESULT)
+
+    LintCache(str(tmp_path), max_entries=0).prune()
+
+    assert cache.get("commit message", False, False) == SUCCESS_RESULT
+
+
+def test__lint_cache__write_failure_is_ignored(tmp_path):
+    cache_dir = tmp_path / "file"
+    cache_dir.write_text("")
+    cache = LintCache(str(cache_dir))
+
+    cache.set("commit message", False, False, SUCCESS_RESULT)
+
+    assert cache.get("commit message", False, False) is None
+
+
+def test__lint_cache__failed_cleanup_is_ignored(tmp_path):
+    cache = LintCache(str(tmp_path))
+
+    with (
+        patch("commitlint.cache.os.replace", side_effect=OSError),
+        patch("commitlint.cache.os.remove", side_effect=OSError),
+    ):
+        cache.set("commit message", False, False, SUCCESS_RESULT)
+
+    assert cache.get("commit message", False, False) is None
+
+
+def test__lint_commit_message__stores_and_uses_cache(tmp_path):
+    cache = LintCache(str(tmp_path))
+    assert lint_commit_message("Invalid commit message", cache=cache) == (
+        False,
+        [INCORRECT_FORMAT_ERROR],
+    )
+
+    with patch("commitlint.linter._linter.Linter._lint") as mock_lint:
+        result = lint_commit_message("Invalid commit message", cache=cache)
+
+    mock_lint.assert_not_called()
+    assert result == (False, [INCORRECT_FORMAT_ERROR])
+
+
+def test__lint_commit_message__cache_hits_are_timed(tmp_path):
+    cache = LintCache(str(tmp_path))
+    lint_commit_message("feat: commit message", cache=cache)
+
+    config.timings = Timings()
+    try:
+        lint_commit_message("feat: commit message", cache=cache)
+        lint_commit_message("Invalid commit message", cache=cache)
+        summary = config.timings.summary()
+    finally:
+        config.timings = None
+
+    phases = {phase["name"]: phase["count"] for phase in summary["phases"]}
+    assert phases["cache"] == 1
+    assert phases["lint"] == 1
+    assert [message["header"] for message in summary["slowest_messages"]] == [
+        "Invalid commit message"
+    ]
+
+
+@patch("commitlint.linter._linter.PARALLEL_CHUNK_SIZE", 2)
+@patch("commitlint.linter._linter.PARALLEL_MIN_COMMITS", 4)
+def test__lint_commit_messages__parallel_writes_are_pruned(tmp_path):
+    commit_messages = [
+        f"feat: commit message {i}" if i % 3 else f"Invalid commit message {i}"
+        for i in range(50)
+    ]
+    cache = LintCache(str(tmp_path), max_entries=10)
+
+    serial_results = list(lint_commit_messages(commit_messages))
+    parallel_results = list(lint_commit_messages(commit_messages, jobs=2, cache=cache))
+    assert parallel_results == serial_results
+
+    # the results are cached by this process, not by the workers
+    with patch("commitlint.linter._linter.Linter._lint") as mock_lint:
+        cached_results = list(
+            lint_commit_messages(commit_messages, jobs=2, cache=cache)
+        )
+    mock_lint.assert_not_called()
+    assert cached_results == serial_results
+
+    cache.prune()
+    entries = list(tmp_path.rglob("*.json"))
+    assert len(entries) == 10
@@ -1,20 +1,47 @@
 # type: ignore
 # pylint: disable=all
 
-from unittest.mock import Mock, call, mock_open, patch
+import io
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import ANY, Mock, call, mock_open, patch
 
 import pytest
 
-from commitlint.cli import get_args, main
+import commitlint
+from commitlint.cli import _get_commit_message_from_file, get_args, main
 from commitlint.config import config
+from commitlint.daemon import DEFAULT_IDLE_TIMEOUT
 from commitlint.exceptions import CommitlintException
+from commitlint.commits import Commit, RangeFilters
+from commitlint.linter import (
+    ErrorCode,
+    LintError,
+    LintResult,
+    lint_commit_message_result,
+)
 from commitlint.messages import (
+    COMMIT_TYPE_INVALID_ERROR,
     INCORRECT_FORMAT_ERROR,
     VALIDATION_FAILED,
     VALIDATION_SUCCESSFUL,
 )
 
 
+def _commits(*commit_messages):
+    return [
+        Commit(
+            f"{index:040x}",
+            "Jane Doe <jane@example.com>",
+            "2024-01-01T00:00:00+00:00",
+            message,
+        )
+        for index, message in enumerate(commit_messages, 1)
+    ]
+
+
 class ArgsMock(Mock):
     """
     Args Mock, used for mocking CLI arguments.
@@ -27,6 +54,9 @@ class ArgsMock(Mock):
     ```
     """
 
+    # arguments whose parser default isn't None
+    jobs = 1
+
     def __getattr__(self, name):
         if name in self.__dict__:
             return self.__dict__[name]
@@ -55,7 +85,17 @@ class TestCLIGetArgs:
     @patch("sys.argv", ["prog", "--hash", "commit_hash"])
     def test__get_args__with_hash(self, *_):
         args = get_args()
-        assert args.hash == "commit_hash"
+        assert args.hash == ["commit_hash"]
+
+    @patch("sys.argv", ["prog", "--hash", "commit_hash_1", "commit_hash_2"])
+    def test__get_args__with_multiple_hashes(self, *_):
+        args = get_args()
+        assert args.hash == ["commit_hash_1", "commit_hash_2"]
+
+    @patch("sys.argv", ["prog", "--hash-file", "path/to/hashes.txt"])
+    def test__get_args__with_hash_file(self, *_):
+        args = get_args()
+        assert args.hash_file == "path/to/hashes.txt"
 
     @patch("sys.argv", ["prog", "--from-hash", "from_commit_hash"])
     def test__get_args__with_from_hash(self, *_):
@@ -83,6 +123,184 @@ class TestCLIGetArgs:
         args = get_args()
         assert args.skip_detail is True
 
+    @patch("sys.argv", ["prog", "--from-hash", "from_commit_hash", "--jobs", "4"])
+    def test__get_args__with_jobs(self, *_):
+        args = get_args()
+        assert args.jobs == 4
+
+    @patch("os.cpu_count", return_value=8)
+    @patch("sys.argv", ["prog", "--from-hash", "from_commit_hash", "--jobs", "auto"])
+    def test__get_args__with_jobs_auto(self, *_):
+        args = get_args()
+        assert args.jobs == 8
+
+    @patch("sys.argv", ["prog", "--from-hash", "from_commit_hash"])
+    def test__get_args__jobs_defaults_to_one(self, *_):
+        args = get_args()
+        assert args.jobs == 1
+
+    @pytest.mark.parametrize("jobs", ["0", "-1", "many"])
+    def test__get_args__with_invalid_jobs(self, jobs):
+        with patch("sys.argv", ["prog", "--from-hash", "from_hash", "--jobs", jobs]):
+            with pytest.raises(SystemExit) as ex:
+                get_args()
+        assert ex.value.code == 2
+
+    @patch("sys.argv", ["prog", "--cache", "commit_msg"])
+    def test__get_args__with_cache(self, *_):
+        args = get_args()
+        assert args.cache is True
+        assert args.cache_dir is None
+
+    @patch("sys.argv", ["prog", "--cache-dir", "path/to/cache", "commit_msg"])
+    def test__get_args__with_cache_dir(self, *_):
+        args = get_args()
+        assert args.cache_dir == "path/to/cache"
+
+    @patch("sys.argv", ["prog", "commit_msg"])
+    def test__get_args__timings_defaults_to_false(self, *_):
+        args = get_args()
+        assert args.timings is False
+        assert args.timings_format == "table"
+
+    @patch("sys.argv", ["prog", "--timings", "commit_msg"])
+    def test__get_args__with_timings(self, *_):
+        args = get_args()
+        assert args.timings is True
+        assert args.commit_message == "commit_msg"
+
+    @patch("sys.argv", ["prog", "--timings", "--timings-format=json", "commit_msg"])
+    def test__get_args__with_timings_json(self, *_):
+        args = get_args()
+        assert args.timings is True
+        assert args.timings_format == "json"
+        assert args.commit_message == "commit_msg"
+
+    @patch("sys.argv", ["prog", "--std"])
+    def test__get_args__abbreviations_are_rejected(self, *_):
+        # commitlint-client matches the options literally, e.g. --stdin
+        with pytest.raises(SystemExit) as ex:
+            get_args()
+        assert ex.value.code == 2
+
+    @patch("sys.argv", ["prog", "--timings-format=csv", "commit_msg"])
+    def test__get_args__with_invalid_timings_format(self, *_):
+        with pytest.raises(SystemExit) as ex:
+            get_args()
+        assert ex.value.code == 2
+
+    @patch("sys.argv", ["prog", "--stdin"])
+    def test__get_args__with_stdin(self, *_):
+        args = get_args()
+        assert args.stdin is True
+        assert args.delimiter is None
+
+    @patch("sys.argv", ["prog", "--stdin", "-z"])
+    def test__get_args__with_stdin_null(self, *_):
+        args = get_args()
+        assert args.delimiter == "\0"
+
+    @patch("sys.argv", ["prog", "--stdin", "--delimiter=---"])
+    def test__get_args__with_stdin_delimiter(self, *_):
+        args = get_args()
+        assert args.delimiter == "---"
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["prog", "--stdin", "--delimiter", ""],
+            ["prog", "-z", "commit_msg"],
+            ["prog", "--delimiter", "---", "--file", "path/to/file.txt"],
+        ],
+    )
+    def test__get_args__with_invalid_delimiter(self, argv):
+        with patch("sys.argv", argv):
+            with pytest.raises(SystemExit) as ex:
+                get_args()
+        assert ex.value.code == 2
+
+    @patch("sys.argv", ["prog", "--from-hash", "from_commit_hash"])
+    def test__get_args__git_backend_defaults_to_git(self, *_):
+        args = get_args()
+        assert args.git_backend == "git"
+
+    @patch(
+        "sys.argv",
+        ["prog", "--from-hash", "from_commit_hash", "--git-backend", "python"],
+    )
+    def test__get_args__with_git_backend(self, *_):
+        args = get_args()
+        assert args.git_backend == "python"
+
+    @patch(
+        "sys.argv",
+        [
+            "prog",
+            "--from-hash",
+            "from_commit_hash",
+            "--no-merges",
+            "--first-parent",
+            "--author",
+            "Jane",
+            "--since",
+            "2 weeks ago",
+            "-n",
+            "50",
+            "--path",
+            "packages/api",
+            "--path",
+            "docs",
+        ],
+    )
+    def test__get_args__with_range_filters(self, *_):
+        args = get_args()
+        assert args.no_merges is True
+        assert args.first_parent is True
+        assert args.author == "Jane"
+        assert args.since == "2 weeks ago"
+        assert args.max_count == 50
+        assert args.paths == ["packages/api", "docs"]
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["prog", "--hash", "abc123", "--no-merges"],
+            ["prog", "--file", "path/to/file.txt", "--path", "docs"],
+            ["prog", "commit message", "--max-count", "5"],
+            ["prog", "--from-hash", "abc123", "--max-count", "0"],
+            ["prog", "--from-hash", "abc123", "--git-backend", "python", "--path", "a"],
+            [
+                "prog",
+                "--from-hash",
+                "abc123",
+                "--git-backend",
+                "python",
+                "--since",
+                "x",
+            ],
+        ],
+    )
+    def test__get_args__with_invalid_range_filters(self, argv):
+        with patch("sys.argv", argv):
+            with pytest.raises(SystemExit) as ex:
+                get_args()
+        assert ex.value.code == 2
+
+    @patch("sys.argv", ["prog", "--serve"])
+    def test__get_args__with_serve(self, *_):
+        args = get_args()
+        assert args.serve is True
+        assert args.idle_timeout == DEFAULT_IDLE_TIMEOUT
+
+    @patch("sys.argv", ["prog", "--serve", "--idle-timeout", "30"])
+    def test__get_args__with_idle_timeout(self, *_):
+        args = get_args()
+        assert args.idle_timeout == 30.0
+
+    def test__get_args__with_argv(self):
+        args = get_args(["--hash", "commit_hash"])
+        assert args.hash == ["commit_hash"]
+
     @patch("sys.argv", ["prog", "--hide-input", "commit_msg"])
     def test__get_args__with_hide_input(self, *_):
         args = get_args()
@@ -230,13 +448,48 @@ class TestCLIMain:
             ]
         )
 
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(file="path/to/file.txt"),
+    )
+    @patch(
+        "builtins.open",
+        mock_open(
+            read_data=(
+                "Invalid commit message 3\n"
+                "# Please enter the commit message for your changes.\n"
+                "#\n"
+                "# ------------------------ >8 ------------------------\n"
+                "# Do not modify or remove the line above.\n"
+                "diff --git a/file b/file\n"
+                "+feat: valid commit message\n"
+            )
+        ),
+    )
+    def test__main__invalid_commit_message_with_verbose_file(
+        self, _mock_get_args, mock_output_error, _mock_output_success
+    ):
+        with pytest.raises(SystemExit):
+            main()
+
+        mock_output_error.assert_has_calls(
+            [
+                call(
+                    "⧗ Input:\nInvalid commit message 3\n"
+                    "# Please enter the commit message for your changes.\n#\n"
+                ),
+                call("✖ Found 1 error(s)."),
+                call(f"- {INCORRECT_FORMAT_ERROR}"),
+            ]
+        )
+
     # main: hash
 
     @patch(
         "commitlint.cli.get_args",
-        return_value=ArgsMock(hash="commit_hash"),
+        return_value=ArgsMock(hash=["commit_hash"]),
     )
-    @patch("commitlint.cli.get_commit_message_of_hash")
+    @patch("commitlint.git_helpers.get_commit_message_of_hash")
     def test__main__valid_commit_message_with_hash(
         self,
         mock_get_commit_message_of_hash,
@@ -250,9 +503,9 @@ class TestCLIMain:
 
     @patch(
         "commitlint.cli.get_args",
-        return_value=ArgsMock(hash="commit_hash"),
+        return_value=ArgsMock(hash=["commit_hash"]),
     )
-    @patch("commitlint.cli.get_commit_message_of_hash")
+    @patch("commitlint.git_helpers.get_commit_message_of_hash")
     def test__main__invalid_commit_message_with_hash(
         self,
         mock_get_commit_message_of_hash,
@@ -273,13 +526,168 @@ class TestCLIMain:
             ]
         )
 
+    # main: multiple hashes
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(hash=["commit_hash_1", "commit_hash_2"]),
+    )
+    @patch("commitlint.git_helpers.get_commits_of_hashes")
+    def test__main__valid_commit_messages_with_multiple_hashes(
+        self,
+        mock_get_commits_of_hashes,
+        _mock_get_args,
+        mock_output_error,
+        mock_output_success,
+    ):
+        mock_get_commits_of_hashes.return_value = iter(
+            _commits("feat: commit message 1", "fix: commit message 2")
+        )
+        main()
+        mock_get_commits_of_hashes.assert_called_once_with(
+            ["commit_hash_1", "commit_hash_2"]
+        )
+        mock_output_success.assert_called_once_with(f"{VALIDATION_SUCCESSFUL}")
+        mock_output_error.assert_not_called()
+
+    @patch("commitlint.git_helpers.get_commits_of_hashes")
+    def test__main__invalid_commit_messages_with_hash_file(
+        self,
+        mock_get_commits_of_hashes,
+        mock_output_error,
+        mock_output_success,
+        tmp_path,
+    ):
+        hash_file = tmp_path / "hashes.txt"
+        hash_file.write_text("# release audit\ncommit_hash_1\n\n  commit_hash_2\n")
+        mock_get_commits_of_hashes.side_effect = lambda hashes: iter(
+            _commits(
+                *(
+                    "Invalid commit message"
+                    if commit_hash == "commit_hash_2"
+                    else "feat: ok"
+                    for commit_hash in hashes
+                )
+            )
+        )
+
+        with pytest.raises(SystemExit):
+            main(["--hash-file", str(hash_file)])
+
+        mock_output_success.assert_not_called()
+        mock_output_error.assert_has_calls(
+            [
+                call(
+                    f"⧗ Commit: {2:040x} (Jane Doe <jane@example.com>, "
+                    "2024-01-01T00:00:00+00:00)"
+                ),
+                call("⧗ Input:\nInvalid commit message\n"),
+                call("✖ Found 1 error(s)."),
+                call(f"- {INCORRECT_FORMAT_ERROR}"),
+            ]
+        )
+
+    @patch("commitlint.git_helpers.get_commits_of_hashes")
+    @patch("sys.stdin", io.StringIO("commit_hash_1\ncommit_hash_2\n"))
+    def test__main__hash_file_from_stdin(
+        self, mock_get_commits_of_hashes, _mock_output_error, *_
+    ):
+        seen = []
+
+        def get_commits(hashes):
+            for commit_hash in hashes:
+                seen.append(commit_hash)
+                yield from _commits("feat: valid commit message")
+
+        mock_get_commits_of_hashes.side_effect = get_commits
+
+        main(["--hash-file", "-"])
+
+        assert seen == ["commit_hash_1", "commit_hash_2"]
+
+    def test__main__hash_file_not_found(self, mock_output_error, *_):
+        with pytest.raises(SystemExit):
+            main(["--hash-file", "path/to/missing.txt"])
+
+        mock_output_error.assert_called_with(
+            "Error: file 'path/to/missing.txt' not found"
+        )
+
+    # main: git backend
+
+    @patch("commitlint.git_objects.get_commits_of_hash_range")
+    @patch("commitlint.git_helpers.get_commits_of_hash_range")
+    def test__main__hash_range_with_python_git_backend(
+        self, mock_git_log, mock_git_objects, _mock_output_error, mock_output_success
+    ):
+        mock_git_objects.return_value = iter(_commits("feat: commit message 1"))
+
+        main(["--from-hash", "start_commit_hash", "--git-backend", "python"])
+
+        mock_git_objects.assert_called_once_with(
+            "start_commit_hash",
+            "HEAD",
+            RangeFilters(),
+        )
+        mock_git_log.assert_not_called()
+        mock_output_success.assert_called_once_with(f"{VALIDATION_SUCCESSFUL}")
+
+    @patch("commitlint.git_helpers.get_commits_of_hash_range")
+    def test__main__hash_range_with_filters(
+        self, mock_get_commit_messages, _mock_output_error, mock_output_success
+    ):
+        mock_get_commit_messages.return_value = iter(_commits("feat: commit message 1"))
+
+        main(
+            [
+                "--from-hash",
+                "start_commit_hash",
+                "--no-merges",
+                "--author",
+                "Jane",
+                "--path",
+                "packages/api",
+            ]
+        )
+
+        mock_get_commit_messages.assert_called_once_with(
+            "start_commit_hash",
+            "HEAD",
+            RangeFilters(no_merges=True, author="Jane", paths=("packages/api",)),
+        )
+        mock_output_success.assert_called_once_with(f"{VALIDATION_SUCCESSFUL}")
+
+    @patch("commitlint.git_objects.get_commit_message_of_hash")
+    def test__main__hash_with_python_git_backend(
+        self, mock_get_commit_message_of_hash, _mock_output_error, mock_output_success
+    ):
+        mock_get_commit_message_of_hash.return_value = "feat: valid commit message"
+
+        main(["--hash", "commit_hash", "--git-backend=python"])
+
+        mock_get_commit_message_of_hash.assert_called_once_with("commit_hash")
+        mock_output_success.assert_called_once_with(f"{VALIDATION_SUCCESSFUL}")
+
+    @patch("commitlint.cache.LintCache")
+    @patch("commitlint.git_dir.find_git_dir", return_value="/repo/.git")
+    @patch("commitlint.git_helpers.get_git_dir")
+    def test__main__cache_with_python_git_backend(
+        self, mock_get_git_dir, _mock_find_git_dir, mock_lint_cache, *_
+    ):
+        mock_lint_cache.return_value.get.return_value = None
+
+        main(["feat: valid commit message", "--cache", "--git-backend", "python"])
+
+        mock_get_git_dir.assert_not_called()
+        mock_lint_cache.assert_called_once_with("/repo/.git/commitlint-cache")
+
     # main: from_hash and to_hash
 
     @patch(
         "commitlint.cli.get_args",
         return_value=ArgsMock(from_hash="start_commit_hash", to_hash="end_commit_hash"),
     )
-    @patch("commitlint.cli.get_commit_messages_of_hash_range")
+    @patch("commitlint.git_helpers.get_commits_of_hash_range")
     def test__main__valid_commit_message_with_hash_range(
         self,
         mock_get_commit_messages,
@@ -287,10 +695,10 @@ class TestCLIMain:
         _mock_output_error,
         mock_output_success,
     ):
-        mock_get_commit_messages.return_value = [
+        mock_get_commit_messages.return_value = _commits(
             "feat: commit message 1",
             "fix: commit message 2",
-        ]
+        )
         main()
         mock_output_success.assert_called_with(f"{VALIDATION_SUCCESSFUL}")
 
@@ -300,7 +708,7 @@ class TestCLIMain:
             from_hash="invalid_start_hash", to_hash="end_commit_hash"
         ),
     )
-    @patch("commitlint.cli.get_commit_messages_of_hash_range")
+    @patch("commitlint.git_helpers.get_commits_of_hash_range")
     def test__main__invalid_commit_message_with_hash_range(
         self,
         mock_get_commit_messages,
@@ -308,13 +716,106 @@ class TestCLIMain:
         _mock_output_error,
         _mock_output_success,
     ):
-        mock_get_commit_messages.return_value = [
+        mock_get_commit_messages.return_value = _commits(
             "Invalid commit message 1",
             "Invalid commit message 2",
-        ]
+        )
+
+        with pytest.raises(SystemExit):
+            main()
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(from_hash="start_commit_hash", to_hash="end_commit_hash"),
+    )
+    @patch("commitlint.git_helpers.get_commits_of_hash_range")
+    def test__main__shows_the_commit_of_errors_for_hash_range(
+        self,
+        mock_get_commits,
+        _mock_get_args,
+        mock_output_error,
+        _mock_output_success,
+    ):
+        mock_get_commits.return_value = _commits(
+            "feat: commit message 1",
+            "Invalid commit message 2",
+        )
+
+        with pytest.raises(SystemExit):
+            main()
+
+        mock_output_error.assert_any_call(
+            f"⧗ Commit: {2:040x} (Jane Doe <jane@example.com>, "
+            "2024-01-01T00:00:00+00:00)"
+        )
+        assert not any(
+            f"{1:040x}" in error_call.args[0]
+            for error_call in mock_output_error.call_args_list
+        )
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(
+            from_hash="start_commit_hash", to_hash="end_commit_hash", jobs=2
+        ),
+    )
+    @patch("commitlint.cli.lint_commit_message_results", return_value=iter([]))
+    @patch("commitlint.git_helpers.get_commits_of_hash_range")
+    def test__main__passes_jobs_for_hash_range(
+        self,
+        mock_get_commit_messages,
+        mock_lint_commit_message_results,
+        _mock_get_args,
+        _mock_output_error,
+        _mock_output_success,
+    ):
+        main()
+        mock_lint_commit_message_results.assert_called_once_with(
+            ANY, skip_detail=None, jobs=2, cache=None
+        )
 
+    @patch("commitlint.git_helpers.get_git_dir", return_value="/repo/.git")
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(commit_message="feat: valid commit message", cache=True),
+    )
+    @patch("commitlint.cache.LintCache")
+    def test__main__with_cache_uses_git_dir(
+        self,
+        mock_lint_cache,
+        _mock_get_args,
+        _mock_get_git_dir,
+        _mock_output_error,
+        mock_output_success,
+    ):
+        mock_lint_cache.return_value.get.return_value = LintResult(True)
+        main()
+        mock_lint_cache.assert_called_once_with("/repo/.git/commitlint-cache")
+        mock_lint_cache.return_value.prune.assert_called_once()
+        mock_output_success.assert_called_with(f"{VALIDATION_SUCCESSFUL}")
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(
+            commit_message="Invalid commit message", cache_dir="path/to/cache"
+        ),
+    )
+    @patch("commitlint.cache.LintCache")
+    def test__main__with_cache_dir_prunes_on_failure(
+        self,
+        mock_lint_cache,
+        _mock_get_args,
+        mock_output_error,
+        _mock_output_success,
+    ):
+        mock_lint_cache.return_value.get.return_value = LintResult(
+            False, [LintError(ErrorCode.COMMIT_TYPE_INVALID, ("feet",))]
+        )
         with pytest.raises(SystemExit):
             main()
+        mock_lint_cache.assert_called_once_with("path/to/cache")
+        mock_lint_cache.return_value.prune.assert_called_once()
+        mock_output_error.assert_called_with(f"- {COMMIT_TYPE_INVALID_ERROR % 'feet'}")
 
     # main : exception handling
 
@@ -323,16 +824,18 @@ class TestCLIMain:
         return_value=ArgsMock(commit_message="feat: commit message"),
     )
     @patch(
-        "commitlint.cli.lint_commit_message",
+        "commitlint.cli.lint_commit_message_result",
     )
     def test__main__handle_exceptions(
         self,
-        mock_lint_commit_message,
+        mock_lint_commit_message_result,
         _mock_get_args,
         mock_output_error,
         _mock_output_success,
     ):
-        mock_lint_commit_message.side_effect = CommitlintException("Test message")
+        mock_lint_commit_message_result.side_effect = CommitlintException(
+            "Test message"
+        )
 
         with pytest.raises(SystemExit):
             main()
@@ -369,6 +872,77 @@ class TestCLIMain:
         main()
         assert config.verbose is True
 
+    # main : timings
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(
+            from_hash="start_commit_hash",
+            to_hash="end_commit_hash",
+            timings=True,
+            timings_format="table",
+        ),
+    )
+    @patch("commitlint.git_helpers.get_commits_of_hash_range")
+    @patch("commitlint.console.report")
+    def test__main__with_timings_reports_phases(
+        self, mock_report, mock_get_commit_messages, *_
+    ):
+        mock_get_commit_messages.return_value = _commits(
+            "feat: commit message 1",
+            "Invalid commit message 2",
+        )
+
+        try:
+            with pytest.raises(SystemExit):
+                main()
+        finally:
+            config.timings = None
+
+        mock_report.assert_called_once()
+        report = mock_report.call_args.args[0]
+        for phase in (
+            "parse_args",
+            "retrieve",
+            "preprocess.is_ignored",
+            "validator.HeaderLengthValidator",
+            "validator.PatternValidator",
+            "lint",
+            "render",
+            "slowest commit messages:",
+            "Invalid commit message 2",
+        ):
+            assert phase in report
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(
+            commit_message="feat: test commit", timings=True, timings_format="json"
+        ),
+    )
+    @patch("commitlint.console.report")
+    def test__main__with_timings_json(self, mock_report, *_):
+        try:
+            main()
+        finally:
+            config.timings = None
+
+        summary = json.loads(mock_report.call_args.args[0])
+        phases = {phase["name"]: phase for phase in summary["phases"]}
+        assert phases["lint"]["count"] == 1
+        assert phases["render"]["count"] == 1
+        assert summary["slowest_messages"][0]["header"] == "feat: test commit"
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(commit_message="feat: test commit"),
+    )
+    @patch("commitlint.console.report")
+    def test__main__without_timings(self, mock_report, *_):
+        main()
+        assert config.timings is None
+        mock_report.assert_not_called()
+
     @patch(
         "commitlint.cli.get_args",
         return_value=ArgsMock(file="path/to/non_existent_file.txt"),
@@ -384,6 +958,146 @@ class TestCLIMain:
             main()
 
 
+def _stdin(data):
+    return Mock(buffer=io.BytesIO(data))
+
+
+@patch("commitlint.console.success")
+@patch("commitlint.console.error")
+class TestCLIMainStdin:
+    @patch("sys.stdin", _stdin(b"feat: valid commit message\n"))
+    def test__main__stdin_single_message(self, mock_error, mock_success):
+        main(["--stdin"])
+
+        mock_success.assert_called_once_with(VALIDATION_SUCCESSFUL)
+        mock_error.assert_not_called()
+
+    @patch("sys.stdin", _stdin(b"feat: one\0fix: two\n\nbody\0"))
+    def test__main__stdin_null_delimited_messages(self, mock_error, mock_success):
+        main(["--stdin", "-z"])
+
+        mock_success.assert_called_once_with(VALIDATION_SUCCESSFUL)
+        mock_error.assert_not_called()
+
+    @patch("sys.stdin", _stdin(b"feat: one\0invalid message\0fix: two"))
+    def test__main__stdin_with_invalid_message(self, mock_error, mock_success):
+        with pytest.raises(SystemExit) as ex:
+            main(["--stdin", "-z"])
+
+        assert ex.value.code == 1
+        mock_success.assert_not_called()
+        mock_error.assert_has_calls(
+            [
+                call("⧗ Input:\ninvalid message\n"),
+                call("✖ Found 1 error(s)."),
+                call(f"- {INCORRECT_FORMAT_ERROR}"),
+            ]
+        )
+
+    @patch("sys.stdin", _stdin(b"feat: one\x1efix: two"))
+    def test__main__stdin_custom_delimiter(self, mock_error, mock_success):
+        main(["--stdin", "--delimiter", "\x1e"])
+
+        mock_success.assert_called_once_with(VALIDATION_SUCCESSFUL)
+
+
+@patch("commitlint.console.error")
+class TestCLIMainServe:
+    @patch("commitlint.daemon.serve")
+    @patch("commitlint.git_dir.find_git_dir", return_value="/repo/.git")
+    def test__main__serve(self, _mock_find_git_dir, mock_serve, _mock_error):
+        main(["--serve", "--idle-timeout", "30"])
+
+        mock_serve.assert_called_once_with("/repo/.git/commitlint.sock", main, 30.0)
+
+    @patch("commitlint.daemon.serve")
+    @patch("commitlint.git_dir.find_git_dir", return_value=None)
+    def test__main__serve_outside_repository(
+        self, _mock_find_git_dir, mock_serve, mock_error
+    ):
+        with pytest.raises(SystemExit) as ex:
+            main(["--serve"])
+
+        assert ex.value.code == 1
+        mock_serve.assert_not_called()
+        mock_error.assert_called_once_with("Not inside a git repository")
+
+
+class TestCLIGetCommitMessageFromFile:
+    # _get_commit_message_from_file
+
+    def test__get_commit_message_from_file__keeps_comments(self, tmp_path):
+        commit_file = tmp_path / "COMMIT_EDITMSG"
+        commit_file.write_text(
+            "feat: add feature\n\n# comment\nbody line\n#\n", encoding="utf-8"
+        )
+        assert _get_commit_message_from_file(str(commit_file)) == (
+            "feat: add feature\n\n# comment\nbody line\n#"
+        )
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "# c\n\nfeat: x",
+            "\n# comment\n\n\nfeat: add feature\n",
+            "feat: add feature\n# comment\n\nbody\n",
+            "feat: add feature\n\n# comment\n\n",
+            "#\n#\n",
+            "feat: add feature\n\n# ------------------------ >8 ------------------------\n"
+            "# Do not modify or remove the line above.\n"
+            "diff --git a/file b/file\n",
+            "feat: add feature # ------------------------ >8 ------------------------\n"
+            "diff --git a/file b/file\n",
+            "# comment\n\n# ------------------------ >8 ------------------------\n"
+            "+feat: valid commit message\n",
+        ],
+    )
+    def test__get_commit_message_from_file__lints_like_reading_the_whole_file(
+        self, content, tmp_path
+    ):
+        commit_file = tmp_path / "COMMIT_EDITMSG"
+        commit_file.write_text(content, encoding="utf-8")
+
+        commit_message = _get_commit_message_from_file(str(commit_file))
+        assert lint_commit_message_result(
+            commit_message, strip_comments=True
+        ) == lint_commit_message_result(content.strip(), strip_comments=True)
+
+    def test__get_commit_message_from_file__keeps_hash_inside_lines(self, tmp_path):
+        commit_file = tmp_path / "COMMIT_EDITMSG"
+        commit_file.write_text("fix: handle issue #123\n\nFixes #123\n")
+        assert _get_commit_message_from_file(str(commit_file)) == (
+            "fix: handle issue #123\n\nFixes #123"
+        )
+
+    def test__get_commit_message_from_file__stops_at_scissors_line(self):
+        read_lines = []
+
+        class CommitMessageFile:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *_):
+                pass
+
+            def __iter__(self):
+                for line in [
+                    "feat: add feature\n",
+                    "\n",
+                    "# ------------------------ >8 ------------------------\n",
+                    "# Do not modify or remove the line above.\n",
+                    "diff --git a/file b/file\n",
+                ]:
+                    read_lines.append(line)
+                    yield line
+
+        with patch("builtins.open", return_value=CommitMessageFile()):
+            commit_message = _get_commit_message_from_file("COMMIT_EDITMSG")
+
+        assert commit_message == "feat: add feature"
+        assert len(read_lines) == 3
+
+
 class TestCLIMainQuiet:
     # main : quiet (directly checking stdout and stderr)
 
@@ -421,15 +1135,15 @@ class TestCLIMainQuiet:
             from_hash="start_commit_hash", to_hash="end_commit_hash", quiet=True
         ),
     )
-    @patch("commitlint.cli.get_commit_messages_of_hash_range")
+    @patch("commitlint.git_helpers.get_commits_of_hash_range")
     @patch("sys.stdout.write")
     def test__valid_commit_message_with_hash_range_in_quiet(
         self, mock_stdout_write, mock_get_commit_messages, *_
     ):
-        mock_get_commit_messages.return_value = [
+        mock_get_commit_messages.return_value = _commits(
             "feat: commit message 1",
             "fix: commit message 2",
-        ]
+        )
         main()
         mock_stdout_write.assert_not_called()
 
@@ -439,7 +1153,7 @@ class TestCLIMainQuiet:
             from_hash="start_commit_hash", to_hash="end_commit_hash", quiet=True
         ),
     )
-    @patch("commitlint.cli.get_commit_messages_of_hash_range")
+    @patch("commitlint.git_helpers.get_commits_of_hash_range")
     @patch("sys.stdout.write")
     @patch("sys.stderr.write")
     def test__invalid_commit_message_with_hash_range_in_quiet(
@@ -449,13 +1163,46 @@ class TestCLIMainQuiet:
         mock_get_commit_messages,
         *_,
     ):
-        mock_get_commit_messages.return_value = [
+        mock_get_commit_messages.return_value = _commits(
             "Invalid commit message 1",
             "Invalid commit message 2",
-        ]
+        )
 
         with pytest.raises(SystemExit):
             main()
 
         mock_stderr_write.assert_not_called()
         mock_stdout_write.assert_not_called()
+
+
+class TestCLIStartup:
+    # modules only needed by the other modes must not slow down commit-msg hooks
+
+    @pytest.mark.parametrize(
+        "module",
+        ["subprocess", "concurrent.futures", "socket", "hashlib", "tempfile", "json"],
+    )
+    def test__main__file_doesnt_import_other_modes(self, module, tmp_path):
+        commit_file = tmp_path / "COMMIT_EDITMSG"
+        commit_file.write_text("feat: add new feature\n# comment\n")
+        script = (
+            "import sys\n"
+            "from commitlint.cli import main\n"
+            "try:\n"
+            "    main(['--file', sys.argv[1]])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sys.argv[2] in sys.modules)\n"
+        )
+        env = dict(
+            os.environ,
+            PYTHONPATH=os.path.dirname(os.path.dirname(commitlint.__file__)),
+        )
+
+        output = subprocess.check_output(
+            [sys.executable, "-c", script, str(commit_file), module],
+            env=env,
+            text=True,
+        )
+
+        assert output.splitlines()[-1] == "False"
@@ -0,0 +1,188 @@
+# type: ignore
+# pylint: disable=all
+
+import os
+import socket
+from unittest.mock import Mock, patch
+
+import pytest
+
+from commitlint.client import (
+    DAEMON_AUTOSTART_ENV,
+    SOCKET_NAME,
+    get_runtime_dir,
+    get_socket_path,
+    is_trusted_socket,
+    main,
+    request_daemon,
+)
+
+
+class TestGetSocketPath:
+    def test__get_socket_path__in_git_dir(self):
+        assert get_socket_path("/repo/.git") == os.path.join("/repo/.git", SOCKET_NAME)
+
+    def test__get_socket_path__with_long_git_dir(self):
+        git_dir = "/" + "a" * 120 + "/.git"
+
+        socket_path = get_socket_path(git_dir)
+
+        assert os.path.dirname(socket_path) == get_runtime_dir()
+        assert os.path.basename(socket_path).startswith("commitlint-")
+        assert socket_path == get_socket_path(git_dir)
+        assert socket_path != get_socket_path("/" + "b" * 120 + "/.git")
+
+    def test__get_runtime_dir__is_per_user(self):
+        assert os.path.basename(get_runtime_dir()) == f"commitlint-{os.getuid()}"
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix sockets")
+class TestIsTrustedSocket:
+    def test__is_trusted_socket__owned_socket(self, tmp_path):
+        socket_path = str(tmp_path / "s.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(socket_path)
+
+            assert is_trusted_socket(socket_path)
+
+    def test__is_trusted_socket__socket_of_another_user(self, tmp_path):
+        socket_path = str(tmp_path / "s.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(socket_path)
+
+            with patch("commitlint.client.os.getuid", return_value=os.getuid() + 1):
+                assert not is_trusted_socket(socket_path)
+
+    def test__is_trusted_socket__not_a_socket(self, tmp_path):
+        (tmp_path / "s.sock").write_text("")
+
+        assert not is_trusted_socket(str(tmp_path / "s.sock"))
+        assert not is_trusted_socket(str(tmp_path / "missing.sock"))
+
+
+class TestRequestDaemon:
+    def test__request_daemon__without_daemon(self, tmp_path):
+        assert request_daemon(str(tmp_path / SOCKET_NAME), ["commit msg"]) is None
+
+    @patch("commitlint.client.socket.socket")
+    def test__request_daemon__untrusted_socket(self, mock_socket, tmp_path):
+        (tmp_path / SOCKET_NAME).write_text("")
+
+        assert request_daemon(str(tmp_path / SOCKET_NAME), ["commit msg"]) is None
+        mock_socket.assert_not_called()
+
+    @patch("commitlint.client.is_trusted_socket", Mock(return_value=True))
+    @patch("commitlint.client.socket.socket")
+    def test__request_daemon__with_error_response(self, mock_socket):
+        client = mock_socket.return_value.__enter__.return_value
+        client.recv.side_effect = [b'{"error": "invalid request"}', b""]
+
+        assert request_daemon("commitlint.sock", ["commit msg"]) is None
+
+    @patch("commitlint.client.is_trusted_socket", Mock(return_value=True))
+    @patch("commitlint.client.socket.socket")
+    def test__request_daemon__with_invalid_response(self, mock_socket):
+        client = mock_socket.return_value.__enter__.return_value
+        client.recv.side_effect = [b"{invalid", b""]
+
+        assert request_daemon("commitlint.sock", ["commit msg"]) is None
+
+    @patch("commitlint.client.is_trusted_socket", Mock(return_value=True))
+    @patch("commitlint.client.socket.socket")
+    def test__request_daemon__sends_request(self, mock_socket, monkeypatch):
+        monkeypatch.setenv("GIT_INDEX_FILE", "index")
+        client = mock_socket.return_value.__enter__.return_value
+        client.recv.side_effect = [
+            b'{"exit_code": 0, "stdout": "ok\\n", ',
+            b'"stderr": ""}',
+            b"",
+        ]
+
+        response = request_daemon("commitlint.sock", ["commit msg"])
+
+        assert response == {"exit_code": 0, "stdout": "ok\n", "stderr": ""}
+        client.connect.assert_called_once_with("commitlint.sock")
+        client.shutdown.assert_called_once_with(socket.SHUT_WR)
+        request = client.sendall.call_args[0][0].decode()
+        assert '"argv": ["commit msg"]' in request
+        assert '"GIT_INDEX_FILE": "index"' in request
+
+
+@patch("commitlint.client.find_git_dir", return_value="/repo/.git")
+@patch("commitlint.client.start_daemon")
+@patch("commitlint.cli.main")
+@patch("sys.argv", ["commitlint-client", "--file", ".git/COMMIT_EDITMSG"])
+class TestClientMain:
+    @patch(
+        "commitlint.client.request_daemon",
+        return_value={"exit_code": 1, "stdout": "out\n", "stderr": "err\n"},
+    )
+    @patch("sys.stderr.write")
+    @patch("sys.stdout.write")
+    def test__main__through_daemon(
+        self,
+        mock_stdout_write,
+        mock_stderr_write,
+        mock_request_daemon,
+        mock_cli_main,
+        mock_start_daemon,
+        _mock_find_git_dir,
+    ):
+        with pytest.raises(SystemExit) as ex:
+            main()
+
+        assert ex.value.code == 1
+        mock_request_daemon.assert_called_once_with(
+            get_socket_path("/repo/.git"), ["--file", ".git/COMMIT_EDITMSG"]
+        )
+        mock_stdout_write.assert_called_once_with("out\n")
+        mock_stderr_write.assert_called_once_with("err\n")
+        mock_cli_main.assert_not_called()
+        mock_start_daemon.assert_not_called()
+
+    @patch("commitlint.client.request_daemon", return_value=None)
+    def test__main__falls_back_to_in_process(
+        self, _mock_request_daemon, mock_cli_main, mock_start_daemon, *_
+    ):
+        main()
+
+        mock_cli_main.assert_called_once_with(["--file", ".git/COMMIT_EDITMSG"])
+        mock_start_daemon.assert_called_once_with(os.getcwd())
+
+    @patch("commitlint.client.request_daemon", return_value=None)
+    def test__main__without_autostart(
+        self, _mock_request_daemon, mock_cli_main, mock_start_daemon, _, monkeypatch
+    ):
+        monkeypatch.setenv(DAEMON_AUTOSTART_ENV, "0")
+
+        main()
+
+        mock_cli_main.assert_called_once_with(["--file", ".git/COMMIT_EDITMSG"])
+        mock_start_daemon.assert_not_called()
+
+    @patch("commitlint.client.request_daemon")
+    def test__main__outside_repository(
+        self,
+        mock_request_daemon,
+        mock_cli_main,
+        mock_start_daemon,
+        mock_find_git_dir,
+    ):
+        mock_find_git_dir.return_value = None
+
+        main()
+
+        mock_request_daemon.assert_not_called()
+        mock_start_daemon.assert_not_called()
+        mock_cli_main.assert_called_once_with(["--file", ".git/COMMIT_EDITMSG"])
+
+    @patch("commitlint.client.request_daemon")
+    def test__main__stdin_is_linted_in_process(
+        self, mock_request_daemon, mock_cli_main, mock_start_daemon, _
+    ):
+        with patch("sys.argv", ["commitlint-client", "--stdin", "-z"]):
+            main()
+
+        mock_request_daemon.assert_not_called()
+        mock_start_daemon.assert_not_called()
+        mock_cli_main.assert_called_once_with(["--stdin", "-z"])
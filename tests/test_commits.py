@@ -0,0 +1,50 @@
+# type: ignore
+# pylint: disable=all
+import pytest
+
+from commitlint.commits import (
+    get_commit_author_ident,
+    parse_commit_author,
+    parse_commit_message,
+)
+
+
+@pytest.mark.parametrize(
+    "commit_object, expected_message",
+    [
+        (b"tree abc\nauthor a\n\nfeat: add feature\n", "feat: add feature"),
+        (
+            b"tree abc\ngpgsig -----BEGIN-----\n \n sig\n -----END-----\n\n"
+            b"fix: signed\n\nbody\n",
+            "fix: signed\n\nbody",
+        ),
+        (b"tree abc\nencoding ISO-8859-1\n\nfix: caf\xe9\n", "fix: caf\xe9"),
+        (b"tree abc\nencoding unknown\n\nfix: caf\xc3\xa9\n", "fix: caf\xe9"),
+        (b"tree abc\n", ""),
+    ],
+)
+def test_parse_commit_message(commit_object, expected_message):
+    assert parse_commit_message(commit_object) == expected_message
+
+
+@pytest.mark.parametrize(
+    "commit_object, expected",
+    [
+        (
+            b"tree abc\nauthor Jane Doe <jane@example.com> 1700000000 +0545\n\nfeat",
+            ("Jane Doe <jane@example.com>", "2023-11-15T03:58:20+05:45"),
+        ),
+        (
+            b"tree abc\nauthor Jane Doe <jane@example.com> invalid\n\nfeat",
+            ("Jane Doe <jane@example.com>", ""),
+        ),
+        (b"tree abc\n\nfeat", ("", "")),
+    ],
+)
+def test_parse_commit_author(commit_object, expected):
+    assert parse_commit_author(commit_object) == expected
+
+
+def test_get_commit_author_ident():
+    commit_object = b"tree abc\nauthor Jane <jane@example.com> 1700000000 +0000\n\nx"
+    assert get_commit_author_ident(commit_object) == b"Jane <jane@example.com>"
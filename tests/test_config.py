@@ -6,6 +6,7 @@ from typing import Generator
 import pytest
 
 from commitlint.config import _CommitlintConfig as CommitlintConfig
+from commitlint.timings import Timings
 
 
 @pytest.fixture(scope="class")
@@ -14,6 +15,7 @@ def config_instance() -> Generator[CommitlintConfig, None, None]:
     yield config
     config.verbose = False
     config.quiet = False
+    config.timings = None
 
 
 class TestCommitlintConfig:
@@ -33,3 +35,10 @@ class TestCommitlintConfig:
         config.quiet = True
         assert config.quiet
         assert not config.verbose
+
+    def test_timings_property(self, config_instance: CommitlintConfig) -> None:
+        config = config_instance
+        assert config.timings is None
+        timings = Timings()
+        config.timings = timings
+        assert config.timings is timings
@@ -52,3 +52,68 @@ def test_verbose_for_non_verbose(mock_stdout: MagicMock, _mock_config: MagicMock
     message = "Verbose message"
     console.verbose(message)
     mock_stdout.write.assert_not_called()
+
+
+@patch("commitlint.console.config", verbose=True)
+@patch("sys.stdout")
+def test_verbose_with_args(mock_stdout: MagicMock, _mock_config: MagicMock):
+    console.verbose("running validator %s", "PatternValidator")
+    mock_stdout.write.assert_called_once_with("running validator PatternValidator\n")
+
+
+@patch("commitlint.console.config", verbose=True)
+@patch("sys.stdout")
+def test_verbose_without_args_keeps_percent(
+    mock_stdout: MagicMock, _mock_config: MagicMock
+):
+    console.verbose("100% done")
+    mock_stdout.write.assert_called_once_with("100% done\n")
+
+
+@patch("commitlint.console.config", verbose=True)
+@patch("sys.stdout")
+def test_verbose_with_callable(mock_stdout: MagicMock, _mock_config: MagicMock):
+    console.verbose(lambda: "Verbose message")
+    mock_stdout.write.assert_called_once_with("Verbose message\n")
+
+
+@patch("commitlint.console.config", verbose=False)
+@patch("sys.stdout")
+def test_verbose_for_non_verbose_skips_formatting(
+    mock_stdout: MagicMock, _mock_config: MagicMock
+):
+    message = MagicMock()
+    arg = MagicMock()
+    console.verbose(message, arg)
+    message.assert_not_called()
+    message.__mod__.assert_not_called()
+    arg.__str__.assert_not_called()
+    mock_stdout.write.assert_not_called()
+
+
+@patch("commitlint.console.config", verbose=True)
+@patch("sys.stdout")
+def test_verbose_block(mock_stdout: MagicMock, _mock_config: MagicMock):
+    console.verbose_block("----------", "feat: add feature", "----------")
+    assert [c.args[0] for c in mock_stdout.write.call_args_list] == [
+        "----------",
+        "\n",
+        "feat: add feature",
+        "\n",
+        "----------",
+        "\n",
+    ]
+
+
+@patch("commitlint.console.config", verbose=False)
+@patch("sys.stdout")
+def test_verbose_block_for_non_verbose(mock_stdout: MagicMock, _mock_config: MagicMock):
+    console.verbose_block("----------", "feat: add feature", "----------")
+    mock_stdout.write.assert_not_called()
+
+
+@patch("commitlint.console.config", quiet=True)
+@patch("sys.stderr")
+def test_report_ignores_quiet(mock_stderr: MagicMock, _mock_config: MagicMock):
+    console.report("Report")
+    mock_stderr.write.assert_called_once_with("Report\n")
@@ -0,0 +1,220 @@
+# type: ignore
+# pylint: disable=all
+
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from commitlint.__version__ import __version__
+from commitlint.cli import main as cli_main
+from commitlint.client import request_daemon
+from commitlint.daemon import _ensure_private_dir, _run_request, serve
+from commitlint.exceptions import CommitlintException
+from commitlint.messages import VALIDATION_SUCCESSFUL
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets"
+)
+
+
+@pytest.fixture
+def socket_path():
+    # pytest's tmp_path may exceed the length limit of Unix domain socket paths
+    directory = tempfile.mkdtemp(prefix="cl-")
+    yield os.path.join(directory, "commitlint.sock")
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path):
+    thread = threading.Thread(
+        target=serve, args=(socket_path, cli_main), kwargs={"idle_timeout": 5}
+    )
+    thread.start()
+    for _ in range(500):
+        if os.path.exists(socket_path):
+            break
+        threading.Event().wait(0.01)
+
+    yield thread
+
+    if thread.is_alive():
+        # a version mismatch shuts the daemon down
+        _send_raw(socket_path, json.dumps({"version": "0.0.0"}).encode())
+    thread.join(5)
+
+
+def _send_raw(socket_path, data):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(data)
+        client.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b"".join(chunks))
+
+
+class TestDaemon:
+    def test__serve__valid_commit_message(self, socket_path, daemon):
+        response = request_daemon(socket_path, ["feat: add new feature"])
+
+        assert response == {
+            "exit_code": 0,
+            "stdout": f"{VALIDATION_SUCCESSFUL}\n",
+            "stderr": "",
+        }
+
+    def test__serve__invalid_commit_message(self, socket_path, daemon):
+        response = request_daemon(socket_path, ["invalid commit message"])
+
+        assert response["exit_code"] == 1
+        assert response["stdout"] == ""
+        assert "invalid commit message" in response["stderr"]
+
+    def test__serve__relative_file_from_client_cwd(
+        self, socket_path, daemon, tmp_path, monkeypatch
+    ):
+        (tmp_path / "COMMIT_EDITMSG").write_text("fix: correct typo\n# comment\n")
+        monkeypatch.chdir(tmp_path)
+
+        response = request_daemon(socket_path, ["--file", "COMMIT_EDITMSG"])
+
+        assert response["exit_code"] == 0
+        assert os.getcwd() == str(tmp_path)
+
+    def test__serve__invalid_arguments(self, socket_path, daemon):
+        response = request_daemon(socket_path, ["--unknown"])
+
+        assert response["exit_code"] == 2
+        assert "error:" in response["stderr"]
+
+    def test__serve__rejects_serve_request(self, socket_path, daemon):
+        assert request_daemon(socket_path, ["--serve"]) is None
+        assert daemon.is_alive()
+
+    def test__serve__invalid_request(self, socket_path, daemon):
+        response = _send_raw(socket_path, b"{invalid")
+
+        assert "error" in response
+        assert daemon.is_alive()
+
+    def test__serve__shuts_down_on_version_mismatch(self, socket_path, daemon):
+        response = _send_raw(socket_path, json.dumps({"version": "0.0.0"}).encode())
+
+        assert "error" in response
+        daemon.join(5)
+        assert not daemon.is_alive()
+        assert not os.path.exists(socket_path)
+
+    def test__serve__shuts_down_when_idle(self, socket_path):
+        serve(socket_path, cli_main, idle_timeout=0.01)
+
+        assert not os.path.exists(socket_path)
+
+    def test__serve__replaces_stale_socket(self, socket_path):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+
+        serve(socket_path, cli_main, idle_timeout=0.01)
+
+        assert not os.path.exists(socket_path)
+
+    def test__serve__socket_is_private(self, socket_path, daemon):
+        assert os.stat(socket_path).st_mode & 0o777 == 0o600
+
+    def test__serve__in_runtime_dir(self, socket_path, monkeypatch):
+        runtime_dir = os.path.join(os.path.dirname(socket_path), "runtime")
+        monkeypatch.setattr("commitlint.daemon.get_runtime_dir", lambda: runtime_dir)
+
+        serve(os.path.join(runtime_dir, "commitlint.sock"), cli_main, 0.01)
+
+        assert os.stat(runtime_dir).st_mode & 0o777 == 0o700
+
+    def test__ensure_private_dir__rejects_shared_dir(self, socket_path):
+        shared_dir = os.path.join(os.path.dirname(socket_path), "shared")
+        os.mkdir(shared_dir)
+        os.chmod(shared_dir, 0o777)
+
+        with pytest.raises(CommitlintException):
+            _ensure_private_dir(shared_dir)
+
+    def test__ensure_private_dir__rejects_dir_of_another_user(self, socket_path):
+        directory = os.path.dirname(socket_path)
+
+        with patch("commitlint.daemon.os.getuid", return_value=os.getuid() + 1):
+            with pytest.raises(CommitlintException):
+                _ensure_private_dir(directory)
+
+    def test__ensure_private_dir__rejects_symlink(self, socket_path):
+        link = os.path.join(os.path.dirname(socket_path), "link")
+        os.symlink(os.path.dirname(socket_path), link)
+
+        with pytest.raises(CommitlintException):
+            _ensure_private_dir(link)
+
+    def test__serve__fails_when_already_running(self, socket_path, daemon):
+        with pytest.raises(CommitlintException):
+            serve(socket_path, cli_main, idle_timeout=0.01)
+
+        assert daemon.is_alive()
+
+
+class TestRunRequest:
+    def test__run_request__restores_cwd_and_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GIT_DIR", "daemon.git")
+        monkeypatch.delenv("GIT_INDEX_FILE", raising=False)
+        cwd = os.getcwd()
+        seen = {}
+
+        def run_cli(argv):
+            seen["cwd"] = os.getcwd()
+            seen["env"] = {
+                name: os.environ.get(name) for name in ("GIT_DIR", "GIT_INDEX_FILE")
+            }
+            print("linted", argv)
+            raise SystemExit(3)
+
+        response = _run_request(
+            {
+                "version": __version__,
+                "argv": ["commit msg"],
+                "cwd": str(tmp_path),
+                "env": {"GIT_INDEX_FILE": "index"},
+            },
+            run_cli,
+        )
+
+        assert response == {
+            "exit_code": 3,
+            "stdout": "linted ['commit msg']\n",
+            "stderr": "",
+        }
+        assert seen == {
+            "cwd": str(tmp_path),
+            "env": {"GIT_DIR": None, "GIT_INDEX_FILE": "index"},
+        }
+        assert os.getcwd() == cwd
+        assert os.environ["GIT_DIR"] == "daemon.git"
+        assert "GIT_INDEX_FILE" not in os.environ
+
+    def test__run_request__with_message_exit(self, tmp_path):
+        def run_cli(argv):
+            raise SystemExit("fatal error")
+
+        response = _run_request(
+            {"version": __version__, "argv": [], "cwd": str(tmp_path)}, run_cli
+        )
+
+        assert response["exit_code"] == 1
+        assert response["stderr"] == "fatal error\n"
@@ -0,0 +1,49 @@
+# type: ignore
+# pylint: disable=all
+
+from unittest.mock import patch
+
+import pytest
+
+from commitlint.git_dir import find_git_dir
+
+
+@pytest.fixture
+def no_git_dir_env(monkeypatch):
+    monkeypatch.delenv("GIT_DIR", raising=False)
+
+
+@pytest.mark.usefixtures("no_git_dir_env")
+class TestFindGitDir:
+    def test__find_git_dir__from_subdirectory(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        subdirectory = tmp_path / "src" / "package"
+        subdirectory.mkdir(parents=True)
+
+        assert find_git_dir(str(subdirectory)) == str(tmp_path / ".git")
+
+    def test__find_git_dir__follows_gitdir_file_and_commondir(self, tmp_path):
+        common_dir = tmp_path / "main" / ".git"
+        worktree_git_dir = common_dir / "worktrees" / "feature"
+        worktree_git_dir.mkdir(parents=True)
+        (worktree_git_dir / "commondir").write_text("../..\n")
+
+        worktree = tmp_path / "feature"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {worktree_git_dir}\n")
+
+        assert find_git_dir(str(worktree)) == str(common_dir)
+
+    def test__find_git_dir__with_invalid_git_file(self, tmp_path):
+        (tmp_path / ".git").write_text("invalid\n")
+
+        assert find_git_dir(str(tmp_path)) is None
+
+    def test__find_git_dir__uses_git_dir_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GIT_DIR", "custom.git")
+
+        assert find_git_dir(str(tmp_path)) == str(tmp_path / "custom.git")
+
+    @patch("os.path.exists", return_value=False)
+    def test__find_git_dir__outside_repository(self, _mock_exists, tmp_path):
+        assert find_git_dir(str(tmp_path)) is None
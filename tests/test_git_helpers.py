@@ -1,20 +1,31 @@
 # type: ignore
 # pylint: disable=all
+import io
+import os
 import subprocess
-from unittest.mock import patch
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 
 from commitlint.exceptions import (
     GitCommitNotFoundException,
+    GitException,
     GitInvalidCommitRangeException,
 )
 from commitlint.git_helpers import (
+    GitCatFileBatch,
     get_commit_message_of_hash,
     get_commit_messages_of_hash_range,
+    get_commit_messages_of_hashes,
+    get_commits_of_hash_range,
+    get_commits_of_hashes,
+    get_git_dir,
+    get_merge_base,
+    has_complete_history,
 )
+from commitlint.commits import Commit, RangeFilters
 
-DELIMITER = "========commit-delimiter========"
+from .fixtures.git import create_git_repo, git
 
 
 @pytest.fixture
@@ -51,55 +62,340 @@ def test_get_commit_message_of_hash_failure(mock_subprocess):
         get_commit_message_of_hash(hash_value)
 
 
-@patch(
-    "commitlint.git_helpers.get_commit_message_of_hash",
-    return_value="From commit message",
-)
-def test_get_commit_messages_of_hash_range_success(
-    _mock_get_commit_message_of_hash, mock_subprocess
-):
+def _mock_git_process(mock_subprocess, stdout=b"", return_code=0):
+    process = Mock()
+    process.stdout = io.BytesIO(stdout)
+    process.wait.return_value = return_code
+    process.poll.return_value = return_code
+    mock_subprocess.Popen.return_value.__enter__.return_value = process
+    return process
+
+
+def test_get_commit_messages_of_hash_range_success(mock_subprocess):
     from_hash = "abc123"
     to_hash = "def456"
-    expected_output = (
-        "Commit message 1\n========commit-delimiter========\nCommit message 2"
+    _mock_git_process(
+        mock_subprocess,
+        stdout=b"From commit message\n\0Commit message 1\n\0Commit message 2\n\0",
     )
-    mock_subprocess.check_output.return_value = expected_output
 
     result = get_commit_messages_of_hash_range(from_hash, to_hash)
 
-    assert result == ["From commit message", "Commit message 1", "Commit message 2"]
-    mock_subprocess.check_output.assert_called_once_with(
+    assert list(result) == [
+        "From commit message",
+        "Commit message 1",
+        "Commit message 2",
+    ]
+    mock_subprocess.Popen.assert_called_once_with(
         [
             "git",
             "log",
-            f"--format=%B{DELIMITER}",
+            "-z",
+            "--format=%B",
             "--reverse",
-            f"{from_hash}..{to_hash}",
+            to_hash,
+            "--not",
+            f"{from_hash}^@",
+            "--",
         ],
-        text=True,
-        stderr=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=ANY,
     )
+    mock_subprocess.check_output.assert_not_called()
 
 
-@patch(
-    "commitlint.git_helpers.get_commit_message_of_hash",
-    return_value="From commit message",
-)
-def test_get_commit_messages_of_hash_range_failure(
-    _mock_get_commit_message_of_hash, mock_subprocess
-):
-    from_hash = "invalid_hash"
-    to_hash = "def456"
-    mock_subprocess.check_output.side_effect = subprocess.CalledProcessError(
-        returncode=1,
-        cmd=[
+def test_get_commit_messages_of_hash_range_with_filters(mock_subprocess):
+    _mock_git_process(mock_subprocess, stdout=b"Commit message 1\n\0")
+    filters = RangeFilters(
+        no_merges=True,
+        first_parent=True,
+        author="Jane",
+        since="2024-01-01",
+        max_count=10,
+        paths=("packages/api", "docs"),
+    )
+
+    result = get_commit_messages_of_hash_range("abc123", "def456", filters)
+
+    assert list(result) == ["Commit message 1"]
+    mock_subprocess.Popen.assert_called_once_with(
+        [
             "git",
             "log",
-            f"--format=%B{DELIMITER}",
+            "-z",
+            "--format=%B",
             "--reverse",
-            f"{from_hash}..{to_hash}",
+            "--no-merges",
+            "--first-parent",
+            "--author=Jane",
+            "--since=2024-01-01",
+            "--max-count=10",
+            "def456",
+            "--not",
+            "abc123^@",
+            "--",
+            "packages/api",
+            "docs",
         ],
+        stdout=subprocess.PIPE,
+        stderr=ANY,
+    )
+
+
+def test_get_commits_of_hash_range(mock_subprocess):
+    _mock_git_process(
+        mock_subprocess,
+        stdout=(
+            b"aaa\x1fJane <jane@example.com>\x1f2024-01-01T10:00:00+02:00\x1f"
+            b"feat: first\n\nbody\n\0"
+            # empty message
+            b"bbb\x1fJane <jane@example.com>\x1f2024-01-02T10:00:00+02:00\x1f\n\0"
+            b"ccc\x1fJohn <john@example.com>\x1f2024-01-03T10:00:00+02:00\x1f"
+            b"fix: second\n\0"
+        ),
     )
 
+    result = get_commits_of_hash_range("abc123", "def456")
+
+    assert list(result) == [
+        Commit(
+            "aaa",
+            "Jane <jane@example.com>",
+            "2024-01-01T10:00:00+02:00",
+            "feat: first\n\nbody",
+        ),
+        Commit(
+            "ccc", "John <john@example.com>", "2024-01-03T10:00:00+02:00", "fix: second"
+        ),
+    ]
+    command = mock_subprocess.Popen.call_args.args[0]
+    assert "--format=%H%x1f%an <%ae>%x1f%aI%x1f%B" in command
+
+
+def test_get_commit_messages_of_hash_range_is_lazy(mock_subprocess):
+    _mock_git_process(mock_subprocess, stdout=b"Commit message 1\n\0")
+
+    result = get_commit_messages_of_hash_range("abc123", "def456")
+
+    mock_subprocess.Popen.assert_not_called()
+    assert next(result) == "Commit message 1"
+
+
+def test_get_commit_messages_of_hash_range_skips_empty_messages(mock_subprocess):
+    _mock_git_process(mock_subprocess, stdout=b"Commit message 1\n\0\n\0")
+
+    result = get_commit_messages_of_hash_range("abc123", "def456")
+
+    assert list(result) == ["Commit message 1"]
+
+
+def test_get_commit_messages_of_hash_range_kills_unfinished_process(mock_subprocess):
+    process = _mock_git_process(mock_subprocess, stdout=b"Message 1\0Message 2\0")
+    process.poll.return_value = None
+
+    result = get_commit_messages_of_hash_range("abc123", "def456")
+    assert next(result) == "Message 1"
+    result.close()
+
+    process.kill.assert_called_once()
+
+
+def test_get_commit_messages_of_hash_range_failure(mock_subprocess):
+    from_hash = "invalid_hash"
+    to_hash = "def456"
+    _mock_git_process(mock_subprocess, return_code=128)
+
     with pytest.raises(GitInvalidCommitRangeException):
-        get_commit_messages_of_hash_range(from_hash, to_hash)
+        list(get_commit_messages_of_hash_range(from_hash, to_hash))
+
+
+def test_get_commit_messages_of_hash_range_with_many_warnings(tmp_path, monkeypatch):
+    # git writing more warnings than a pipe buffer holds before its output
+    fake_git = tmp_path / "git"
+    fake_git.write_text(
+        "#!/bin/sh\n"
+        "head -c 1000000 /dev/zero | tr '\\0' 'w' >&2\n"
+        "printf 'feat: commit message\\000'\n"
+    )
+    fake_git.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+    assert list(get_commit_messages_of_hash_range("abc123", "def456")) == [
+        "feat: commit message"
+    ]
+
+
+def test_get_commit_messages_of_hash_range_with_git_repo(tmp_path, monkeypatch):
+    hashes = create_git_repo(
+        tmp_path,
+        ["feat: initial commit", "fix: second commit\n\nbody", "chore: third commit"],
+    )
+    monkeypatch.chdir(tmp_path)
+
+    assert list(get_commit_messages_of_hash_range(hashes[1])) == [
+        "fix: second commit\n\nbody",
+        "chore: third commit",
+    ]
+    # initial commit as from_hash
+    assert list(get_commit_messages_of_hash_range(hashes[0], hashes[1])) == [
+        "feat: initial commit",
+        "fix: second commit\n\nbody",
+    ]
+
+
+def test_get_commit_messages_of_hash_range_excluding_from_hash(tmp_path, monkeypatch):
+    hashes = create_git_repo(
+        tmp_path,
+        ["feat: initial commit", "fix: second commit", "chore: third commit"],
+    )
+    monkeypatch.chdir(tmp_path)
+
+    assert list(
+        get_commit_messages_of_hash_range(hashes[0], hashes[2], include_from_hash=False)
+    ) == ["fix: second commit", "chore: third commit"]
+
+
+def test_get_commit_messages_of_hash_range_with_paths(tmp_path, monkeypatch):
+    hashes = create_git_repo(tmp_path, ["feat: initial commit"])
+    for path, commit_message in [
+        ("packages/api/app.py", "feat(api): add the app"),
+        ("docs/index.md", "docs: add the index"),
+        ("packages/api/app.py", "fix(api): fix the app"),
+    ]:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(commit_message)
+        git(tmp_path, "add", path)
+        git(tmp_path, "commit", "--quiet", "-m", commit_message)
+    monkeypatch.chdir(tmp_path)
+
+    filters = RangeFilters(paths=("packages/api",))
+    assert list(get_commit_messages_of_hash_range(hashes[0], "HEAD", filters)) == [
+        "feat(api): add the app",
+        "fix(api): fix the app",
+    ]
+
+
+def test_get_git_dir_with_git_repo(tmp_path, monkeypatch):
+    create_git_repo(tmp_path, ["feat: initial commit"])
+    (tmp_path / "subdir").mkdir()
+    monkeypatch.chdir(tmp_path / "subdir")
+
+    assert get_git_dir() == str(tmp_path / ".git")
+
+
+def test_get_git_dir_failure(mock_subprocess):
+    mock_subprocess.check_output.side_effect = subprocess.CalledProcessError(
+        returncode=128, cmd=["git", "rev-parse", "--git-common-dir"]
+    )
+
+    with pytest.raises(GitException):
+        get_git_dir()
+
+
+def test_get_commit_messages_of_hashes_with_git_repo(tmp_path, monkeypatch):
+    hashes = create_git_repo(
+        tmp_path,
+        ["feat: initial commit", "fix: second commit\n\nbody", "chore: third commit"],
+    )
+    git(tmp_path, "tag", "-a", "v1.0", "-m", "release", hashes[0])
+    monkeypatch.chdir(tmp_path)
+
+    assert list(get_commit_messages_of_hashes([hashes[2], "v1.0", hashes[1]])) == [
+        "chore: third commit",
+        "feat: initial commit",
+        "fix: second commit\n\nbody",
+    ]
+
+
+def test_get_commits_of_hashes_with_git_repo(tmp_path, monkeypatch):
+    hashes = create_git_repo(tmp_path, ["feat: initial commit", "fix: second commit"])
+    git(tmp_path, "tag", "-a", "v1.0", "-m", "release", hashes[0])
+    monkeypatch.chdir(tmp_path)
+
+    commits = list(get_commits_of_hashes(["v1.0", hashes[1][:8]]))
+
+    # the same metadata as for a range
+    assert commits == list(get_commits_of_hash_range(hashes[0]))
+    assert [commit.hash for commit in commits] == hashes
+
+
+@pytest.mark.parametrize("commit_hash", ["0" * 40, "HEAD:missing", "a b", ""])
+def test_git_cat_file_batch_commit_not_found(commit_hash, tmp_path, monkeypatch):
+    create_git_repo(tmp_path, ["feat: initial commit"])
+    monkeypatch.chdir(tmp_path)
+
+    with GitCatFileBatch() as batch:
+        with pytest.raises(GitCommitNotFoundException):
+            batch.get_commit_message(commit_hash)
+
+        # the process is still usable after a missing commit
+        assert batch.get_commit_message("HEAD") == "feat: initial commit"
+
+
+def test_git_cat_file_batch_closed_pipe(tmp_path, monkeypatch):
+    create_git_repo(tmp_path, ["feat: initial commit"])
+    monkeypatch.chdir(tmp_path)
+
+    batch = GitCatFileBatch()
+    assert batch.get_commit_message("HEAD") == "feat: initial commit"
+    batch._process.kill()
+    batch._process.wait()
+
+    with pytest.raises(GitException):
+        batch.get_commit_message("HEAD")
+
+    # a new process is started by the next call
+    assert batch.get_commit_message("HEAD") == "feat: initial commit"
+    batch.close()
+
+
+def test_has_complete_history_with_git_repo(tmp_path, monkeypatch):
+    hashes = create_git_repo(tmp_path, ["feat: initial commit", "fix: second commit"])
+    monkeypatch.chdir(tmp_path)
+
+    assert has_complete_history(*hashes)
+    assert not has_complete_history(hashes[0], "0" * 40)
+
+
+def test_has_complete_history_with_shallow_clone(tmp_path, monkeypatch):
+    (tmp_path / "origin").mkdir()
+    hashes = create_git_repo(
+        tmp_path / "origin", ["feat: initial commit", "fix: second commit"]
+    )
+    git(
+        tmp_path,
+        "clone",
+        "--quiet",
+        "--depth",
+        "1",
+        f"file://{tmp_path}/origin",
+        "clone",
+    )
+    monkeypatch.chdir(tmp_path / "clone")
+
+    assert not has_complete_history(hashes[1])
+
+
+def test_has_complete_history_outside_git_repo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+
+    assert not has_complete_history("HEAD")
+
+
+def test_get_merge_base_with_git_repo(tmp_path, monkeypatch):
+    hashes = create_git_repo(tmp_path, ["feat: initial commit", "fix: second commit"])
+    git(tmp_path, "checkout", "--quiet", "-b", "feature", hashes[0])
+    git(tmp_path, "commit", "--quiet", "--allow-empty", "-m", "feat: feature")
+    monkeypatch.chdir(tmp_path)
+
+    assert get_merge_base("feature", hashes[1]) == hashes[0]
+
+
+def test_get_merge_base_failure(mock_subprocess):
+    mock_subprocess.check_output.side_effect = subprocess.CalledProcessError(
+        returncode=1, cmd=["git", "merge-base", "abc123", "def456"]
+    )
+
+    with pytest.raises(GitException):
+        get_merge_base("abc123", "def456")
@@ -0,0 +1,389 @@
+# type: ignore
+# pylint: disable=all
+import os
+import shutil
+
+import pytest
+
+from commitlint.commits import RangeFilters
+from commitlint.exceptions import (
+    GitCommitNotFoundException,
+    GitException,
+    GitInvalidCommitRangeException,
+)
+from commitlint.git_helpers import get_commit_messages_of_hash_range as git_log_range
+from commitlint.git_helpers import get_commits_of_hash_range as git_log_commits
+from commitlint.git_helpers import get_commits_of_hashes as git_cat_file_commits
+from commitlint.git_objects import (
+    GitRepository,
+    _apply_delta,
+    get_commit_message_of_hash,
+    get_commit_messages_of_hash_range,
+    get_commit_messages_of_hashes,
+    get_commits_of_hash_range,
+    get_commits_of_hashes,
+)
+
+from .fixtures.git import git
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="requires git")
+
+# a body big enough for git to store the commits as deltas of each other
+BODY = "\n".join(f"- change number {number} of the release" for number in range(80))
+
+
+def _commit(repo_path, message, date, *extra_args):
+    env = {"GIT_AUTHOR_DATE": f"@{date} +0000", "GIT_COMMITTER_DATE": f"@{date} +0000"}
+    os.environ.update(env)
+    try:
+        git(repo_path, "commit", "--quiet", "--allow-empty", "-m", message, *extra_args)
+    finally:
+        for name in env:
+            del os.environ[name]
+    return git(repo_path, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    """
+    A repository with a merged branch, and a commit whose committer date is older
+    than the one of its parent:
+
+        c1 - c2 - c3 ------ m - c6(skewed) - c7
+               \\          /
+                b1 - b2 -
+    """
+    git(tmp_path, "init", "--quiet", "--initial-branch=main")
+    hashes = {}
+    hashes["c1"] = _commit(tmp_path, "feat: first commit", 1000)
+    hashes["c2"] = _commit(tmp_path, f"fix: second commit\n\n{BODY}", 2000)
+    git(tmp_path, "checkout", "--quiet", "-b", "side")
+    hashes["b1"] = _commit(
+        tmp_path,
+        f"feat: side commit 1\n\n{BODY}",
+        2500,
+        "--author",
+        "Jane Doe <jane@example.com>",
+    )
+    hashes["b2"] = _commit(tmp_path, "feat: side commit 2", 3500)
+    git(tmp_path, "checkout", "--quiet", "main")
+    hashes["c3"] = _commit(tmp_path, f"docs: third commit\n\n{BODY}\n- more", 3000)
+    git(tmp_path, "merge", "--quiet", "--no-ff", "side", "-m", "Merge branch side")
+    hashes["m"] = git(tmp_path, "rev-parse", "HEAD")
+    hashes["c6"] = _commit(tmp_path, "chore: skewed commit", 1500)
+    hashes["c7"] = _commit(tmp_path, "ci: last commit", 5000)
+    git(tmp_path, "tag", "-a", "v1.0", "-m", "release", hashes["c3"])
+    git(tmp_path, "tag", "v0.1", hashes["c1"])
+    monkeypatch.chdir(tmp_path)
+    return hashes
+
+
+RANGES = [
+    ("c1", "HEAD"),
+    ("c2", "HEAD"),
+    ("b1", "HEAD"),
+    ("c3", "m"),
+    ("v1.0", "side"),
+    ("v0.1", "v1.0"),
+    ("HEAD", "HEAD"),
+    ("c7", "c1"),
+]
+
+
+def _resolve(hashes, revision):
+    return hashes.get(revision, revision)
+
+
+def _assert_same_as_git_log(hashes):
+    for from_hash, to_hash in RANGES:
+        from_hash, to_hash = _resolve(hashes, from_hash), _resolve(hashes, to_hash)
+        expected = list(git_log_range(from_hash, to_hash))
+        assert list(get_commit_messages_of_hash_range(from_hash, to_hash)) == (
+            expected
+        ), (from_hash, to_hash)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        RangeFilters(no_merges=True),
+        RangeFilters(first_parent=True),
+        RangeFilters(author="Jane"),
+        RangeFilters(author="^Jane Doe <jane@"),
+        RangeFilters(author="nobody"),
+        # matched against "<name> <<email>>" only, as git log --author
+        RangeFilters(author=r"example\.com>$"),
+        RangeFilters(author="[0-9]{4}"),
+        RangeFilters(author=r"\+0000"),
+        RangeFilters(max_count=1),
+        RangeFilters(max_count=3),
+        RangeFilters(no_merges=True, first_parent=True, max_count=2),
+    ],
+)
+def test_range_with_filters(history, filters):
+    for from_hash, to_hash in RANGES:
+        from_hash, to_hash = _resolve(history, from_hash), _resolve(history, to_hash)
+        expected = list(git_log_range(from_hash, to_hash, filters))
+        assert list(get_commit_messages_of_hash_range(from_hash, to_hash, filters)) == (
+            expected
+        ), (from_hash, to_hash)
+
+
+def test_commits_of_range(history):
+    for from_hash, to_hash in RANGES:
+        from_hash, to_hash = _resolve(history, from_hash), _resolve(history, to_hash)
+        expected = list(git_log_commits(from_hash, to_hash))
+        assert list(get_commits_of_hash_range(from_hash, to_hash)) == expected
+
+
+@pytest.mark.parametrize("timezone", ["+0000", "+0545", "-0330"])
+def test_commits_with_author_timezone(tmp_path, monkeypatch, timezone):
+    git(tmp_path, "init", "--quiet")
+    os.environ["GIT_AUTHOR_DATE"] = f"@1700000000 {timezone}"
+    try:
+        git(
+            tmp_path,
+            "commit",
+            "--quiet",
+            "--allow-empty",
+            "--author",
+            "Jöns Ångström <jons@example.com>",
+            "-m",
+            "feat: commit",
+        )
+    finally:
+        del os.environ["GIT_AUTHOR_DATE"]
+    monkeypatch.chdir(tmp_path)
+
+    expected = list(git_log_commits("HEAD"))
+    assert expected[0].author == "Jöns Ångström <jons@example.com>"
+    assert list(get_commits_of_hash_range("HEAD")) == expected
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        RangeFilters(since="2 weeks ago"),
+        RangeFilters(paths=("docs",)),
+        RangeFilters(author="(unclosed"),
+    ],
+)
+def test_range_with_unsupported_filters(history, filters):
+    with pytest.raises(GitException):
+        list(get_commit_messages_of_hash_range(history["c1"], "HEAD", filters))
+
+
+def test_range_of_loose_objects(history):
+    assert not os.listdir(".git/objects/pack")
+    _assert_same_as_git_log(history)
+
+
+def test_range_of_packed_objects(history):
+    git(".", "gc", "--quiet", "--aggressive")
+    assert not [name for name in os.listdir(".git/objects") if len(name) == 2], (
+        "all objects should be packed"
+    )
+
+    # the similar commits are stored as deltas
+    verify_pack = git(".", "verify-pack", "-v", *_pack_indexes())
+    assert any(
+        len(line.split()) == 7 and line.split()[1] == "commit"
+        for line in verify_pack.splitlines()
+    )
+    _assert_same_as_git_log(history)
+
+
+def test_range_of_packed_and_loose_objects(history):
+    git(".", "gc", "--quiet")
+    history["c8"] = _commit(".", "test: loose commit", 6000)
+    RANGES_WITH_LOOSE = [("c2", "HEAD"), ("c8", "HEAD")]
+    for from_hash, to_hash in RANGES_WITH_LOOSE:
+        from_hash = _resolve(history, from_hash)
+        assert list(get_commit_messages_of_hash_range(from_hash, to_hash)) == list(
+            git_log_range(from_hash, to_hash)
+        )
+
+
+def _pack_indexes():
+    pack_dir = os.path.join(".git", "objects", "pack")
+    return [
+        os.path.join(pack_dir, name)
+        for name in os.listdir(pack_dir)
+        if name.endswith(".idx")
+    ]
+
+
+@pytest.mark.parametrize("index_version", ["1", "2"])
+def test_range_with_index_versions(history, index_version):
+    git(".", "gc", "--quiet", "--aggressive")
+    for index_path in _pack_indexes():
+        pack_path = index_path[: -len(".idx")] + ".pack"
+        os.remove(index_path)
+        git(".", "index-pack", f"--index-version={index_version}", pack_path)
+
+    _assert_same_as_git_log(history)
+
+
+def test_range_with_packed_refs(history):
+    git(".", "pack-refs", "--all")
+    assert not os.path.exists(".git/refs/heads/side")
+
+    assert list(get_commit_messages_of_hash_range("v0.1", "side")) == list(
+        git_log_range("v0.1", "side")
+    )
+
+
+def test_range_of_shallow_clone(history, tmp_path):
+    clone_path = tmp_path / "shallow"
+    git(
+        tmp_path,
+        "clone",
+        "--quiet",
+        "--depth=2",
+        "--branch=main",
+        f"file://{tmp_path}",
+        str(clone_path),
+    )
+    os.chdir(clone_path)
+
+    assert list(get_commit_messages_of_hash_range("HEAD~1")) == [
+        "chore: skewed commit",
+        "ci: last commit",
+    ]
+    # the parents of the first commit are missing
+    assert list(get_commit_messages_of_hash_range("HEAD~1", "HEAD~1")) == [
+        "chore: skewed commit"
+    ]
+
+
+def test_range_from_worktree(history, tmp_path):
+    worktree_path = tmp_path / "worktree"
+    git(tmp_path, "worktree", "add", "--quiet", str(worktree_path), "side")
+    os.chdir(worktree_path)
+
+    assert list(get_commit_messages_of_hash_range(history["b1"])) == [
+        f"feat: side commit 1\n\n{BODY}",
+        "feat: side commit 2",
+    ]
+
+
+def test_range_of_sha256_repository(tmp_path, monkeypatch):
+    try:
+        git(tmp_path, "init", "--quiet", "--object-format=sha256")
+    except Exception:
+        pytest.skip("git doesn't support sha256 repositories")
+    monkeypatch.chdir(tmp_path)
+    first = _commit(tmp_path, "feat: first commit", 1000)
+    _commit(tmp_path, "fix: second commit", 2000)
+    git(tmp_path, "gc", "--quiet")
+    _commit(tmp_path, "docs: third commit", 3000)
+
+    assert len(first) == 64
+    assert list(get_commit_messages_of_hash_range(first[:10])) == [
+        "feat: first commit",
+        "fix: second commit",
+        "docs: third commit",
+    ]
+
+
+def test_invalid_range(history):
+    with pytest.raises(GitInvalidCommitRangeException):
+        list(get_commit_messages_of_hash_range("unknown", "HEAD"))
+
+    with pytest.raises(GitInvalidCommitRangeException):
+        list(get_commit_messages_of_hash_range(history["c1"], "unknown"))
+
+
+def test_range_outside_repository(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_DIR", str(tmp_path / "missing"))
+
+    with pytest.raises(GitInvalidCommitRangeException):
+        list(get_commit_messages_of_hash_range("HEAD~1"))
+
+
+@pytest.mark.parametrize(
+    "revision, expected_message",
+    [
+        ("HEAD", "ci: last commit"),
+        ("@", "ci: last commit"),
+        ("main~1", "chore: skewed commit"),
+        ("HEAD~2", "Merge branch side"),
+        ("HEAD~2^2", "feat: side commit 2"),
+        ("HEAD~2^2~1", f"feat: side commit 1\n\n{BODY}"),
+        ("HEAD~2^", f"docs: third commit\n\n{BODY}\n- more"),
+        ("HEAD^^^1", f"docs: third commit\n\n{BODY}\n- more"),
+        ("v1.0", f"docs: third commit\n\n{BODY}\n- more"),
+        ("tags/v0.1", "feat: first commit"),
+        ("refs/heads/side", "feat: side commit 2"),
+    ],
+)
+def test_get_commit_message_of_revision(history, revision, expected_message):
+    assert get_commit_message_of_hash(revision) == expected_message
+
+
+def test_get_commit_message_of_hash(history):
+    assert get_commit_message_of_hash(history["c1"]) == "feat: first commit"
+    assert get_commit_message_of_hash(history["c1"][:7]) == "feat: first commit"
+
+
+@pytest.mark.parametrize(
+    "revision", ["unknown", "HEAD~10", "HEAD^3", "HEAD^{tree}", "HEAD:file", "0000"]
+)
+def test_get_commit_message_of_unknown_revision(history, revision):
+    with pytest.raises(GitCommitNotFoundException):
+        get_commit_message_of_hash(revision)
+
+
+def test_get_commit_messages_of_hashes(history):
+    git(".", "gc", "--quiet")
+    assert list(
+        get_commit_messages_of_hashes([history["c7"], "v0.1", history["b2"][:8]])
+    ) == ["ci: last commit", "feat: first commit", "feat: side commit 2"]
+
+
+def test_get_commits_of_hashes(history):
+    commit_hashes = [history["c7"], "v0.1", history["b2"][:8]]
+    expected = list(git_cat_file_commits(commit_hashes))
+    assert [commit.hash for commit in expected] == [
+        history["c7"],
+        history["c1"],
+        history["b2"],
+    ]
+    assert list(get_commits_of_hashes(commit_hashes)) == expected
+
+
+def test_repository_rescans_new_packs(history):
+    with GitRepository.discover() as repository:
+        assert repository.get_commit_message("HEAD") == "ci: last commit"
+        git(".", "gc", "--quiet", "--prune=now")
+        assert repository.get_commit_message(history["c2"]).startswith("fix:")
+
+
+def test_repository_unsupported_ref_storage(history):
+    git(".", "config", "extensions.refStorage", "reftable")
+
+    with pytest.raises(GitException):
+        GitRepository.discover()
+
+
+def test_apply_delta():
+    base = b"0123456789" * 10
+    # copy 10 bytes at offset 5, insert "abc", copy the rest from offset 90 with
+    # the default size of 0x10000 bytes
+    delta = bytes([100, 23, 0x91, 5, 10, 3]) + b"abc" + bytes([0x81, 90])
+
+    assert _apply_delta(base, delta) == b"5678901234" + b"abc" + b"0123456789"
+
+
+@pytest.mark.parametrize(
+    "delta",
+    [
+        bytes([99, 3, 3]) + b"abc",  # base size mismatch
+        bytes([100, 3, 0]),  # invalid opcode
+        bytes([100, 4, 3]) + b"abc",  # result size mismatch
+    ],
+)
+def test_apply_corrupt_delta(delta):
+    with pytest.raises(GitException):
+        _apply_delta(b"0" * 100, delta)
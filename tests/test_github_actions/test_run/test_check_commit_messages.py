@@ -1,10 +1,11 @@
 # type: ignore
 # pylint: disable=all
 import os
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 import pytest
 
+from commitlint.messages import INCORRECT_FORMAT_ERROR, VALIDATION_SUCCESSFUL
 from github_actions.action.run import check_commit_messages
 from tests.fixtures.actions_env import set_github_env_vars
 
@@ -29,7 +30,7 @@ def test__check_commit_messages__all_valid_messages(
     mock_run_commitlint,
 ):
     commit_messages = ["feat: valid commit 1", "fix: valid commit 2"]
-    mock_run_commitlint.return_value = (True, None)
+    mock_run_commitlint.return_value = (True, [])
 
     check_commit_messages(commit_messages)
 
@@ -53,8 +54,8 @@ def test__check_commit_messages__partial_invalid_messages(
 ):
     commit_messages = ["feat: valid commit", "invalid commit message"]
     mock_run_commitlint.side_effect = [
-        (True, None),
-        (False, "Error: invalid commit format"),
+        (True, []),
+        (False, ["Error: invalid commit format"]),
     ]
 
     with pytest.raises(SystemExit):
@@ -86,7 +87,7 @@ def test__check_commit_messages__fail_on_error_false(
     mock_run_commitlint,
 ):
     commit_messages = ["invalid commit message"]
-    mock_run_commitlint.return_value = (False, "Invalid commit format")
+    mock_run_commitlint.return_value = (False, ["Invalid commit format"])
 
     check_commit_messages(commit_messages)
 
@@ -96,3 +97,34 @@ def test__check_commit_messages__fail_on_error_false(
     )
     mock_write_output.assert_any_call("status", STATUS_FAILURE)
     mock_write_output.assert_any_call("exit_code", 1)
+
+
+@patch("github_actions.action.run.write_line_to_file")
+@patch("github_actions.action.run.write_output")
+@patch("sys.stdout.write")
+@patch.dict(
+    os.environ,
+    {
+        **os.environ,
+        "GITHUB_STEP_SUMMARY": "summary_path",
+        "INPUT_FAIL_ON_ERROR": "False",
+    },
+)
+def test__check_commit_messages__writes_error_annotation(
+    mock_stdout_write,
+    _mock_write_output,
+    _mock_write_line_to_file,
+):
+    check_commit_messages(["feat: valid commit", "invalid commit message"])
+
+    mock_stdout_write.assert_has_calls(
+        [
+            call("\n⧗ feat: valid commit\n"),
+            call(f"{VALIDATION_SUCCESSFUL}\n"),
+            call("\n⧗ invalid commit message\n"),
+            call(
+                "::error title=invalid commit message::"
+                f"✖ Found 1 error(s).%0A- {INCORRECT_FORMAT_ERROR}\n"
+            ),
+        ]
+    )
@@ -2,17 +2,25 @@
 # pylint: disable=all
 import json
 import os
+import threading
 from unittest.mock import mock_open, patch
 
 import pytest
 
+from commitlint.exceptions import GitInvalidCommitRangeException
 from github_actions.action.event import GitHubEvent
 from github_actions.action.run import (
+    MAX_PAGE_WORKERS,
     MAX_PR_COMMITS,
     PER_PAGE_COMMITS,
+    PR_COMMITS_QUERY,
     get_pr_commit_messages,
 )
 from tests.fixtures.actions_env import set_github_env_vars
+from tests.fixtures.git import create_git_repo, git
+from tests.fixtures.github_api import FakeGitHubAPI, load_recorded_response
+
+COMMITS_PATH = "/repos/opensource-nepal/commitlint/pulls/10/commits"
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -20,7 +28,25 @@ def setup_env():
     set_github_env_vars()
 
 
-@patch("github_actions.action.run.request_github_api")
+@pytest.fixture
+def mock_request_github_api():
+    with patch("github_actions.action.run.GitHubClient") as mock_client:
+        yield mock_client.return_value.request
+
+
+@pytest.fixture
+def github_api():
+    with FakeGitHubAPI() as server:
+        with patch.dict(
+            os.environ,
+            {
+                "GITHUB_API_URL": server.url,
+                "GITHUB_GRAPHQL_URL": f"{server.url}/graphql",
+            },
+        ):
+            yield server
+
+
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
 def test__get_pr_commit_messages__single_page(
     mock_request_github_api,
@@ -35,56 +61,45 @@ def test__get_pr_commit_messages__single_page(
     with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
         event = GitHubEvent()
         result = get_pr_commit_messages(event)
-        assert result == ["feat: commit message"]
+        assert list(result) == ["feat: commit message"]
 
     mock_request_github_api.assert_called_once_with(
         method="GET",
         url="/repos/opensource-nepal/commitlint/pulls/10/commits",
-        token="token",
         params={"per_page": PER_PAGE_COMMITS, "page": 1},
     )
 
 
-@patch("github_actions.action.run.request_github_api")
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
 def test__get_pr_commit_messages__multiple_page(
     mock_request_github_api,
 ):
     # mock github api request
-    mock_request_github_api.side_effect = [
-        (
-            200,
-            [{"commit": {"message": "feat: commit message1"}}],
-        ),
-        (
-            200,
-            [{"commit": {"message": "feat: commit message2"}}],
-        ),
-    ]
+    mock_request_github_api.side_effect = lambda method, url, params: (
+        200,
+        [{"commit": {"message": f"feat: commit message{params['page']}"}}],
+    )
 
     payload = {"number": 10, "pull_request": {"commits": 60}}
     with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
         event = GitHubEvent()
         result = get_pr_commit_messages(event)
-        assert result == ["feat: commit message1", "feat: commit message2"]
+        assert list(result) == ["feat: commit message1", "feat: commit message2"]
 
     assert mock_request_github_api.call_count == 2
     mock_request_github_api.assert_any_call(
         method="GET",
         url="/repos/opensource-nepal/commitlint/pulls/10/commits",
-        token="token",
         params={"per_page": PER_PAGE_COMMITS, "page": 1},
     )
 
     mock_request_github_api.assert_any_call(
         method="GET",
         url="/repos/opensource-nepal/commitlint/pulls/10/commits",
-        token="token",
         params={"per_page": PER_PAGE_COMMITS, "page": 2},
     )
 
 
-@patch("github_actions.action.run.request_github_api")
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
 def test__get_pr_commit_messages__api_failure(
     mock_request_github_api,
@@ -94,7 +109,7 @@ def test__get_pr_commit_messages__api_failure(
     with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
         with pytest.raises(SystemExit):
             event = GitHubEvent()
-            get_pr_commit_messages(event)
+            list(get_pr_commit_messages(event))
 
 
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
@@ -104,3 +119,232 @@ def test__get_pr_commit_messages__exceed_max_commits():
         with pytest.raises(SystemExit):
             event = GitHubEvent()
             get_pr_commit_messages(event)
+
+
+@patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
+def test__get_pr_commit_messages__exact_pages(mock_request_github_api):
+    mock_request_github_api.return_value = (200, [])
+
+    payload = {"number": 10, "pull_request": {"commits": PER_PAGE_COMMITS}}
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+        event = GitHubEvent()
+        list(get_pr_commit_messages(event))
+
+    mock_request_github_api.assert_called_once()
+
+
+@patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
+def test__get_pr_commit_messages__concurrent_pages_in_order(github_api):
+    last_page_requested = threading.Event()
+    last_page = MAX_PR_COMMITS // PER_PAGE_COMMITS
+
+    def commits(params):
+        page = int(params["page"])
+        if page == last_page:
+            last_page_requested.set()
+        else:
+            # all the pages are requested before any is served
+            last_page_requested.wait(timeout=5)
+
+        return [
+            {"commit": {"message": f"feat: commit {page}.{index}"}}
+            for index in range(PER_PAGE_COMMITS)
+        ]
+
+    github_api.routes[COMMITS_PATH] = (200, commits)
+
+    payload = {"number": 10, "pull_request": {"commits": MAX_PR_COMMITS}}
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+        event = GitHubEvent()
+        result = list(get_pr_commit_messages(event))
+
+    assert last_page_requested.is_set()
+    assert result == [
+        f"feat: commit {page}.{index}"
+        for page in range(1, last_page + 1)
+        for index in range(PER_PAGE_COMMITS)
+    ]
+    assert github_api.connections == MAX_PAGE_WORKERS
+
+
+@patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
+def test__get_pr_commit_messages__yields_before_the_last_page(github_api):
+    first_page_linted = threading.Event()
+    served_pages = []
+
+    def commits(params):
+        if params["page"] == "2":
+            first_page_linted.wait(timeout=5)
+
+        served_pages.append(params["page"])
+        return [{"commit": {"message": f"feat: commit {params['page']}"}}]
+
+    github_api.routes[COMMITS_PATH] = (200, commits)
+
+    payload = {"number": 10, "pull_request": {"commits": PER_PAGE_COMMITS + 1}}
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+        event = GitHubEvent()
+        result = get_pr_commit_messages(event)
+
+        assert next(result) == "feat: commit 1"
+        # the second page is still being served
+        assert served_pages == ["1"]
+        first_page_linted.set()
+        assert list(result) == ["feat: commit 2"]
+
+
+@patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
+def test__get_pr_commit_messages__local_repository(
+    mock_request_github_api, tmp_path, monkeypatch
+):
+    hashes = create_git_repo(
+        tmp_path, ["chore: base commit", "feat: commit 1", "fix: commit 2"]
+    )
+    monkeypatch.chdir(tmp_path)
+
+    # no limit on the number of commits
+    payload = {
+        "number": 10,
+        "pull_request": {
+            "commits": MAX_PR_COMMITS + 1,
+            "base": {"sha": hashes[0]},
+            "head": {"sha": hashes[2]},
+        },
+    }
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+        event = GitHubEvent()
+        result = get_pr_commit_messages(event)
+
+    assert list(result) == ["feat: commit 1", "fix: commit 2"]
+    mock_request_github_api.assert_not_called()
+
+
+@patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
+def test__get_pr_commit_messages__shallow_clone_uses_api(
+    mock_request_github_api, tmp_path, monkeypatch
+):
+    (tmp_path / "origin").mkdir()
+    hashes = create_git_repo(tmp_path / "origin", ["chore: base", "feat: commit"])
+    git(
+        tmp_path,
+        "clone",
+        "--quiet",
+        "--depth",
+        "1",
+        f"file://{tmp_path}/origin",
+        "clone",
+    )
+    monkeypatch.chdir(tmp_path / "clone")
+    mock_request_github_api.return_value = (
+        200,
+        [{"commit": {"message": "feat: commit"}}],
+    )
+
+    payload = {
+        "number": 10,
+        "pull_request": {
+            "commits": 1,
+            "base": {"sha": hashes[0]},
+            "head": {"sha": hashes[1]},
+        },
+    }
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+        event = GitHubEvent()
+        result = get_pr_commit_messages(event)
+
+    assert list(result) == ["feat: commit"]
+    mock_request_github_api.assert_called_once()
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_GRAPHQL": "true"},
+)
+@patch("github_actions.action.run.GRAPHQL_PER_PAGE_COMMITS", 2)
+def test__get_pr_commit_messages__graphql(github_api):
+    recorded_pages = {
+        None: load_recorded_response("graphql_pr_commits_page_1"),
+        "Mg": load_recorded_response("graphql_pr_commits_page_2"),
+    }
+    github_api.routes["/graphql"] = (
+        200,
+        lambda body: recorded_pages[body["variables"]["after"]],
+    )
+
+    payload = {"number": 10, "pull_request": {"commits": 3}}
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+        event = GitHubEvent()
+        result = list(get_pr_commit_messages(event))
+
+    assert result == [
+        "feat: add the graphql mode",
+        "fix(action): follow the page cursors\n\nThe next page starts after the "
+        "end cursor.",
+        "invalid commit message",
+    ]
+    assert [request["body"] for request in github_api.requests] == [
+        {
+            "query": PR_COMMITS_QUERY,
+            "variables": {
+                "owner": "opensource-nepal",
+                "name": "commitlint",
+                "number": 10,
+                "first": 2,
+                "after": after,
+            },
+        }
+        for after in (None, "Mg")
+    ]
+    # the pages are requested on a single connection
+    assert github_api.connections == 1
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_GRAPHQL": "true"},
+)
+def test__get_pr_commit_messages__graphql_errors(github_api):
+    github_api.routes["/graphql"] = (
+        200,
+        load_recorded_response("graphql_pr_not_found"),
+    )
+
+    payload = {"number": 10, "pull_request": {"commits": 3}}
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+        event = GitHubEvent()
+        with pytest.raises(SystemExit) as exc_info:
+            list(get_pr_commit_messages(event))
+
+    assert "Could not resolve to a PullRequest" in str(exc_info.value)
+
+
+@patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
+@patch("github_actions.action.run.has_complete_history", return_value=True)
+@patch("github_actions.action.run.get_commit_messages_of_hash_range")
+def test__get_pr_commit_messages__invalid_local_range_uses_api(
+    mock_get_commit_messages_of_hash_range, _, mock_request_github_api
+):
+    def invalid_range(*args, **kwargs):
+        raise GitInvalidCommitRangeException("invalid range")
+        yield
+
+    mock_get_commit_messages_of_hash_range.side_effect = invalid_range
+    mock_request_github_api.return_value = (
+        200,
+        [{"commit": {"message": "feat: commit"}}],
+    )
+
+    payload = {
+        "number": 10,
+        "pull_request": {
+            "commits": 1,
+            "base": {"sha": "a" * 40},
+            "head": {"sha": "b" * 40},
+        },
+    }
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+        event = GitHubEvent()
+        result = get_pr_commit_messages(event)
+
+    assert list(result) == ["feat: commit"]
+    mock_request_github_api.assert_called_once()
@@ -6,9 +6,13 @@ from unittest.mock import mock_open, patch
 
 import pytest
 
+from commitlint.exceptions import GitException, GitInvalidCommitRangeException
 from github_actions.action.event import GitHubEvent
 from github_actions.action.run import get_push_commit_messages
 from tests.fixtures.actions_env import set_github_env_vars
+from tests.fixtures.git import create_git_repo, git
+
+NULL_SHA = "0" * 40
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -26,3 +30,104 @@ def test__get_push_commit_messages__returns_push_commits():
     with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
         commits = get_push_commit_messages(GitHubEvent())
         assert list(commits) == ["feat: valid message", "fix(login): fix login message"]
+
+
+def test__get_push_commit_messages__truncated_payload(tmp_path, monkeypatch):
+    hashes = create_git_repo(
+        tmp_path,
+        ["chore: before", "feat: commit 1", "fix: commit 2", "docs: commit 3"],
+    )
+    monkeypatch.chdir(tmp_path)
+
+    payload = {
+        "before": hashes[0],
+        "after": hashes[3],
+        "size": 3,
+        "commits": [{"message": "docs: commit 3"}],
+    }
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+        commits = get_push_commit_messages(GitHubEvent())
+        assert list(commits) == ["feat: commit 1", "fix: commit 2", "docs: commit 3"]
+
+
+def test__get_push_commit_messages__truncated_payload_of_new_branch(
+    tmp_path, monkeypatch
+):
+    hashes = create_git_repo(
+        tmp_path, ["chore: main", "feat: commit 1", "fix: commit 2"]
+    )
+    git(tmp_path, "update-ref", "refs/remotes/origin/main", hashes[0])
+    monkeypatch.chdir(tmp_path)
+
+    payload = {
+        "before": NULL_SHA,
+        "after": hashes[2],
+        "size": 2,
+        "commits": [{"message": "fix: commit 2"}],
+        "repository": {"default_branch": "main"},
+    }
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+        commits = get_push_commit_messages(GitHubEvent())
+        assert list(commits) == ["feat: commit 1", "fix: commit 2"]
+
+
+def test__get_push_commit_messages__truncated_payload_without_history(
+    tmp_path, monkeypatch, capsys
+):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+
+    payload = {
+        "before": "a" * 40,
+        "after": "b" * 40,
+        "size": 2,
+        "commits": [{"message": "fix: commit 2"}],
+    }
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+        commits = get_push_commit_messages(GitHubEvent())
+        assert list(commits) == ["fix: commit 2"]
+
+    assert capsys.readouterr().out.startswith(
+        "::warning::The push payload only includes 1 commit(s)"
+    )
+
+
+@patch("github_actions.action.run.has_complete_history", return_value=True)
+@patch("github_actions.action.run.get_commit_messages_of_hash_range")
+def test__get_push_commit_messages__invalid_local_range(
+    mock_get_commit_messages_of_hash_range, _, capsys
+):
+    def invalid_range(*args, **kwargs):
+        raise GitInvalidCommitRangeException("invalid range")
+        yield
+
+    mock_get_commit_messages_of_hash_range.side_effect = invalid_range
+
+    payload = {
+        "before": "a" * 40,
+        "after": "b" * 40,
+        "size": 2,
+        "commits": [{"message": "fix: commit 2"}],
+    }
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+        commits = get_push_commit_messages(GitHubEvent())
+        assert list(commits) == ["fix: commit 2"]
+
+    assert capsys.readouterr().out.startswith("::warning::")
+
+
+@patch("github_actions.action.run.has_complete_history", return_value=True)
+@patch("github_actions.action.run.get_merge_base", side_effect=GitException)
+def test__get_push_commit_messages__new_branch_without_merge_base(_, __, capsys):
+    payload = {
+        "before": NULL_SHA,
+        "after": "b" * 40,
+        "size": 2,
+        "commits": [{"message": "fix: commit 2"}],
+        "repository": {"default_branch": "main"},
+    }
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+        commits = get_push_commit_messages(GitHubEvent())
+        assert list(commits) == ["fix: commit 2"]
+
+    assert capsys.readouterr().out.startswith("::warning::")
@@ -6,13 +6,13 @@ Integration test of `run.py` to ensure Github Action full functionality.
 
 import json
 import os
-import subprocess
-from unittest.mock import call, mock_open, patch
+from unittest.mock import mock_open, patch
 
 import pytest
 
 from github_actions.action.run import run_action
 from tests.fixtures.actions_env import set_github_env_vars
+from tests.fixtures.github_api import FakeGitHubAPI
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -20,10 +20,19 @@ def setup_env():
     set_github_env_vars()
 
 
-@patch("subprocess.check_output", return_value="success")
+@pytest.fixture
+def github_api():
+    with FakeGitHubAPI() as server:
+        with patch.dict(os.environ, {"GITHUB_API_URL": server.url}):
+            yield server
+
+
+@patch("github_actions.action.run.write_line_to_file")
+@patch("github_actions.action.run.write_output")
+@patch("subprocess.check_output")
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "push"})
 def test__run_action__push_event_full_integration_test_for_valid_commits(
-    mock_check_output,
+    mock_check_output, mock_write_output, mock_write_line_to_file, capsys
 ):
     payload = {
         "commits": [
@@ -34,32 +43,21 @@ def test__run_action__push_event_full_integration_test_for_valid_commits(
     with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
         run_action()
 
-    assert mock_check_output.call_count == 2
-    expected_calls = [
-        call(
-            ["commitlint", "feat: valid message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
-        call(
-            ["commitlint", "fix(login): fix login message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
-    ]
-    mock_check_output.assert_has_calls(expected_calls, any_order=False)
-
-
-@patch("subprocess.check_output", return_value="success")
+    mock_check_output.assert_not_called()
+    output = capsys.readouterr().out
+    assert "⧗ feat: valid message\n" in output
+    assert "⧗ fix(login): fix login message\n" in output
+    assert "::error" not in output
+    mock_write_output.assert_any_call("status", "success")
+
+
+@patch("github_actions.action.run.write_line_to_file")
+@patch("github_actions.action.run.write_output")
+@patch("subprocess.check_output")
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "push"})
 def test__run_action__push_event_full_integration_test_for_invalid_commits(
-    mock_check_output,
+    mock_check_output, mock_write_output, mock_write_line_to_file, capsys
 ):
-    # mock for commitlint command to return error
-    mock_check_output.side_effect = subprocess.CalledProcessError(
-        1, ["cmd"], "stdout", "stderr"
-    )
-
     payload = {
         "commits": [
             {"message": "feat: valid message"},
@@ -70,31 +68,25 @@ def test__run_action__push_event_full_integration_test_for_invalid_commits(
         with pytest.raises(SystemExit):
             run_action()
 
-    assert mock_check_output.call_count == 2
-    expected_calls = [
-        call(
-            ["commitlint", "feat: valid message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
-        call(
-            ["commitlint", "invalid commit message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
-    ]
-    mock_check_output.assert_has_calls(expected_calls, any_order=False)
-
-
-@patch("github_actions.action.run.request_github_api")
-@patch("subprocess.check_output", return_value="success")
+    mock_check_output.assert_not_called()
+    output = capsys.readouterr().out
+    assert output.count("::error") == 1
+    assert "::error title=invalid commit message::" in output
+    mock_write_output.assert_any_call("status", "failure")
+
+
+@patch("github_actions.action.run.write_line_to_file")
+@patch("github_actions.action.run.write_output")
+@patch("subprocess.check_output")
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
 def test__run_action__pr_event_full_integration_test_for_valid_commits(
     mock_check_output,
-    mock_request_github_api,
+    mock_write_output,
+    mock_write_line_to_file,
+    github_api,
+    capsys,
 ):
-    # mock github api request
-    mock_request_github_api.return_value = (
+    github_api.routes["/repos/opensource-nepal/commitlint/pulls/10/commits"] = (
         200,
         [
             {
@@ -110,36 +102,26 @@ def test__run_action__pr_event_full_integration_test_for_valid_commits(
     with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
         run_action()
 
-    assert mock_check_output.call_count == 2
-    expected_calls = [
-        call(
-            ["commitlint", "feat: valid message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
-        call(
-            ["commitlint", "fix(login): fix login message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
-    ]
-    mock_check_output.assert_has_calls(expected_calls, any_order=False)
-
-
-@patch("github_actions.action.run.request_github_api")
-@patch("subprocess.check_output", return_value="success")
+    mock_check_output.assert_not_called()
+    output = capsys.readouterr().out
+    assert "⧗ feat: valid message\n" in output
+    assert "⧗ fix(login): fix login message\n" in output
+    assert "::error" not in output
+    mock_write_output.assert_any_call("status", "success")
+
+
+@patch("github_actions.action.run.write_line_to_file")
+@patch("github_actions.action.run.write_output")
+@patch("subprocess.check_output")
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
 def test__run_action__pr_event_full_integration_test_for_invalid_commits(
     mock_check_output,
-    mock_request_github_api,
+    mock_write_output,
+    mock_write_line_to_file,
+    github_api,
+    capsys,
 ):
-    # mock for commitlint command to return error
-    mock_check_output.side_effect = subprocess.CalledProcessError(
-        1, ["cmd"], "stdout", "stderr"
-    )
-
-    # mock github api request
-    mock_request_github_api.return_value = (
+    github_api.routes["/repos/opensource-nepal/commitlint/pulls/10/commits"] = (
         200,
         [
             {
@@ -156,17 +138,8 @@ def test__run_action__pr_event_full_integration_test_for_invalid_commits(
         with pytest.raises(SystemExit):
             run_action()
 
-    assert mock_check_output.call_count == 2
-    expected_calls = [
-        call(
-            ["commitlint", "feat: valid message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
-        call(
-            ["commitlint", "invalid commit message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
-    ]
-    mock_check_output.assert_has_calls(expected_calls, any_order=False)
+    mock_check_output.assert_not_called()
+    output = capsys.readouterr().out
+    assert output.count("::error") == 1
+    assert "::error title=invalid commit message::" in output
+    mock_write_output.assert_any_call("status", "failure")
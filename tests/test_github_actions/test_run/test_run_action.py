@@ -7,6 +7,7 @@ from unittest.mock import mock_open, patch
 
 import pytest
 
+from commitlint.config import config
 from github_actions.action.event import GitHubEvent
 from github_actions.action.run import run_action
 from tests.fixtures.actions_env import set_github_env_vars
@@ -60,3 +61,15 @@ def test__run_action__calls_handle_pr_events_for_pull_request_target(
 def test__run_action__skips_unknown_event(mock_stdout_write):
     run_action()
     mock_stdout_write.assert_called_once_with("Skipping for event workflow_dispatch\n")
+
+
+@patch("github_actions.action.run._handle_push_event")
+@patch.dict(
+    os.environ, {**os.environ, "GITHUB_EVENT_NAME": "push", "INPUT_VERBOSE": "true"}
+)
+def test__run_action__sets_verbose_config_from_input(_mock_handle_push_event):
+    try:
+        run_action()
+        assert config.verbose is True
+    finally:
+        config.verbose = False
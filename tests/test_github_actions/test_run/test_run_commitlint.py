@@ -1,58 +1,49 @@
 # type: ignore
 # pylint: disable=all
-import os
-import subprocess
 from unittest.mock import patch
 
-from github_actions.action.run import run_commitlint
+from commitlint.messages import INCORRECT_FORMAT_ERROR
+from github_actions.action.run import format_errors, run_commitlint
 
 
-@patch("subprocess.check_output", return_value="feat: valid commit message")
-@patch.dict(os.environ, {**os.environ, "INPUT_VERBOSE": "False"})
-def test__run_commitlint__success(mock_check_output):
+def test__run_commitlint__success():
     commit_message = "feat: add new feature"
 
     result = run_commitlint(commit_message)
 
-    assert result == (True, None)
-    mock_check_output.assert_called_once_with(
-        ["commitlint", commit_message, "--hide-input"],
-        text=True,
-        stderr=subprocess.PIPE,
-    )
-
+    assert result == (True, [])
 
-@patch("subprocess.check_output")
-@patch.dict(os.environ, {**os.environ, "INPUT_VERBOSE": "False"})
-def test__run_commitlint__failure(mock_check_output):
-    mock_check_output.side_effect = (
-        subprocess.CalledProcessError(1, "cmd", output="", stderr="Error"),
-    )
 
+def test__run_commitlint__failure():
     commit_message = "invalid commit message"
     result = run_commitlint(commit_message)
 
-    assert result == (False, "Error")
-    mock_check_output.assert_called_once_with(
-        ["commitlint", commit_message, "--hide-input"],
-        text=True,
-        stderr=subprocess.PIPE,
-    )
+    assert result == (False, [INCORRECT_FORMAT_ERROR])
+
+
+def test__run_commitlint__strips_the_commit_message():
+    # as the commitlint command strips its commit message argument
+    result = run_commitlint("  feat: add new feature\n\n")
 
+    assert result == (True, [])
 
-@patch(
-    "subprocess.check_output",
-    return_value="feat: valid commit message",
-)
-@patch.dict(os.environ, {**os.environ, "INPUT_VERBOSE": "True"})
-def test__run_commitlint__verbose(mock_check_output):
+
+@patch("github_actions.action.run.lint_commit_message", return_value=(True, []))
+@patch("subprocess.check_output")
+def test__run_commitlint__runs_in_process(mock_check_output, mock_lint_commit_message):
     commit_message = "feat: add new feature"
 
-    result = run_commitlint(commit_message)
+    run_commitlint(commit_message)
+
+    mock_lint_commit_message.assert_called_once_with(commit_message)
+    mock_check_output.assert_not_called()
+
+
+def test__format_errors__escapes_workflow_command_characters():
+    errors = ["Invalid type '100%'.", "Description is missing."]
+
+    result = format_errors(errors)
 
-    assert result == (True, None)
-    mock_check_output.assert_called_once_with(
-        ["commitlint", commit_message, "--hide-input", "--verbose"],
-        text=True,
-        stderr=subprocess.PIPE,
+    assert result == (
+        "✖ Found 2 error(s).%0A- Invalid type '100%25'.%0A- Description is missing."
     )
@@ -0,0 +1,135 @@
+# type: ignore
+# pylint: disable=all
+import os
+import socket
+from unittest.mock import patch
+
+import pytest
+
+from github_actions.action.utils import DEFAULT_GITHUB_API_URL, GitHubClient
+from tests.fixtures.github_api import FakeGitHubAPI
+
+COMMITS_PATH = "/repos/opensource-nepal/commitlint/pulls/10/commits"
+
+
+@pytest.fixture
+def github_api():
+    with FakeGitHubAPI() as server:
+        server.routes[COMMITS_PATH] = (
+            200,
+            lambda params: [{"commit": {"message": f"feat: page {params['page']}"}}],
+        )
+        yield server
+
+
+def test__github_client__reuses_the_connection(github_api):
+    with GitHubClient("test_token", base_url=github_api.url) as client:
+        pages = [
+            client.request("GET", COMMITS_PATH, params={"page": page})
+            for page in (1, 2, 3)
+        ]
+
+    assert pages == [
+        (200, [{"commit": {"message": f"feat: page {page}"}}]) for page in (1, 2, 3)
+    ]
+    assert github_api.connections == 1
+
+
+def test__github_client__sends_the_headers(github_api):
+    with GitHubClient("test_token", base_url=github_api.url) as client:
+        client.request("GET", COMMITS_PATH, params={"page": 1})
+
+    headers = github_api.requests[0]["headers"]
+    assert headers["Authorization"] == "Bearer test_token"
+    assert headers["Accept-Encoding"] == "gzip"
+    assert headers["User-Agent"] == "commitlint"
+
+
+def test__github_client__with_base_url_path(github_api):
+    # e.g. GitHub Enterprise Server: https://github.example.com/api/v3
+    github_api.routes["/api/v3" + COMMITS_PATH] = (200, [])
+
+    with patch.dict(os.environ, {"GITHUB_API_URL": f"{github_api.url}/api/v3/"}):
+        with GitHubClient("test_token") as client:
+            assert client.request("GET", COMMITS_PATH) == (200, [])
+
+    assert github_api.requests[0]["path"] == "/api/v3" + COMMITS_PATH
+
+
+def test__github_client__default_base_url():
+    with patch.dict(os.environ):
+        os.environ.pop("GITHUB_API_URL", None)
+        assert GitHubClient("test_token").base_url == DEFAULT_GITHUB_API_URL
+
+
+def test__github_client__reconnects_when_the_server_closes(github_api):
+    github_api.close_connections = True
+
+    with GitHubClient("test_token", base_url=github_api.url) as client:
+        for page in (1, 2):
+            status, _ = client.request("GET", COMMITS_PATH, params={"page": page})
+            assert status == 200
+
+    assert github_api.connections == 2
+
+
+def test__github_client__retries_a_stale_connection(github_api):
+    with GitHubClient("test_token", base_url=github_api.url) as client:
+        client.request("GET", COMMITS_PATH, params={"page": 1})
+        # the server closes the kept-alive connection
+        for connection in client._connections.values():
+            connection.sock.shutdown(socket.SHUT_RDWR)
+
+        status, data = client.request("GET", COMMITS_PATH, params={"page": 2})
+
+    assert status == 200
+    assert data == [{"commit": {"message": "feat: page 2"}}]
+    assert github_api.connections == 2
+
+
+def test__github_client__error_status(github_api):
+    with GitHubClient("test_token", base_url=github_api.url) as client:
+        assert client.request("GET", "/unknown") == (404, {"message": "Not Found"})
+
+
+def test__github_client__read_timeout(github_api):
+    github_api.delay = 0.5
+
+    with GitHubClient(
+        "test_token", base_url=github_api.url, read_timeout=0.05
+    ) as client:
+        with pytest.raises(TimeoutError):
+            client.request("GET", COMMITS_PATH, params={"page": 1})
+
+        # the timed out connection isn't reused
+        assert not client._connections
+
+
+def test__github_client__graphql(github_api):
+    github_api.routes["/graphql"] = (200, lambda body: {"data": body["variables"]})
+
+    with patch.dict(os.environ):
+        os.environ.pop("GITHUB_GRAPHQL_URL", None)
+        with GitHubClient("test_token", base_url=github_api.url) as client:
+            status, data = client.graphql("query { viewer { login } }", {"a": 1})
+
+    assert (status, data) == (200, {"data": {"a": 1}})
+    request = github_api.requests[0]
+    assert request["method"] == "POST"
+    assert request["body"] == {
+        "query": "query { viewer { login } }",
+        "variables": {"a": 1},
+    }
+
+
+def test__github_client__graphql_url():
+    with patch.dict(
+        os.environ,
+        {
+            "GITHUB_API_URL": "https://github.example.com/api/v3",
+            "GITHUB_GRAPHQL_URL": "https://github.example.com/api/graphql",
+        },
+    ):
+        assert GitHubClient("test_token").graphql_url == (
+            "https://github.example.com/api/graphql"
+        )
@@ -32,6 +32,7 @@ def test__request_github_api__get_request(mock_https_connection):
         url="/repos/opensource-nepal/commitlint",
         body=None,
         headers={
+            "Accept-Encoding": "gzip",
             "Authorization": "Bearer test_token",
             "Content-Type": "application/json",
             "User-Agent": "commitlint",
@@ -55,6 +56,7 @@ def test__request_github_api__get_request_with_params(mock_https_connection):
         url="/repos/opensource-nepal/commitlint?key1=val1&key2=val2",
         body=None,
         headers={
+            "Accept-Encoding": "gzip",
             "Authorization": "Bearer test_token",
             "Content-Type": "application/json",
             "User-Agent": "commitlint",
@@ -77,6 +79,7 @@ def test__request_github_api__post_request(mock_https_connection):
         url="/repos/opensource-nepal/commitlint",
         body=None,
         headers={
+            "Accept-Encoding": "gzip",
             "Authorization": "Bearer test_token",
             "Content-Type": "application/json",
             "User-Agent": "commitlint",
@@ -100,6 +103,7 @@ def test_request_github_api__post_request_with_body(mock_https_connection):
         url="/repos/opensource-nepal/commitlint",
         body=json.dumps({"data": "test_data"}),
         headers={
+            "Accept-Encoding": "gzip",
             "Authorization": "Bearer test_token",
             "Content-Type": "application/json",
             "User-Agent": "commitlint",
@@ -124,6 +128,7 @@ def test_request_github_api__post_request_with_body_and_params(mock_https_connec
         url="/repos/opensource-nepal/commitlint?key1=val1&key2=val2",
         body=json.dumps({"data": "test_data"}),
         headers={
+            "Accept-Encoding": "gzip",
             "Authorization": "Bearer test_token",
             "Content-Type": "application/json",
             "User-Agent": "commitlint",
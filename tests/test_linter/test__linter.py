@@ -1,13 +1,16 @@
 # type: ignore
 # pylint: disable=all
 
+import pickle
 from unittest.mock import patch
 
 import pytest
 
+from commitlint.config import config
 from commitlint.constants import COMMIT_HEADER_MAX_LENGTH
-from commitlint.linter import lint_commit_message
+from commitlint.linter import Linter, lint_commit_message, lint_commit_messages
 from commitlint.messages import HEADER_LENGTH_ERROR, INCORRECT_FORMAT_ERROR
+from commitlint.timings import Timings
 
 from ..fixtures.linter import LINTER_FIXTURE_PARAMS
 
@@ -24,6 +27,47 @@ def test_lint_commit_message(fixture_data):
     assert errors == expected_errors
 
 
+def test__linter__lint(fixture_data):
+    commit_message, expected_success, expected_errors = fixture_data
+    assert Linter().lint(commit_message) == (expected_success, expected_errors)
+
+
+def test__linter__lint_skip_detail(fixture_data):
+    commit_message, expected_success, _ = fixture_data
+    success, _ = Linter(skip_detail=True).lint(commit_message)
+    assert success == expected_success
+
+
+def test__linter__lint_many():
+    commit_messages = iter(["feat: valid commit message", "Invalid commit message"])
+    results = list(Linter().lint_many(commit_messages))
+    assert results == [(True, []), (False, [INCORRECT_FORMAT_ERROR])]
+
+
+def test__linter__validators_are_stateless():
+    linter = Linter()
+    assert not hasattr(linter, "__dict__")
+    for validator in linter._validators:
+        assert not hasattr(validator, "__dict__")
+
+
+def test__linter__is_picklable():
+    linter = pickle.loads(pickle.dumps(Linter(skip_detail=True)))
+    assert linter.skip_detail is True
+    assert linter.lint("Invalid commit message") == (False, [INCORRECT_FORMAT_ERROR])
+
+
+def test__lint_commit_message__reuses_linter():
+    with patch.object(Linter, "lint_result", autospec=True) as mock_lint:
+        lint_commit_message("feat: commit message 1", skip_detail=True)
+        lint_commit_message("feat: commit message 2", skip_detail=True)
+
+    first_linter = mock_lint.call_args_list[0].args[0]
+    second_linter = mock_lint.call_args_list[1].args[0]
+    assert first_linter is second_linter
+    assert first_linter.skip_detail is True
+
+
 def test__lint_commit_message__skip_detail(fixture_data):
     commit_message, expected_success, _ = fixture_data
     success, _ = lint_commit_message(commit_message, skip_detail=True)
@@ -59,3 +103,79 @@ def test__lint_commit_message__skip_detail_returns_invalid_format_error_message(
     success, errors = lint_commit_message(commit_message, skip_detail=True)
     assert success is False
     assert errors == [INCORRECT_FORMAT_ERROR]
+
+
+def test__lint_commit_messages__serial():
+    commit_messages = ["feat: valid commit message", "Invalid commit message"]
+    results = list(lint_commit_messages(commit_messages))
+    assert results == [
+        ("feat: valid commit message", True, []),
+        ("Invalid commit message", False, [INCORRECT_FORMAT_ERROR]),
+    ]
+
+
+@patch("concurrent.futures.ProcessPoolExecutor")
+def test__lint_commit_messages__small_batch_falls_back_to_serial(
+    mock_process_pool_executor,
+):
+    commit_messages = ["feat: valid commit message", "Invalid commit message"]
+    results = list(lint_commit_messages(commit_messages, jobs=4))
+    assert [success for _, success, _ in results] == [True, False]
+    mock_process_pool_executor.assert_not_called()
+
+
+@patch("commitlint.linter._linter.PARALLEL_CHUNK_SIZE", 2)
+@patch("commitlint.linter._linter.PARALLEL_MIN_COMMITS", 4)
+def test__lint_commit_messages__parallel_preserves_order():
+    commit_messages = [
+        f"feat: commit message {i}" if i % 3 else f"Invalid commit message {i}"
+        for i in range(50)
+    ]
+    serial_results = list(lint_commit_messages(commit_messages))
+    parallel_results = list(lint_commit_messages(iter(commit_messages), jobs=2))
+    assert parallel_results == serial_results
+
+
+@pytest.fixture
+def timings():
+    config.timings = Timings()
+    yield config.timings
+    config.timings = None
+
+
+def test__linter__lint_with_timings(fixture_data, timings):
+    commit_message, expected_success, expected_errors = fixture_data
+    linter = Linter(strip_comments=True)
+    assert linter.lint(commit_message) == (expected_success, expected_errors)
+
+    phases = {phase["name"]: phase for phase in timings.summary()["phases"]}
+    assert phases["lint"]["count"] == 1
+    assert phases["preprocess.strip_comments"]["count"] == 1
+    assert phases["preprocess.is_ignored"]["count"] == 1
+
+
+def test__linter__lint_with_timings_records_validators(timings):
+    linter = Linter()
+    linter.lint("feat: valid commit message")
+    linter.lint("Invalid commit message")
+    linter.lint("Merge branch 'main' into feature")
+
+    phases = {phase["name"]: phase["count"] for phase in timings.summary()["phases"]}
+    assert phases == {
+        "preprocess.is_ignored": 3,
+        "validator.HeaderLengthValidator": 2,
+        "validator.PatternValidator": 2,
+        "lint": 3,
+    }
+
+
+@patch("commitlint.linter._linter.PARALLEL_MIN_COMMITS", 2)
+@patch("concurrent.futures.ProcessPoolExecutor")
+def test__lint_commit_messages__with_timings_is_serial(
+    mock_process_pool_executor, timings
+):
+    commit_messages = ["feat: valid commit message", "Invalid commit message"] * 2
+    results = list(lint_commit_messages(commit_messages, jobs=4))
+    assert [success for _, success, _ in results] == [True, False, True, False]
+    mock_process_pool_executor.assert_not_called()
+    assert len(timings.summary()["slowest_messages"]) == 4
@@ -0,0 +1,157 @@
+# type: ignore
+# pylint: disable=all
+"""
+Differential tests of the header scanner against the conventional commit regex
+it replaces.
+"""
+
+import random
+
+import pytest
+
+from commitlint.linter.parser import parse_header
+from commitlint.linter.validators import PatternValidator
+from commitlint.linter.view import CommitMessageView
+
+from ..fixtures.linter import LINTER_FIXTURE_PARAMS
+from ._regex_reference import COMMIT_RE, RegexPatternValidator
+
+EDGE_CASE_MESSAGES = [
+    "",
+    ":",
+    ": ",
+    "!",
+    "!:",
+    "(",
+    ")",
+    "()",
+    "():",
+    "feat",
+    "feat:",
+    "feat: ",
+    "feat:  ",
+    "feat:\tdescription",
+    "feat:\ndescription",
+    "feat:\n\ndescription",
+    "feat: description\r\nbody",
+    "feat: description\rbody",
+    "feat: description\n",
+    "feat: description\n\n",
+    "feat: description\n\n\n",
+    "feat: description\n \nbody",
+    "feat: description \t",
+    "feat: description. ",
+    "feat: description.\t\n\nbody",
+    "feat : description",
+    "feat\t: description",
+    "feat\n: description",
+    "feat\n(scope): description",
+    "feat(scope) : description",
+    "feat(scope)\t: description",
+    "feat(scope)\n\n: description",
+    "feat(sco\npe): description",
+    "feat(sco pe): description",
+    "feat(scope: description",
+    "feat(scope: description)",
+    "feat((scope)): description",
+    "feat(scope)!: description",
+    "feat(scope)! : description",
+    "feat!(scope): description",
+    "feat!!: description",
+    "feat ! : description",
+    "feat_1: description",
+    "fëat: déscription",
+    "feat²: description",
+    "feat\xa0: description",
+    "feat:\u3000description",
+    "feat: \u2028description",
+    "(scope): description",
+    "1: description",
+    " feat: description",
+    "feat:description",
+    "feat: .",
+    "feat:  .",
+    "Merge branch 'main'",
+]
+
+ALPHABET = [
+    "feat",
+    "fix",
+    "Feat",
+    "x_1",
+    "é",
+    "(",
+    ")",
+    "!",
+    ":",
+    " ",
+    "  ",
+    "\t",
+    "\n",
+    "\n\n",
+    "\r",
+    "\r\n",
+    ".",
+    "scope",
+    "description",
+    "\xa0",
+]
+
+
+def _random_messages(count, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 12)))
+
+
+@pytest.mark.parametrize(
+    "commit_message",
+    [params[0] for params in LINTER_FIXTURE_PARAMS] + EDGE_CASE_MESSAGES,
+)
+def test__pattern_validator__matches_regex(commit_message):
+    errors = PatternValidator().validate(CommitMessageView(commit_message))
+    assert [error.render() for error in errors] == RegexPatternValidator().validate(
+        commit_message
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test__pattern_validator__matches_regex_for_random_messages(seed):
+    validator = PatternValidator()
+    regex_validator = RegexPatternValidator()
+    for commit_message in _random_messages(2000, seed):
+        errors = validator.validate(CommitMessageView(commit_message))
+        assert [error.render() for error in errors] == regex_validator.validate(
+            commit_message
+        ), repr(commit_message)
+
+
+@pytest.mark.parametrize("commit_message", EDGE_CASE_MESSAGES)
+def test__parse_header__matches_regex_groups(commit_message):
+    parsed = parse_header(commit_message)
+    re_match = COMMIT_RE.match(commit_message)
+
+    re_type = re_match.group("type")
+    assert parsed.commit_type == (re_type.strip() if re_type else None)
+    assert parsed.scope == re_match.group("scope")
+    assert (parsed.colon_start != -1) == (re_match.group("colon") is not None)
+    assert parsed.description == (re_match.group("description") or "")
+    assert commit_message[parsed.body_start :] == re_match.group("body")
+
+
+@pytest.mark.parametrize("commit_message", EDGE_CASE_MESSAGES)
+def test__parse_header__with_known_header_end(commit_message):
+    view = CommitMessageView(commit_message)
+    assert parse_header(commit_message, view.header_end) == parse_header(commit_message)
+
+
+def test__parse_header__positions():
+    commit_message = "feat(scope)!: add feature\n\nbody"
+    parsed = parse_header(commit_message)
+
+    assert parsed.commit_type == "feat"
+    assert parsed.scope == "scope"
+    assert parsed.has_bang is True
+    assert commit_message[parsed.colon_start : parsed.colon_end] == ": "
+    assert parsed.description == "add feature"
+    assert parsed.body_start == len("feat(scope)!: add feature\n\n")
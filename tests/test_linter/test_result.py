@@ -0,0 +1,104 @@
+# type: ignore
+# pylint: disable=all
+
+import pickle
+from unittest.mock import patch
+
+from commitlint.linter import (
+    ErrorCode,
+    Linter,
+    LintError,
+    LintResult,
+    lint_commit_message_result,
+    lint_commit_message_results,
+)
+from commitlint.linter.result import ERROR_MESSAGES
+from commitlint.messages import (
+    COMMIT_TYPE_INVALID_ERROR,
+    DESCRIPTION_MISSING_ERROR,
+    INCORRECT_FORMAT_ERROR,
+)
+
+
+def test__error_code__every_code_has_a_message():
+    assert set(ERROR_MESSAGES) == set(ErrorCode)
+
+
+def test__error_code__values_are_stable():
+    assert ErrorCode("type-invalid") is ErrorCode.COMMIT_TYPE_INVALID
+    assert ErrorCode.INCORRECT_FORMAT.value == "incorrect-format"
+
+
+def test__lint_error__render():
+    assert LintError(ErrorCode.DESCRIPTION_MISSING).render() == (
+        DESCRIPTION_MISSING_ERROR
+    )
+    assert LintError(ErrorCode.COMMIT_TYPE_INVALID, ("feet",)).render() == (
+        COMMIT_TYPE_INVALID_ERROR % "feet"
+    )
+
+
+def test__lint_result__render_errors_and_as_tuple():
+    result = LintResult(
+        False,
+        [
+            LintError(ErrorCode.COMMIT_TYPE_INVALID, ("feet",)),
+            LintError(ErrorCode.DESCRIPTION_MISSING),
+        ],
+    )
+    expected_errors = [COMMIT_TYPE_INVALID_ERROR % "feet", DESCRIPTION_MISSING_ERROR]
+
+    assert result.render_errors() == expected_errors
+    assert result.as_tuple() == (False, expected_errors)
+    assert LintResult(True).as_tuple() == (True, [])
+
+
+def test__lint_result__equality():
+    assert LintResult(True) == LintResult(True, [])
+    assert LintResult(False, [LintError(ErrorCode.INCORRECT_FORMAT)]) != LintResult(
+        False, [LintError(ErrorCode.HEADER_LENGTH)]
+    )
+    assert LintResult(True) != (True, [])
+
+
+def test__lint_result__has_no_dict():
+    assert not hasattr(LintResult(True), "__dict__")
+
+
+def test__lint_result__is_picklable():
+    result = LintResult(False, [LintError(ErrorCode.COMMIT_TYPE_INVALID, ("feet",))])
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test__linter__lint_result_does_not_render():
+    with patch.object(LintError, "render") as mock_render:
+        result = Linter().lint_result("feet: add feature.")
+
+    mock_render.assert_not_called()
+    assert result.success is False
+    assert [error.code for error in result.errors] == [
+        ErrorCode.COMMIT_TYPE_INVALID,
+        ErrorCode.DESCRIPTION_FULL_STOP_END,
+    ]
+    assert result.errors[0].args == ("feet",)
+
+
+def test__lint_commit_message_result():
+    assert lint_commit_message_result("feat: add feature") == LintResult(True)
+    assert lint_commit_message_result(
+        "Invalid commit message", skip_detail=True
+    ) == LintResult(False, [LintError(ErrorCode.INCORRECT_FORMAT)])
+
+
+def test__lint_commit_message_results():
+    results = list(
+        lint_commit_message_results(["feat: add feature", "Invalid commit message"])
+    )
+    assert results == [
+        ("feat: add feature", LintResult(True)),
+        (
+            "Invalid commit message",
+            LintResult(False, [LintError(ErrorCode.INCORRECT_FORMAT)]),
+        ),
+    ]
+    assert results[1][1].render_errors() == [INCORRECT_FORMAT_ERROR]
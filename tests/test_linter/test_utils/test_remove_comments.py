@@ -45,3 +45,9 @@ def test__remove_comments__comments_before_diff():
     expected_output = ""
     result = remove_comments(input_msg)
     assert result == expected_output
+
+
+def test__remove_comments__keeps_hash_inside_lines():
+    input_msg = "fix: handle issue #123\n\nFixes #123"
+    result = remove_comments(input_msg)
+    assert result == input_msg
@@ -0,0 +1,49 @@
+# type: ignore
+# pylint: disable=all
+
+import pytest
+
+from commitlint.linter.utils import is_ignored
+from commitlint.linter.view import CommitMessageView
+
+
+@pytest.mark.parametrize(
+    "commit_message",
+    [
+        "",
+        "feat: add feature",
+        "feat: add feature\n",
+        "feat: add feature\n\nbody\nmore body",
+        "\nfeat: add feature",
+        "feat: add feature\r\n\r\nbody",
+        "feat: add\rfeature\nbody",
+        "\rfeat: add feature",
+        "feat: add\x0bfeature\nbody",
+        "feat: add feature",
+    ],
+)
+def test__commit_message_view__matches_split(commit_message):
+    view = CommitMessageView(commit_message)
+
+    assert view.header == commit_message.split("\n")[0]
+    assert view.header_end == len(commit_message.split("\n")[0])
+    assert view.first_line == (commit_message.splitlines() or [""])[0]
+    assert view.text[view.body_start :] == commit_message.partition("\n")[2]
+    assert len(view) == len(commit_message)
+    assert str(view) == commit_message
+
+
+def test__commit_message_view__caches_header():
+    view = CommitMessageView("feat: add feature\n\n" + "body\n" * 1000)
+    assert view.header is view.header
+
+
+def test__commit_message_view__of_reuses_view():
+    view = CommitMessageView("feat: add feature")
+    assert CommitMessageView.of(view) is view
+    assert CommitMessageView.of("feat: add feature").text == "feat: add feature"
+
+
+def test__is_ignored__with_view():
+    assert is_ignored(CommitMessageView("Merge branch hotfix-123\n\nbody")) is True
+    assert is_ignored(CommitMessageView("feat: add feature")) is False
@@ -0,0 +1,64 @@
+# type: ignore
+# pylint: disable=all
+import io
+
+import pytest
+
+from commitlint.streams import iter_commit_messages, iter_delimited_records
+
+
+@pytest.mark.parametrize(
+    "data, expected_records",
+    [
+        (b"", []),
+        (b"one", [b"one"]),
+        (b"one\0", [b"one"]),
+        (b"one\0two\0", [b"one", b"two"]),
+        (b"one\0two", [b"one", b"two"]),
+        (b"\0one\0\0", [b"", b"one", b""]),
+    ],
+)
+def test__iter_delimited_records(data, expected_records):
+    assert list(iter_delimited_records(io.BytesIO(data))) == expected_records
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 64])
+def test__iter_delimited_records__records_spanning_chunks(chunk_size):
+    data = b"first record\0second\0\0third record is long"
+    records = iter_delimited_records(io.BytesIO(data), chunk_size=chunk_size)
+    assert list(records) == [b"first record", b"second", b"", b"third record is long"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 64])
+def test__iter_delimited_records__multi_byte_delimiter(chunk_size):
+    data = b"one\r\n\r\ntwo\r\n\r\nthree"
+    records = iter_delimited_records(
+        io.BytesIO(data), delimiter=b"\r\n\r\n", chunk_size=chunk_size
+    )
+    assert list(records) == [b"one", b"two", b"three"]
+
+
+def test__iter_delimited_records__reads_available_bytes_of_buffered_streams():
+    class PipeReader(io.BytesIO):
+        def read(self, size=-1):
+            raise AssertionError("read1 should be used")
+
+    records = iter_delimited_records(PipeReader(b"one\0two"), chunk_size=64)
+    assert list(records) == [b"one", b"two"]
+
+
+def test__iter_commit_messages():
+    data = b"feat: one\n\0\0  \n\0fix: two\n\nbody\0invalid \xff"
+    assert list(iter_commit_messages(io.BytesIO(data))) == [
+        "feat: one",
+        "fix: two\n\nbody",
+        "invalid \ufffd",
+    ]
+
+
+def test__iter_commit_messages__custom_delimiter():
+    data = b"feat: one\x1efix: two"
+    assert list(iter_commit_messages(io.BytesIO(data), delimiter=b"\x1e")) == [
+        "feat: one",
+        "fix: two",
+    ]
@@ -0,0 +1,115 @@
+# type: ignore
+# pylint: disable=all
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from commitlint.timings import Timings, _percentile
+
+
+@pytest.mark.parametrize(
+    "values, percent, expected",
+    [
+        ([1.0], 50, 1.0),
+        ([1.0], 95, 1.0),
+        ([1.0, 2.0], 50, 1.0),
+        ([1.0, 2.0, 3.0, 4.0], 50, 2.0),
+        ([float(value) for value in range(1, 101)], 95, 95.0),
+        ([float(value) for value in range(1, 101)], 50, 50.0),
+    ],
+)
+def test__percentile(values, percent, expected):
+    assert _percentile(values, percent) == expected
+
+
+def test__timings__phase():
+    timings = Timings()
+    with timings.phase("retrieve"):
+        pass
+    with pytest.raises(ValueError):
+        with timings.phase("retrieve"):
+            raise ValueError
+
+    phases = timings.summary()["phases"]
+    assert [phase["name"] for phase in phases] == ["retrieve"]
+    assert phases[0]["count"] == 2
+
+
+def test__timings__iter_timed():
+    timings = Timings()
+    items = list(timings.iter_timed("retrieve", iter(["a", "b", "c"])))
+
+    assert items == ["a", "b", "c"]
+    # one duration per item, without the exhausting call
+    assert timings.summary()["phases"][0]["count"] == 3
+
+
+def test__timings__iter_timed_empty():
+    timings = Timings()
+    assert list(timings.iter_timed("retrieve", iter([]))) == []
+    assert timings.summary()["phases"] == []
+
+
+def test__timings__add_message_keeps_slowest():
+    timings = Timings(slowest_count=2)
+    timings.add_message("feat: one\n\nbody", 0.1)
+    timings.add_message("feat: two", 0.3)
+    timings.add_message("feat: three", 0.2)
+    timings.add_message("feat: four", 0.05)
+
+    summary = timings.summary()
+    assert summary["slowest_messages"] == [
+        {"seconds": 0.3, "header": "feat: two"},
+        {"seconds": 0.2, "header": "feat: three"},
+    ]
+    lint = summary["phases"][0]
+    assert lint["name"] == "lint"
+    assert lint["count"] == 4
+    assert lint["total"] == pytest.approx(0.65)
+    assert lint["max"] == 0.3
+
+
+def test__timings__summary_total_uses_start():
+    with patch("commitlint.timings.perf_counter", return_value=12.0):
+        timings = Timings(start=10.0)
+        assert timings.summary()["total"] == 2.0
+
+
+def test__timings__render_json():
+    timings = Timings()
+    timings.add("parse_args", 0.001)
+    timings.add_message("feat: add feature", 0.002)
+
+    summary = json.loads(timings.render("json"))
+    assert [phase["name"] for phase in summary["phases"]] == ["parse_args", "lint"]
+    assert summary["slowest_messages"][0]["header"] == "feat: add feature"
+
+
+def test__timings__render_table():
+    timings = Timings()
+    timings.add("validator.PatternValidator", 0.0015)
+    timings.add_message("feat: add feature", 0.002)
+
+    table = timings.render("table")
+    lines = table.splitlines()
+    assert lines[0] == (
+        "phase                         count    total ms     p50 ms     p95 ms     max ms"
+    )
+    assert lines[1].split() == [
+        "validator.PatternValidator",
+        "1",
+        "1.500",
+        "1.500",
+        "1.500",
+        "1.500",
+    ]
+    assert lines[3].startswith("total")
+    assert "slowest commit messages:" in lines
+    assert lines[-1].split() == ["2.000", "ms", "feat:", "add", "feature"]
+
+
+def test__timings__render_table_without_messages():
+    table = Timings().render("table")
+    assert "slowest commit messages:" not in table